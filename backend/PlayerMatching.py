@@ -1,8 +1,12 @@
 import pandas as pd
-from fuzzywuzzy import process, fuzz
 import requests
 import logging
 
+try:
+    from .name_resolver import NameResolver
+except ImportError:
+    from name_resolver import NameResolver
+
 # Function to fetch draft data
 def get_draft_data(draft_id):
     url = f"https://api.sleeper.app/v1/draft/{draft_id}/picks"
@@ -31,11 +35,6 @@ def normalize_name(name):
 def apply_name_mappings(name, mappings):
     return mappings.get(name, name)
 
-# Function to match player names using fuzzy matching
-def match_player_name(name, choices, threshold=85):
-    match, score = process.extractOne(name, choices, scorer=fuzz.token_sort_ratio)
-    return match if score >= threshold else None
-
 # Draft ID to test with
 draft_id = "1125469001368346624"
 
@@ -62,8 +61,9 @@ print(auction_values.columns)
 print("Columns in name_mappings:")
 print(name_mappings.columns)
 
-# Concatenate all positional rankings into one dataframe
-all_rankings = pd.concat([qb_rankings, rb_rankings, wr_rankings, te_rankings])
+# Concatenate all positional rankings into one dataframe, keeping each player's position for fuzzy matching
+all_rankings = pd.concat([rankings.assign(**{'Ranking Position': position}) for position, rankings in
+                          [('QB', qb_rankings), ('RB', rb_rankings), ('WR', wr_rankings), ('TE', te_rankings)]])
 
 # Normalize names in all datasets
 all_rankings['Normalized Name'] = all_rankings['PLAYER NAME'].apply(normalize_name)
@@ -78,14 +78,14 @@ all_rankings['Mapped Name'] = all_rankings['Normalized Name'].apply(lambda x: ap
 # Merge auction values with rankings using mapped names
 merged_data = pd.merge(all_rankings, auction_values, left_on='Mapped Name', right_on='Normalized Name', how='left')
 
-# Handle unmatched names with fuzzy matching
+# Handle unmatched names with fuzzy matching against the auction values of the same position
+resolver = NameResolver(auction_values[['Player', 'Position']].dropna().to_dict('records'))
 unmatched = merged_data[merged_data['Player'].isna()]
 for index, row in unmatched.iterrows():
-    normalized_name = row['Mapped Name']
-    match = match_player_name(normalized_name, auction_values['Normalized Name'].tolist())
+    match = resolver.resolve(row['Mapped Name'], row['Ranking Position'])
     if match:
         # Get the row from auction_values where the match is found
-        matching_row = auction_values[auction_values['Normalized Name'] == match]
+        matching_row = auction_values[auction_values['Player'] == match['Player']]
         # Update the `Player` and other relevant columns in `merged_data`
         merged_data.at[index, 'Player'] = matching_row['Player'].values[0]
         merged_data.at[index, 'Value'] = matching_row['Value'].values[0]
@@ -0,0 +1,138 @@
+"""Time the draft calculators on synthetic drafts and compare against an earlier run.
+
+    python backend/benchmark.py --output bench.json
+    python backend/benchmark.py --baseline bench.json
+
+Exits non-zero when a function's median time grows past --threshold times the baseline.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import backend.trial_backend as trial_backend
+from backend.synthetic_draft import DEFAULT_BUDGET, DEFAULT_TEAMS, generate_draft
+
+DEFAULT_SIZES = [100, 300, 1000]
+
+# name -> function of (draft_data, expected_values) running that calculator once
+BENCHMARKS = {
+    'map_players_to_ev_data': lambda draft_data, expected_values: trial_backend.map_players_to_ev_data(draft_data),
+    'calculate_inflation_rates': lambda draft_data, expected_values: trial_backend.calculate_inflation_rates(draft_data),
+    'calculate_doe_values': lambda draft_data, expected_values: trial_backend.calculate_doe_values(
+        draft_data, expected_values, {}),
+    'calculate_r2_by_position': lambda draft_data, expected_values: trial_backend.calculate_r2_by_position(draft_data),
+    'process_team_breakdown': lambda draft_data, expected_values: trial_backend.process_team_breakdown(draft_data),
+}
+
+
+def time_call(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=5, teams=DEFAULT_TEAMS, budget=DEFAULT_BUDGET, anomaly_rate=0.05,
+                   seed=0, names=None):
+    reference = trial_backend.reference_store.current
+    results = {}
+    for size in sizes:
+        draft_data = generate_draft(reference, size, teams=teams, budget=budget, anomaly_rate=anomaly_rate, seed=seed)
+        for name, benchmark in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            # One untimed call so lazily built lookup tables are not charged to the first sample
+            benchmark(draft_data, reference.expected_values)
+            results.setdefault(name, {})[str(size)] = time_call(
+                lambda: benchmark(draft_data, reference.expected_values), repeat)
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'season': reference.year,
+            'teams': teams,
+            'budget': budget,
+            'anomaly_rate': anomaly_rate,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Median time ratios against a baseline run, and the entries that regressed past `threshold`."""
+    rows = []
+    regressions = []
+    for name, sizes in current['results'].items():
+        for size, timing in sizes.items():
+            before = baseline.get('results', {}).get(name, {}).get(size)
+            if before is None or before['median'] == 0:
+                continue
+            ratio = timing['median'] / before['median']
+            rows.append((name, size, before['median'], timing['median'], ratio))
+            if ratio > threshold:
+                regressions.append((name, size, ratio))
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='pick counts to benchmark')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--teams', type=int, default=DEFAULT_TEAMS)
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET)
+    parser.add_argument('--anomaly-rate', type=float, default=0.05, help='share of respelled player names')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='benchmarks to run')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='results JSON from an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25, help='median ratio that counts as a regression')
+    args = parser.parse_args(argv)
+
+    # Per-player warnings would dominate the timings
+    logging.getLogger().setLevel(logging.ERROR)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.teams, args.budget, args.anomaly_rate, args.seed, args.only)
+    for name, sizes in results['results'].items():
+        for size, timing in sizes.items():
+            print(f"{name:32} {size:>6} picks  median {timing['median'] * 1000:9.2f} ms  min {timing['min'] * 1000:9.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.threshold)
+        print()
+        for name, size, before, after, ratio in rows:
+            print(f"{name:32} {size:>6} picks  {before * 1000:9.2f} -> {after * 1000:9.2f} ms  x{ratio:.2f}")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above x{args.threshold}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
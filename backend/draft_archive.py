@@ -0,0 +1,200 @@
+import logging
+import os
+import threading
+import uuid
+
+import numpy as np
+from numpy.lib.recfunctions import repack_fields
+
+try:
+    import fcntl
+except ImportError:
+    # Without flock (Windows) only one process may ingest into an archive
+    fcntl = None
+
+# One row per archived pick. Fixed-width fields keep every segment memory-mappable.
+PICK_DTYPE = np.dtype([
+    ('draft_id', 'U24'),
+    ('season', 'i2'),
+    ('pick_no', 'i4'),
+    ('draft_slot', 'i2'),
+    ('player_name', 'U48'),
+    ('player', 'U48'),
+    ('position', 'U4'),
+    ('amount', 'i4'),
+    ('value', 'f8'),
+    ('tier', 'U8'),
+])
+
+MANIFEST_FILENAME = 'manifest.tsv'
+
+
+def picks_to_records(draft_id, season, picks):
+    """Turn a resolved picks frame into archive rows. Unresolved picks keep a NaN value and empty tier."""
+    records = np.zeros(len(picks), dtype=PICK_DTYPE)
+    records['draft_id'] = str(draft_id)
+    records['season'] = int(season)
+    records['pick_no'] = picks['pick_no'].fillna(0).astype(int).to_numpy()
+    records['draft_slot'] = picks['draft_slot'].fillna(0).astype(int).to_numpy()
+    records['player_name'] = picks['player_name'].fillna('').astype(str).to_numpy()
+    records['player'] = picks['player'].fillna('').astype(str).to_numpy()
+    records['position'] = picks['position'].fillna('').astype(str).to_numpy()
+    records['amount'] = picks['amount'].to_numpy()
+    records['value'] = picks['value'].to_numpy()
+    records['tier'] = [str(tier) if tier is not None else '' for tier in picks['tier']]
+    return records
+
+
+class DraftArchive:
+    """Append-only store of completed drafts, one .npy segment per ingest.
+
+    A manifest lists which draft went into which segment, so ingesting the same
+    draft twice is a no-op and a segment written before a crash but never added
+    to the manifest is simply ignored. Segments are read back memory-mapped, one
+    at a time, so scanning the archive never needs it all in RAM.
+
+    Several worker processes may share one archive: an ingest holds an exclusive
+    lock on the manifest, rereads what other processes appended to it, and
+    names its segment uniquely.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+        # draft_id -> (season, segment, pick count)
+        self._drafts = {}
+        self._segments = []
+        # Bytes of the manifest already read
+        self._manifest_offset = 0
+        with self._lock:
+            self._refresh()
+
+    def _manifest_path(self):
+        return os.path.join(self.root, MANIFEST_FILENAME)
+
+    def _refresh(self):
+        """Read the manifest lines appended since the last call, by any process. Caller holds the lock."""
+        try:
+            size = os.path.getsize(self._manifest_path())
+        except FileNotFoundError:
+            return
+        if size < self._manifest_offset:
+            # The archive was replaced, start over
+            self._drafts.clear()
+            self._segments.clear()
+            self._manifest_offset = 0
+        if size == self._manifest_offset:
+            return
+
+        with open(self._manifest_path(), 'rb') as f:
+            f.seek(self._manifest_offset)
+            data = f.read()
+        # A line still being written, or torn by an interrupted append, is left for later
+        end = data.rfind(b'\n') + 1
+        self._manifest_offset += end
+        for line in data[:end].decode('utf-8').splitlines():
+            fields = line.split('\t')
+            if len(fields) != 4:
+                logging.warning("Skipping malformed archive manifest line: %r", line)
+                continue
+            draft_id, season, segment, pick_count = fields
+            self._drafts[draft_id] = (int(season), segment, int(pick_count))
+            if segment not in self._segments:
+                self._segments.append(segment)
+
+    def __contains__(self, draft_id):
+        with self._lock:
+            self._refresh()
+            return str(draft_id) in self._drafts
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self._drafts)
+
+    def ingest(self, drafts):
+        """Archive `(draft_id, season, picks frame)` tuples and return the draft IDs added.
+
+        Drafts already in the archive, and drafts without picks, are skipped.
+        """
+        drafts = [(str(draft_id), season, picks) for draft_id, season, picks in drafts if len(picks)]
+        if not drafts:
+            return []
+
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self._manifest_path(), 'ab+') as manifest:
+                if fcntl is not None:
+                    # Held until the manifest is closed, other workers' ingests wait for it
+                    fcntl.flock(manifest.fileno(), fcntl.LOCK_EX)
+                self._refresh()
+
+                new_drafts = []
+                seen = set(self._drafts)
+                for draft_id, season, picks in drafts:
+                    if draft_id in seen:
+                        continue
+                    seen.add(draft_id)
+                    new_drafts.append((draft_id, season, picks_to_records(draft_id, season, picks)))
+                if not new_drafts:
+                    return []
+
+                segment = f"segment-{len(self._segments):06d}-{uuid.uuid4().hex[:12]}.npy"
+                path = os.path.join(self.root, segment)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, np.concatenate([records for _, _, records in new_drafts]))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+
+                # The segment only becomes part of the archive once the manifest names it
+                lines = ''.join(f"{draft_id}\t{int(season)}\t{segment}\t{len(records)}\n"
+                                for draft_id, season, records in new_drafts)
+                manifest.seek(0, os.SEEK_END)
+                if manifest.tell():
+                    manifest.seek(-1, os.SEEK_END)
+                    if manifest.read(1) != b'\n':
+                        # End a line torn by an interrupted append, so it is not joined to the new ones
+                        lines = '\n' + lines
+                manifest.write(lines.encode('utf-8'))
+                manifest.flush()
+                os.fsync(manifest.fileno())
+                self._refresh()
+
+            return [draft_id for draft_id, _, _ in new_drafts]
+
+    def iter_segments(self, season=None):
+        """Yield each segment's rows as a read-only memory-mapped array, optionally for one season."""
+        with self._lock:
+            self._refresh()
+            segments = list(self._segments)
+            seasons = {}
+            for draft_season, segment, _ in self._drafts.values():
+                seasons.setdefault(segment, set()).add(draft_season)
+
+        for segment in segments:
+            if season is not None and int(season) not in seasons.get(segment, ()):
+                continue
+            records = np.load(os.path.join(self.root, segment), mmap_mode='r')
+            if season is not None:
+                records = records[records['season'] == int(season)]
+            yield records
+
+    def load(self, season=None, fields=None):
+        """Concatenate archived rows, keeping only `fields` to bound memory on large archives."""
+        chunks = [repack_fields(records[fields]) if fields else np.array(records)
+                  for records in self.iter_segments(season)]
+        if not chunks:
+            dtype = PICK_DTYPE if not fields else np.dtype([(field, PICK_DTYPE[field]) for field in fields])
+            return np.zeros(0, dtype=dtype)
+        return np.concatenate(chunks)
+
+    def stats(self):
+        with self._lock:
+            self._refresh()
+            return {
+                'drafts': len(self._drafts),
+                'segments': len(self._segments),
+                'picks': sum(pick_count for _, _, pick_count in self._drafts.values()),
+            }
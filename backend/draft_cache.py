@@ -0,0 +1,88 @@
+import threading
+import time
+
+
+class _Flight:
+    """A fetch in progress that other requests for the same draft wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class DraftPicksCache:
+    """Per-draft TTL cache for upstream pick lists with single-flight fetches.
+
+    Concurrent misses for the same draft share one call to `fetch`; everyone else
+    waits for its result. Empty results are not cached so a failed or not yet
+    started draft is retried on the next request.
+    """
+
+    def __init__(self, fetch, ttl=3.0, clock=time.monotonic):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get(self, draft_id):
+        with self._lock:
+            entry = self._entries.get(draft_id)
+            if entry is not None and self.clock() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+
+            flight = self._in_flight.get(draft_id)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._in_flight[draft_id] = flight
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self.fetch(draft_id)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if flight.error is None and flight.result:
+                    now = self.clock()
+                    # Drop drafts nobody has asked about within the TTL so the cache stays small
+                    self._entries = {key: entry for key, entry in self._entries.items() if now - entry[0] < self.ttl}
+                    self._entries[draft_id] = (now, flight.result)
+                del self._in_flight[draft_id]
+            flight.done.set()
+
+        return flight.result
+
+    def invalidate(self, draft_id=None):
+        with self._lock:
+            if draft_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(draft_id, None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'entries': len(self._entries),
+                'hit_rate': (self.hits + self.coalesced) / lookups if lookups else 0,
+            }
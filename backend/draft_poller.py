@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _WatchedDraft:
+    def __init__(self, lock, now, interval):
+        self.picks = None
+        self.version = 0
+        self.subscribers = 0
+        self.last_watched = now
+        self.last_change = now
+        # The request that starts watching a draft fetches it itself
+        self.next_poll = now + interval
+        self.interval = interval
+        self.updated = threading.Condition(lock)
+
+
+class Subscription:
+    """A stream's interest in one draft; `wait` returns early when new picks are published."""
+
+    def __init__(self, poller, draft_id, draft):
+        self.poller = poller
+        self.draft_id = draft_id
+        self.draft = draft
+        self.version = draft.version
+
+    def wait(self, timeout):
+        with self.draft.updated:
+            self.draft.updated.wait_for(lambda: self.draft.version != self.version, timeout)
+            changed = self.draft.version != self.version
+            self.version = self.draft.version
+            return changed
+
+    def close(self):
+        self.poller.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DraftPoller:
+    """Background poller that fetches each watched draft at most once per interval.
+
+    Request handlers call `watch` and read `latest`, streams `subscribe`, so the
+    upstream call rate depends on how many drafts are open rather than how many
+    people are watching them. Drafts whose picks stop changing are polled less
+    often, and drafts nobody has asked about for `watch_timeout` seconds are dropped.
+    """
+
+    def __init__(self, fetch, interval=2.0, max_interval=30.0, idle_after=120.0, finished_after=1800.0,
+                 finished_interval=300.0, watch_timeout=60.0, max_workers=8, autostart=True, clock=time.monotonic):
+        self.fetch = fetch
+        self.interval = interval
+        self.max_interval = max_interval
+        self.idle_after = idle_after
+        self.finished_after = finished_after
+        self.finished_interval = finished_interval
+        self.watch_timeout = watch_timeout
+        self.max_workers = max_workers
+        self.autostart = autostart
+        self.clock = clock
+        self.upstream_calls = 0
+        self._drafts = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def watch(self, draft_id):
+        """Mark a draft as being viewed so the poller keeps it fresh."""
+        self._touch(draft_id)
+        if self.autostart:
+            self.start()
+
+    def latest(self, draft_id):
+        with self._lock:
+            draft = self._drafts.get(draft_id)
+            return draft.picks if draft is not None else None
+
+    def subscribe(self, draft_id):
+        draft = self._touch(draft_id, subscribe=True)
+        if self.autostart:
+            self.start()
+        return Subscription(self, draft_id, draft)
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscription.draft.subscribers -= 1
+            subscription.draft.last_watched = self.clock()
+
+    def _touch(self, draft_id, subscribe=False):
+        with self._lock:
+            now = self.clock()
+            draft = self._drafts.get(draft_id)
+            if draft is None:
+                draft = self._drafts[draft_id] = _WatchedDraft(self._lock, now, self.interval)
+                self._wake.set()
+            draft.last_watched = now
+            if subscribe:
+                draft.subscribers += 1
+            return draft
+
+    def publish(self, draft_id, picks):
+        """Store a freshly fetched pick list and wake the draft's subscribers if it changed."""
+        with self._lock:
+            draft = self._drafts.get(draft_id)
+            if draft is None or not picks:
+                return False
+
+            now = self.clock()
+            changed = draft.picks is None or (len(picks), picks[-1].get('pick_no')) != \
+                (len(draft.picks), draft.picks[-1].get('pick_no'))
+            if changed:
+                draft.picks = picks
+                draft.version += 1
+                draft.last_change = now
+                # Picks fetched by a request handler count as this interval's poll
+                draft.next_poll = max(draft.next_poll, now + draft.interval)
+                draft.updated.notify_all()
+            return changed
+
+    def poll_due(self):
+        """Fetch every draft that is due, then reschedule it. Returns the number fetched."""
+        with self._lock:
+            now = self.clock()
+            for draft_id in [draft_id for draft_id, draft in self._drafts.items()
+                             if draft.subscribers == 0 and now - draft.last_watched > self.watch_timeout]:
+                del self._drafts[draft_id]
+            due = [draft_id for draft_id, draft in self._drafts.items() if draft.next_poll <= now]
+
+        if not due:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+            results = list(executor.map(self._fetch, due))
+
+        for draft_id, picks in zip(due, results):
+            changed = self.publish(draft_id, picks)
+            self._reschedule(draft_id, changed)
+        return len(due)
+
+    def _fetch(self, draft_id):
+        with self._lock:
+            self.upstream_calls += 1
+        try:
+            return self.fetch(draft_id)
+        except Exception as e:
+            logging.error("Background poll failed for draft ID %s: %s", draft_id, e)
+            return None
+
+    def _reschedule(self, draft_id, changed):
+        with self._lock:
+            draft = self._drafts.get(draft_id)
+            if draft is None:
+                return
+            now = self.clock()
+            idle = now - draft.last_change
+            if changed or idle < self.idle_after:
+                draft.interval = self.interval
+            elif idle >= self.finished_after:
+                # Nothing has happened for a long time, the draft is most likely over
+                draft.interval = self.finished_interval
+            else:
+                draft.interval = min(draft.interval * 2, self.max_interval)
+            draft.next_poll = now + draft.interval
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name='draft-poller', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.clear()
+            try:
+                self.poll_due()
+            except Exception as e:
+                logging.error("Draft poller pass failed: %s", e, exc_info=True)
+
+            with self._lock:
+                next_poll = min((draft.next_poll for draft in self._drafts.values()), default=None)
+            timeout = self.interval if next_poll is None else max(0, next_poll - self.clock())
+            self._wake.wait(timeout)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'active_drafts': len(self._drafts),
+                'subscribers': sum(draft.subscribers for draft in self._drafts.values()),
+                'upstream_calls': self.upstream_calls,
+            }
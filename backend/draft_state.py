@@ -0,0 +1,278 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from .inflation_engine import (EXCLUDED_POSITIONS, PICK_COLUMNS, POSITIONS, inflation_ratio,
+                                   picks_frame_from_columns, tier_sort_key)
+    from .player_index import pick_player_name
+    from .regression import PriceCurves
+except ImportError:
+    from inflation_engine import (EXCLUDED_POSITIONS, PICK_COLUMNS, POSITIONS, inflation_ratio,
+                                  picks_frame_from_columns, tier_sort_key)
+    from player_index import pick_player_name
+    from regression import PriceCurves
+
+DEFAULT_BUDGET = 200
+
+
+class DraftState:
+    """Running totals for one draft that only ever process picks they have not seen.
+
+    During a live auction the pick list only grows, so each poll applies the picks
+    after `last_pick_no` and the aggregates are read straight from the running sums.
+    """
+
+    def __init__(self, draft_id, reference, budget=DEFAULT_BUDGET):
+        self.draft_id = draft_id
+        self.reference = reference
+        self.budget = budget
+        self.last_pick_no = 0
+        self.pick_count = 0
+        self.columns = {column: [] for column in PICK_COLUMNS}
+        self.spent = 0
+        self.value = 0.0
+        # position -> [spent, value]
+        self.position_totals = {}
+        # (position, tier) -> [spent, value, picks, doe]
+        self.tier_totals = {}
+        self.doe_positions = []
+        # draft_slot -> dollars spent
+        self.team_spend = {}
+        # Running price against pick number regressions per position and tier
+        self.price_curves = PriceCurves()
+        # One entry per applied pick with the aggregates that pick changed
+        self.pick_events = []
+        self.lock = threading.Lock()
+
+    def apply(self, draft_data):
+        """Apply the picks made since the last call and return them."""
+        # Sleeper lists picks in order, so the unseen ones are normally just the tail
+        if self.pick_count == 0 or (len(draft_data) >= self.pick_count and
+                                    draft_data[self.pick_count - 1].get('pick_no') == self.last_pick_no):
+            tail = draft_data[self.pick_count:]
+            if all((pick.get('pick_no') or 0) > self.last_pick_no for pick in tail):
+                for pick in tail:
+                    self._apply_pick(pick)
+                return tail
+
+        new_picks = sorted((pick for pick in draft_data if (pick.get('pick_no') or 0) > self.last_pick_no),
+                           key=lambda pick: pick.get('pick_no') or 0)
+        for pick in new_picks:
+            self._apply_pick(pick)
+        return new_picks
+
+    def _apply_pick(self, pick):
+        metadata = pick['metadata']
+        position = metadata.get('position')
+        amount = int(metadata.get('amount') or 0)
+        record = self.reference.player_index.lookup_pick(pick)
+        value = record['Value'] if record is not None else 0
+        tier = record['Tier'] if record is not None else None
+
+        self.columns['pick_no'].append(pick.get('pick_no'))
+        self.columns['draft_slot'].append(pick.get('draft_slot'))
+        self.columns['player_name'].append(pick_player_name(pick))
+        self.columns['position'].append(position)
+        self.columns['amount'].append(amount)
+        self.columns['player'].append(record['Player'] if record is not None else None)
+        self.columns['value'].append(record['Value'] if record is not None else np.nan)
+        self.columns['tier'].append(tier)
+
+        if position not in EXCLUDED_POSITIONS:
+            self.spent += amount
+        self.value += value
+
+        position_totals = self.position_totals.setdefault(position, [0, 0.0])
+        position_totals[0] += amount
+        position_totals[1] += value
+
+        if position not in self.doe_positions:
+            self.doe_positions.append(position)
+        if tier is not None:
+            tier_totals = self.tier_totals.setdefault((position, tier), [0, 0.0, 0, 0.0])
+            tier_totals[0] += amount
+            tier_totals[1] += value
+            tier_totals[2] += 1
+            tier_totals[3] += amount - value if value > 0 else amount
+
+        slot = pick.get('draft_slot')
+        self.team_spend[slot] = self.team_spend.get(slot, 0) + amount
+        if pick.get('pick_no') is not None:
+            self.price_curves.add(position, tier, pick['pick_no'], amount)
+
+        self.last_pick_no = max(self.last_pick_no, pick.get('pick_no') or 0)
+        self.pick_count += 1
+        self.pick_events.append(self._pick_event(pick, position, amount, record, tier, slot))
+
+    def _pick_event(self, pick, position, amount, record, tier, slot):
+        # Only the overall figure, the pick's position and its tier move when a pick is made
+        inflation = {"overall": inflation_ratio(self.spent, self.value)}
+        doe_values = {}
+        if position in POSITIONS:
+            spent, value = self.position_totals[position]
+            inflation["positional"] = {position: inflation_ratio(spent, value)}
+        if tier is not None:
+            tier_totals = self.tier_totals[(position, tier)]
+            if position in POSITIONS:
+                inflation["positional_tiered"] = {position: {tier: inflation_ratio(tier_totals[0], tier_totals[1])}}
+            doe_values = {position: {tier: tier_totals[3] / tier_totals[2]}}
+
+        spent = self.team_spend[slot]
+        return {
+            "pick_no": pick.get('pick_no'),
+            "pick": {
+                "player_name": pick_player_name(pick),
+                "position": position,
+                "amount": amount,
+                "draft_slot": slot,
+                "expected_value": record['Value'] if record is not None else 0,
+                "tier": tier,
+            },
+            "inflation": inflation,
+            "doe_values": doe_values,
+            "team_budget": {slot: {'totalSpend': spent, 'remainingBudget': self.budget - spent}},
+        }
+
+    def events_since(self, pick_no):
+        """Pick events after `pick_no`, oldest first."""
+        start = len(self.pick_events)
+        while start > 0 and (self.pick_events[start - 1]['pick_no'] or 0) > pick_no:
+            start -= 1
+        return self.pick_events[start:]
+
+    def changes_since(self, pick_no):
+        """The picks after `pick_no` and the current value of every aggregate they moved.
+
+        Returns None when the draft has gone back below `pick_no`, e.g. after a reset.
+        """
+        if self.last_pick_no < pick_no:
+            return None
+
+        events = self.events_since(pick_no)
+        tiers = {}
+        slots = []
+        for event in events:
+            pick = event['pick']
+            position_tiers = tiers.setdefault(pick['position'], [])
+            if pick['tier'] is not None and pick['tier'] not in position_tiers:
+                position_tiers.append(pick['tier'])
+            if pick['draft_slot'] not in slots:
+                slots.append(pick['draft_slot'])
+
+        inflation = {"positional": {}, "positional_tiered": {}}
+        if events:
+            inflation["overall"] = inflation_ratio(self.spent, self.value)
+        picks_per_tier = {}
+        doe_values = {}
+        for position, position_tiers in tiers.items():
+            if position in POSITIONS:
+                inflation["positional"][position] = inflation_ratio(*self.position_totals[position])
+            for tier in position_tiers:
+                spent, value, picks, doe = self.tier_totals[(position, tier)]
+                if position in POSITIONS:
+                    inflation["positional_tiered"].setdefault(position, {})[tier] = inflation_ratio(spent, value)
+                    picks_per_tier.setdefault(position, {})[tier] = picks
+                doe_values.setdefault(position, {})[tier] = doe / picks
+
+        total_picks = {position: sum(totals[2] for (pos, _), totals in self.tier_totals.items() if pos == position)
+                       for position in picks_per_tier}
+        return {
+            "cursor": self.last_pick_no,
+            "picks": [dict(event['pick'], pick_no=event['pick_no']) for event in events],
+            "inflation": inflation,
+            "picks_per_tier": picks_per_tier,
+            "total_picks": total_picks,
+            "doe_values": doe_values,
+            "team_budgets": {slot: {'totalSpend': self.team_spend[slot],
+                                    'remainingBudget': self.budget - self.team_spend[slot]} for slot in slots},
+        }
+
+    def inflation(self):
+        positional_inflation = {}
+        positional_tier_inflation = {}
+        for position in POSITIONS:
+            spent, value = self.position_totals.get(position, (0, 0.0))
+            positional_inflation[position] = inflation_ratio(spent, value)
+
+            picked_tiers = [tier for pos, tier in self.tier_totals if pos == position]
+            tiers = sorted(set(self.reference.tiers_by_position.get(position, ())) | set(picked_tiers), key=tier_sort_key)
+            positional_tier_inflation[position] = {
+                tier: inflation_ratio(*self.tier_totals[(position, tier)][:2]) if (position, tier) in self.tier_totals else 0
+                for tier in tiers
+            }
+
+        return {
+            "overall": inflation_ratio(self.spent, self.value),
+            "positional": positional_inflation,
+            "positional_tiered": positional_tier_inflation,
+        }
+
+    def picks_per_tier(self):
+        picks_per_tier = {position: {} for position in POSITIONS}
+        for (position, tier), totals in self.tier_totals.items():
+            if position in picks_per_tier:
+                picks_per_tier[position][tier] = totals[2]
+        return picks_per_tier
+
+    def doe_values(self):
+        doe_values = {position: {} for position in self.doe_positions}
+        for (position, tier), totals in self.tier_totals.items():
+            doe_values[position][tier] = totals[3] / totals[2]
+        return doe_values
+
+    def team_budgets(self):
+        return {slot: {'totalSpend': spent, 'remainingBudget': self.budget - spent}
+                for slot, spent in self.team_spend.items()}
+
+    def picks_frame(self):
+        return picks_frame_from_columns(self.columns)
+
+
+class DraftStateRegistry:
+    """Per-draft states for the drafts being watched, least recently used evicted first.
+
+    States are kept per (draft, season), so one draft viewed against two seasons'
+    reference data does not rebuild on every switch.
+    """
+
+    def __init__(self, max_drafts=256, budget=DEFAULT_BUDGET):
+        self.max_drafts = max_drafts
+        self.budget = budget
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, draft_id, draft_data, reference):
+        """Bring a draft's state up to date with `draft_data` and return it."""
+        key = (draft_id, reference.year)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+
+        if state is None or not self._is_compatible(state, draft_data, reference):
+            state = DraftState(draft_id, reference, self.budget)
+            with self._lock:
+                self._states[key] = state
+                self._states.move_to_end(key)
+                while len(self._states) > self.max_drafts:
+                    self._states.popitem(last=False)
+
+        with state.lock:
+            state.apply(draft_data)
+        return state
+
+    def rebuild(self, draft_id, draft_data, reference):
+        """Discard a draft's running totals and recompute them from every pick."""
+        with self._lock:
+            self._states.pop((draft_id, reference.year), None)
+        return self.update(draft_id, draft_data, reference)
+
+    def _is_compatible(self, state, draft_data, reference):
+        # New reference data changes every resolved value, and a shrinking pick
+        # list means the draft was reset; both need a full rebuild
+        return state.reference is reference and len(draft_data) >= state.pick_count
+
+    def __len__(self):
+        return len(self._states)
@@ -0,0 +1,33 @@
+"""Gunicorn settings for the production server, see serve.py for what the hooks do.
+
+    gunicorn -c backend/gunicorn.conf.py backend.trial_backend:app
+
+Command line options (e.g. --workers 4 --bind 0.0.0.0:8000) override these.
+"""
+import os
+import sys
+
+# Add the parent directory to sys.path so the backend package can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import serve
+
+bind = '0.0.0.0:5050'
+workers = os.cpu_count() or 2
+# Threads per worker; open draft streams take at most MAX_OPEN_STREAMS of them
+worker_class = 'gthread'
+threads = 16
+# Import the app and load the reference data once in the master, shared copy-on-write by the workers
+preload_app = True
+# Recycle a worker after this many requests, plus up to the jitter so workers do not restart together
+max_requests = 5000
+max_requests_jitter = 500
+graceful_timeout = 30
+
+# Set here because the app is imported (preload_app) before any server hook runs
+serve.use_run_dir()
+
+when_ready = serve.when_ready
+on_reload = serve.on_reload
+worker_exit = serve.worker_exit
+on_exit = serve.on_exit
@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from .player_index import pick_player_name
+except ImportError:
+    from player_index import pick_player_name
+
+POSITIONS = ["QB", "RB", "WR", "TE"]
+EXCLUDED_POSITIONS = ["K", "DEF"]
+
+PICK_COLUMNS = ['pick_no', 'draft_slot', 'player_name', 'position', 'amount', 'player', 'value', 'tier']
+
+
+def build_picks_frame(draft_data, player_index):
+    """Resolve every pick against the player index once and return one row per pick."""
+    columns = {column: [] for column in PICK_COLUMNS}
+    for pick in draft_data:
+        metadata = pick['metadata']
+        record = player_index.lookup_pick(pick)
+        columns['pick_no'].append(pick.get('pick_no'))
+        columns['draft_slot'].append(pick.get('draft_slot'))
+        columns['player_name'].append(pick_player_name(pick))
+        columns['position'].append(metadata.get('position'))
+        columns['amount'].append(int(metadata.get('amount') or 0))
+        columns['player'].append(record['Player'] if record is not None else None)
+        columns['value'].append(record['Value'] if record is not None else np.nan)
+        columns['tier'].append(record['Tier'] if record is not None else None)
+
+    return picks_frame_from_columns(columns)
+
+
+def picks_frame_from_columns(columns):
+    picks = pd.DataFrame({column: values for column, values in columns.items() if column != 'tier'},
+                         columns=PICK_COLUMNS[:-1])
+    picks['amount'] = picks['amount'].astype('int64')
+    picks['value'] = picks['value'].astype('float64')
+    # Keep tiers as python objects so grouping never turns tier 1 into 1.0
+    picks['tier'] = pd.Series(columns['tier'], index=picks.index, dtype=object)
+    return picks
+
+
+def inflation_ratio(spent, value):
+    return (spent - value) / value if value != 0 else 0
+
+
+def aggregate_spend_and_value(picks):
+    """Grouped spend and value totals overall, by position and by position and tier."""
+    counted = picks[~picks['position'].isin(EXCLUDED_POSITIONS)]
+    overall = {
+        'spent': int(counted['amount'].sum()),
+        'value': float(picks['value'].sum()),
+    }
+
+    positional = picks.groupby('position').agg(spent=('amount', 'sum'), value=('value', 'sum'))
+
+    tiered = (picks[picks['tier'].notna()]
+              .groupby(['position', 'tier'])
+              .agg(spent=('amount', 'sum'), value=('value', 'sum')))
+
+    return overall, positional, tiered
+
+
+def calculate_inflation(picks, tiers_by_position):
+    """Overall, positional and positional-tiered inflation for a resolved picks frame.
+
+    Every tier listed in `tiers_by_position` is reported, with 0 for tiers nobody has
+    been drafted from yet.
+    """
+    overall, positional, tiered = aggregate_spend_and_value(picks)
+
+    positional_inflation = {}
+    positional_tier_inflation = {}
+
+    for position in POSITIONS:
+        if position in positional.index:
+            row = positional.loc[position]
+            positional_inflation[position] = inflation_ratio(int(row['spent']), float(row['value']))
+        else:
+            positional_inflation[position] = 0
+
+        tier_totals = {}
+        if position in tiered.index.get_level_values('position'):
+            pos_tiers = tiered.xs(position, level='position')
+            tier_totals = dict(zip(pos_tiers.index.tolist(),
+                                   zip(pos_tiers['spent'].tolist(), pos_tiers['value'].tolist())))
+
+        tiers = sorted(set(tiers_by_position.get(position, ())) | set(tier_totals), key=tier_sort_key)
+        positional_tier_inflation[position] = {
+            tier: inflation_ratio(*tier_totals[tier]) if tier in tier_totals else 0
+            for tier in tiers
+        }
+
+    return {
+        "overall": inflation_ratio(overall['spent'], overall['value']),
+        "positional": positional_inflation,
+        "positional_tiered": positional_tier_inflation,
+    }
+
+
+def tier_sort_key(tier):
+    # Numeric tiers first in order, anything else after them
+    return (0, tier, '') if isinstance(tier, (int, float)) else (1, 0, str(tier))
+
+
+def count_picks_per_tier(picks):
+    """Number of resolved picks in each tier, by position."""
+    picks_per_tier = {position: {} for position in POSITIONS}
+    tiered = picks[picks['position'].isin(POSITIONS) & picks['tier'].notna()]
+    for (position, tier), count in tiered.groupby(['position', 'tier']).size().items():
+        picks_per_tier[position][tier] = int(count)
+    return picks_per_tier
+
+
+def calculate_doe(picks):
+    """Average dollars over expected per position and tier.
+
+    A pick without an expected value counts its whole price as DOE, and every
+    drafted position gets an entry even when none of its picks has a tier.
+    """
+    value = picks['value'].fillna(0)
+    doe = picks['amount'] - value.where(value > 0, 0)
+
+    doe_values = {position: {} for position in picks['position'].dropna().unique().tolist()}
+    tiered = picks.assign(doe=doe)[picks['tier'].notna()]
+    for (position, tier), average in tiered.groupby(['position', 'tier'])['doe'].mean().items():
+        doe_values[position][tier] = float(average)
+    return doe_values
+
+
+def build_scatter_series(picks, position_colors, default_color="gray", first_pick_no=1):
+    return {
+        "pick_no": list(range(first_pick_no, first_pick_no + len(picks))),
+        "metadata_amount": picks['amount'].tolist(),
+        "colors": [position_colors.get(position, default_color) for position in picks['position'].tolist()],
+        "player_names": picks['player_name'].tolist(),
+        "expected_values": picks['value'].fillna(0).tolist(),
+    }
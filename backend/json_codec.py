@@ -0,0 +1,56 @@
+import json
+import math
+from json.encoder import _make_iterencode, encode_basestring, encode_basestring_ascii
+
+import numpy as np
+import pandas as pd
+
+
+def _null_floatstr(value, _repr=float.__repr__):
+    # NaN and infinity have no JSON spelling
+    return _repr(value) if math.isfinite(value) else 'null'
+
+
+class JSONEncoder(json.JSONEncoder):
+    """Writes NumPy and pandas values as native JSON, and NaN or infinity as null.
+
+    The payload is written in one pass by the C encoder. Only a payload that
+    turns out to hold a NaN is encoded again, by the pure Python encoder, which
+    can substitute null for it.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['allow_nan'] = False
+        super().__init__(**kwargs)
+
+    def default(self, obj):
+        if obj is pd.NaT or obj is pd.NA:
+            return None
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, (pd.Series, pd.Index)):
+            return obj.tolist()
+        if isinstance(obj, pd.Timestamp):
+            return obj.isoformat()
+        return super().default(obj)
+
+    def encode(self, o):
+        try:
+            return super().encode(o)
+        except ValueError:
+            # Out of range floats, anything else is raised again below
+            pass
+
+        _iterencode = _make_iterencode(
+            {} if self.check_circular else None, self.default,
+            encode_basestring_ascii if self.ensure_ascii else encode_basestring,
+            self.indent, _null_floatstr, self.key_separator, self.item_separator,
+            self.sort_keys, self.skipkeys, False)
+        return ''.join(_iterencode(o, 0))
+
+
+def dumps(data):
+    """Compact JSON text for a response body."""
+    return json.dumps(data, cls=JSONEncoder, separators=(',', ':'))
@@ -0,0 +1,191 @@
+"""Drive the backend with many dashboards polling live drafts and report latency per endpoint.
+
+    python backend/load_test.py --app http://127.0.0.1:5050 --dashboards 50 --drafts 10 --duration 60
+
+Each dashboard follows the frontend of a live draft: when it opens and then
+every --interval seconds (10 in the frontend) the ticker and the inflation panel
+each fetch /picks and, in parallel, /player_lookup and /inflation for the picks
+they got back, and the scatter plot and team breakdown refetch /scatter_data and
+/team_breakdown in full. The ticker only asks for the picks after its
+since=pick_no cursor. The expected values are fetched from /reference when
+/inflation reports a new version.
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+# Frontend components that poll on every tick
+POLLING_COMPONENTS = ['ticker', 'inflation_panel', 'scatter_plot', 'team_breakdown']
+
+
+class LoadRecorder:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.samples = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, seconds, ok):
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append(seconds)
+            if not ok:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def report(self, elapsed):
+        """p50/p95/p99 latency in milliseconds, request count, errors and throughput per endpoint."""
+        with self._lock:
+            samples = {endpoint: list(timings) for endpoint, timings in self.samples.items()}
+            errors = dict(self.errors)
+
+        report = {}
+        for endpoint, timings in sorted(samples.items()):
+            p50, p95, p99 = np.percentile(np.array(timings) * 1000, [50, 95, 99]).tolist()
+            report[endpoint] = {
+                'requests': len(timings),
+                'errors': errors.get(endpoint, 0),
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'p99_ms': p99,
+                'throughput_rps': len(timings) / elapsed if elapsed > 0 else 0.0,
+            }
+        return report
+
+
+class Dashboard:
+    """One open browser tab watching one draft."""
+
+    def __init__(self, app_url, draft_id, recorder, session, executor):
+        self.app_url = app_url.rstrip('/')
+        self.draft_id = draft_id
+        self.recorder = recorder
+        self.session = session
+        self.executor = executor
+        self.reference_version = None
+        self.cursor = 0
+
+    def call(self, endpoint, method, path, **kwargs):
+        start = self.recorder.clock()
+        try:
+            response = self.session.request(method, f"{self.app_url}{path}", timeout=30, **kwargs)
+            ok = response.status_code < 400
+            body = response.json() if ok and response.headers.get('Content-Type', '').startswith('application/json') else None
+        except requests.RequestException:
+            ok, body = False, None
+        self.recorder.record(endpoint, self.recorder.clock() - start, ok)
+        return body
+
+    def poll_component(self, component):
+        if component == 'scatter_plot':
+            self.call('/scatter_data', 'GET', '/scatter_data', params={'draft_id': self.draft_id, 'is_live': 'true'})
+            return
+        if component == 'team_breakdown':
+            self.call('/team_breakdown', 'GET', '/team_breakdown', params={'draft_id': self.draft_id, 'is_live': 'true'})
+            return
+
+        if component == 'ticker':
+            params = {'draft_id': self.draft_id, 'since': self.cursor}
+            delta = self.call('/picks', 'GET', '/picks', params=params) or {}
+            picks = delta.get('picks', [])
+            self.cursor = delta.get('cursor', self.cursor)
+            inflation_request = {'draft_id': self.draft_id, 'since': self.cursor}
+        else:
+            picks = self.call('/picks', 'GET', '/picks', params={'draft_id': self.draft_id})
+            inflation_request = {'draft_id': self.draft_id}
+
+        players = [{
+            'first_name': pick['metadata']['first_name'],
+            'last_name': pick['metadata']['last_name'],
+            'player_id': pick.get('player_id'),
+            'position': pick['metadata']['position'],
+        } for pick in picks or []]
+
+        lookup = None
+        if players:
+            lookup = self.executor.submit(self.call, '/player_lookup', 'POST', '/player_lookup', json={'players': players})
+        inflation = self.executor.submit(self.call, '/inflation', 'POST', '/inflation', json=inflation_request)
+        if lookup is not None:
+            lookup.result()
+        version = (inflation.result() or {}).get('reference_version')
+        if version is not None and version != self.reference_version:
+            self.call('/reference', 'GET', '/reference')
+            self.reference_version = version
+
+    def tick(self):
+        for component in POLLING_COMPONENTS:
+            self.poll_component(component)
+
+
+def run_load_test(app_url, dashboards=10, drafts=5, duration=60.0, interval=10.0, draft_prefix='loadtest', seed=0):
+    recorder = LoadRecorder()
+    rng = random.Random(seed)
+    draft_ids = [f"{draft_prefix}-{i}" for i in range(drafts)]
+    stop = threading.Event()
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=dashboards, pool_maxsize=dashboards * 2)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    def run_dashboard(dashboard):
+        # Tabs are opened at different moments, so their ticks do not line up
+        if stop.wait(rng.uniform(0, min(interval, duration))):
+            return
+        # The first tick is every component's fetch on mount
+        while not stop.is_set():
+            started = time.monotonic()
+            dashboard.tick()
+            stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    with ThreadPoolExecutor(max_workers=dashboards * 2) as executor:
+        tabs = [Dashboard(app_url, draft_ids[i % drafts], recorder, session, executor) for i in range(dashboards)]
+        threads = [threading.Thread(target=run_dashboard, args=(tab,), daemon=True) for tab in tabs]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        stop.wait(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+    return {
+        'config': {'app': app_url, 'dashboards': dashboards, 'drafts': drafts, 'duration': duration,
+                   'interval': interval},
+        'elapsed': elapsed,
+        'endpoints': recorder.report(elapsed),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--app', default='http://127.0.0.1:5050', help='base URL of the backend under test')
+    parser.add_argument('--dashboards', type=int, default=10, help='open dashboards')
+    parser.add_argument('--drafts', type=int, default=5, help='distinct live drafts the dashboards are spread over')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds to run')
+    parser.add_argument('--interval', type=float, default=10.0, help='seconds between dashboard polls')
+    parser.add_argument('--draft-prefix', default='loadtest')
+    parser.add_argument('--output', help='write the report as JSON to this file')
+    args = parser.parse_args(argv)
+
+    result = run_load_test(args.app, args.dashboards, args.drafts, args.duration, args.interval, args.draft_prefix)
+    for endpoint, stats in result['endpoints'].items():
+        print(f"{endpoint:16} {stats['requests']:7} req  {stats['throughput_rps']:8.2f} req/s  "
+              f"p50 {stats['p50_ms']:8.1f} ms  p95 {stats['p95_ms']:8.1f} ms  p99 {stats['p99_ms']:8.1f} ms  "
+              f"errors {stats['errors']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds, in bytes, of the payload size histogram buckets
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative_counts(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+
+class Metrics:
+    """In-process registry of stage latencies, counters and payload sizes.
+
+    Rendered in the Prometheus text exposition format, so it can be scraped
+    without adding a client library to the backend's dependencies.
+    """
+
+    def __init__(self, latency_buckets=LATENCY_BUCKETS, size_buckets=SIZE_BUCKETS, clock=time.perf_counter):
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self.clock = clock
+        self._stages = {}
+        self._payloads = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def observe_stage(self, stage, seconds):
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram(self.latency_buckets)
+            histogram.observe(seconds)
+
+    def observe_payload(self, endpoint, size):
+        with self._lock:
+            histogram = self._payloads.get(endpoint)
+            if histogram is None:
+                histogram = self._payloads[endpoint] = Histogram(self.size_buckets)
+            histogram.observe(size)
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as stage `name`, whether or not it raises."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, self.clock() - start)
+
+    def timed(self, name):
+        """Decorator form of `stage`."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def stage_summary(self, name):
+        with self._lock:
+            histogram = self._stages.get(name)
+            return (histogram.count, histogram.sum) if histogram is not None else (0, 0.0)
+
+    def render(self, counters=None, gauges=None):
+        """Prometheus text format.
+
+        `counters` and `gauges` add values owned by other components; each maps a
+        metric name to a value or to {((label, value), ...): value}.
+        """
+        lines = []
+        with self._lock:
+            lines.append('# HELP backend_stage_seconds Time spent in each named processing stage.')
+            lines.append('# TYPE backend_stage_seconds histogram')
+            for stage, histogram in sorted(self._stages.items()):
+                lines.extend(_histogram_lines('backend_stage_seconds', {'stage': stage}, histogram))
+
+            lines.append('# HELP backend_response_bytes Size of response bodies per endpoint.')
+            lines.append('# TYPE backend_response_bytes histogram')
+            for endpoint, histogram in sorted(self._payloads.items()):
+                lines.extend(_histogram_lines('backend_response_bytes', {'endpoint': endpoint}, histogram))
+
+            counters = {**self._counters, **(counters or {})}
+
+        lines.extend(_sample_lines('counter', counters))
+        lines.extend(_sample_lines('gauge', gauges or {}))
+        return '\n'.join(lines) + '\n'
+
+
+def _sample_lines(metric_type, samples):
+    for name, value in sorted(samples.items()):
+        yield f'# TYPE {name} {metric_type}'
+        if isinstance(value, dict):
+            for labels, labelled_value in sorted(value.items()):
+                yield f'{name}{_format_labels(dict(labels))} {_format_value(labelled_value)}'
+        else:
+            yield f'{name} {_format_value(value)}'
+
+
+def _histogram_lines(name, labels, histogram):
+    for bound, count in histogram.cumulative_counts():
+        yield f'{name}_bucket{_format_labels({**labels, "le": _format_value(bound)})} {count}'
+    yield f'{name}_bucket{_format_labels({**labels, "le": "+Inf"})} {histogram.count}'
+    yield f'{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}'
+    yield f'{name}_count{_format_labels(labels)} {histogram.count}'
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + '}'
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
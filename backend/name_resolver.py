@@ -0,0 +1,78 @@
+import re
+
+from fuzzywuzzy import fuzz
+
+# Name suffixes that Sleeper drops but the rankings and auction CSVs keep
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Letters of the last name that put two names in the same block
+LAST_NAME_PREFIX = 3
+
+
+def normalize_name(name):
+    """Lowercase a player name and strip punctuation and generational suffixes."""
+    if not isinstance(name, str):
+        return ''
+    tokens = re.sub(r"[.,']", '', name.lower()).split()
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def blocking_keys(name):
+    """Block keys for a normalized name: its first initial and its last-name prefix."""
+    tokens = name.split()
+    if not tokens:
+        return []
+    return [('first', tokens[0][0]), ('last', tokens[-1][:LAST_NAME_PREFIX])]
+
+
+class NameResolver:
+    """Fuzzy matcher that only scores names sharing a block with the query.
+
+    Names are blocked by position and by first initial or last-name prefix, so a
+    lookup scores a few dozen candidates instead of the whole player list. Exact
+    matches after normalization ("Patrick Mahomes" and "Patrick Mahomes II") score
+    100 without running the similarity kernel.
+    """
+
+    def __init__(self, records, threshold=95, margin=3):
+        self.threshold = threshold
+        self.margin = margin
+        self.blocks = {}
+        self.exact = {}
+        for record in records:
+            name = normalize_name(record['Player'])
+            if not name:
+                continue
+            self.exact.setdefault((name, record['Position']), []).append(record)
+            for key in blocking_keys(name):
+                self.blocks.setdefault((record['Position'], key), []).append((name, record))
+
+    def candidates(self, player_name, position=None, limit=5):
+        """Ranked `(record, score)` pairs for a player name, best first."""
+        name = normalize_name(player_name)
+        if not name:
+            return []
+
+        positions = [position] if position else {pos for pos, _ in self.blocks}
+        scored = {}
+        for pos in positions:
+            for record in self.exact.get((name, pos), []):
+                scored[id(record)] = (record, 100)
+            for key in blocking_keys(name):
+                for candidate_name, record in self.blocks.get((pos, key), []):
+                    if id(record) not in scored:
+                        scored[id(record)] = (record, fuzz.token_sort_ratio(name, candidate_name))
+
+        ranked = sorted(scored.values(), key=lambda pair: -pair[1])
+        return ranked[:limit]
+
+    def resolve(self, player_name, position=None):
+        """The best candidate if it clears the threshold and clearly beats the runner-up, else None."""
+        ranked = self.candidates(player_name, position, limit=2)
+        if not ranked or ranked[0][1] < self.threshold:
+            return None
+        if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < self.margin:
+            return None
+        return ranked[0][0]
@@ -0,0 +1,102 @@
+import pandas as pd
+
+try:
+    from .name_resolver import NameResolver, normalize_name
+except ImportError:
+    from name_resolver import NameResolver, normalize_name
+
+# Lookups remembered per index, the memo starts over once it holds this many
+LOOKUP_MEMO_SIZE = 50000
+
+
+def pick_player_name(pick):
+    metadata = pick.get('metadata', {})
+    return f"{metadata.get('first_name', '')} {metadata.get('last_name', '')}"
+
+
+class PlayerIndex:
+    """Hash index over the expected values frame keyed on (normalized name, position, team).
+
+    Lookups fall back to (name, position) and then to the bare name, but only when
+    the shorter key identifies a single player, so two players sharing a name are
+    never conflated. Names with no exact match go to the blocked fuzzy resolver.
+    Results, misses included, are remembered, since a live draft asks for the
+    same players on every poll.
+    """
+
+    def __init__(self, expected_values):
+        self.by_key = {}
+        self.by_name_position = {}
+        self.by_name = {}
+        self.resolver = NameResolver([])
+        # (player_name, position, team) -> record or None
+        self._memo = {}
+
+        if 'Player' not in expected_values.columns:
+            return
+
+        rows = expected_values[expected_values['Player'].notna()]
+        positions = rows['Position'] if 'Position' in rows.columns else pd.Series(None, index=rows.index)
+        teams = rows['Team'] if 'Team' in rows.columns else pd.Series(None, index=rows.index)
+        values = pd.to_numeric(rows['Value'], errors='coerce').fillna(0) if 'Value' in rows.columns else pd.Series(0, index=rows.index)
+        tiers = rows['Tier'] if 'Tier' in rows.columns else pd.Series(None, index=rows.index)
+        ranking_names = rows['PLAYER NAME'] if 'PLAYER NAME' in rows.columns else rows['Player']
+
+        for player, position, team, value, tier, ranking_name in zip(
+                rows['Player'].tolist(), positions.tolist(), teams.tolist(), values.tolist(), tiers.tolist(),
+                ranking_names.tolist()):
+            record = {
+                'Player': player,
+                'Ranking Name': ranking_name,
+                'Position': position if isinstance(position, str) else None,
+                'Team': team if isinstance(team, str) else None,
+                'Value': value,
+                'Tier': None if pd.isna(tier) else tier,
+            }
+            name = normalize_name(player)
+            # The first row wins on an exact duplicate key, matching the old `.values[0]` lookups
+            self.by_key.setdefault((name, record['Position'], record['Team']), record)
+            self.by_name_position.setdefault((name, record['Position']), []).append(record)
+            self.by_name.setdefault(name, []).append(record)
+
+        self.resolver = NameResolver(self.by_key.values())
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def lookup(self, player_name, position=None, team=None):
+        """Return the expected values record for a player, or None if it cannot be resolved."""
+        key = (player_name, position, team)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+
+        record = self._lookup(player_name, position, team)
+        if len(self._memo) >= LOOKUP_MEMO_SIZE:
+            self._memo = {}
+        self._memo[key] = record
+        return record
+
+    def _lookup(self, player_name, position, team):
+        name = normalize_name(player_name)
+
+        record = self.by_key.get((name, position, team))
+        if record is not None:
+            return record
+
+        candidates = self.by_name_position.get((name, position), []) if position else []
+        if not candidates:
+            candidates = self.by_name.get(name, [])
+            if position:
+                candidates = [c for c in candidates if c['Position'] in (position, None)]
+
+        if len(candidates) == 1:
+            return candidates[0]
+        if not candidates:
+            return self.resolver.resolve(player_name, position)
+        return None
+
+    def lookup_pick(self, pick):
+        metadata = pick.get('metadata', {})
+        return self.lookup(pick_player_name(pick), metadata.get('position'), metadata.get('team') or None)
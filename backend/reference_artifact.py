@@ -0,0 +1,205 @@
+"""Compile a season folder's CSVs into one binary artifact and load snapshots from it.
+
+The artifact holds the raw tables and the merged expected values, name matching
+already done, so a server starting up or reloading reads one file and builds the
+frames straight from its column buffers instead of parsing CSVs and fuzzy
+matching every ranked player again. The frames own their data once loaded,
+nothing keeps the file open or mapped.
+
+    python backend/reference_artifact.py backend/2024 --out backend/cache
+
+Layout: magic, header length, a JSON header describing every table, then one
+64-byte aligned buffer per column. Numeric columns are stored in their own dtype
+(integer tiers and ranks, float values); text columns are categorical, int32
+codes into the header's categories with -1 for a missing cell, decoded back
+into the plain object columns the rest of the code expects.
+"""
+import argparse
+import json
+import logging
+import os
+import struct
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .reference_data import (build_reference_snapshot, load_reference_snapshot, merge_expected_values,
+                                 read_season_tables, reference_fingerprint, season_source_paths)
+except ImportError:
+    from reference_data import (build_reference_snapshot, load_reference_snapshot, merge_expected_values,
+                                read_season_tables, reference_fingerprint, season_source_paths)
+
+MAGIC = b'DRAFTREF'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+CODE_DTYPE = np.dtype('<i4')
+
+
+def artifact_path(artifact_dir, year):
+    # Kept out of the season folder, whose mtime picks the latest season
+    return os.path.join(artifact_dir, f"reference_{year}.bin")
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _encode_column(values):
+    """(column header, buffer) for one column of a frame."""
+    if values.dtype.kind in 'biuf':
+        data = np.ascontiguousarray(values.to_numpy(), dtype=values.dtype.newbyteorder('<'))
+        return {'dtype': data.dtype.str}, data
+    if values.dtype != object:
+        raise ValueError(f"Cannot store column {values.name!r} of dtype {values.dtype}")
+
+    codes, categories = pd.factorize(values)
+    categories = [category.item() if isinstance(category, np.generic) else category for category in categories]
+    return {'categories': categories}, codes.astype(CODE_DTYPE)
+
+
+def _decode_column(buffer, column, rows, base):
+    if 'categories' in column:
+        codes = np.ndarray(rows, dtype=CODE_DTYPE, buffer=buffer, offset=base + column['offset'])
+        # The trailing NaN is what code -1 selects
+        categories = np.array(column['categories'] + [np.nan], dtype=object)
+        return categories[codes]
+    return np.ndarray(rows, dtype=np.dtype(column['dtype']), buffer=buffer, offset=base + column['offset'])
+
+
+def write_artifact(path, tables, metadata):
+    """Write named frames to `path` atomically, with `metadata` kept in the header."""
+    header = dict(metadata, version=FORMAT_VERSION, tables={})
+    buffers = []
+    offset = 0
+    for name, frame in tables.items():
+        columns = []
+        for column_name in frame.columns:
+            if not isinstance(column_name, str):
+                raise ValueError(f"Column names must be strings, got {column_name!r} in {name}")
+            column, data = _encode_column(frame[column_name])
+            offset = _aligned(offset)
+            columns.append(dict(column, name=column_name, offset=offset))
+            buffers.append((offset, data))
+            offset += data.nbytes
+        header['tables'][name] = {'rows': len(frame), 'columns': columns}
+
+    header_bytes = json.dumps(header, allow_nan=False).encode('utf-8')
+    base = _aligned(len(MAGIC) + 8 + len(header_bytes))
+
+    # Readers never see a half-written artifact, and workers compiling the same season each write their own
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f".{os.path.basename(path)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC + struct.pack('<Q', len(header_bytes)) + header_bytes)
+            for buffer_offset, data in buffers:
+                f.seek(base + buffer_offset)
+                f.write(data.tobytes())
+            f.truncate(base + offset)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_artifact(path):
+    """(metadata, frames by name) of an artifact, the columns decoded from one read of the file."""
+    buffer = np.fromfile(path, dtype=np.uint8)
+    prefix_size = len(MAGIC) + 8
+    if buffer.size < prefix_size or buffer[:len(MAGIC)].tobytes() != MAGIC:
+        raise ValueError(f"{path} is not a reference data artifact")
+    header_size, = struct.unpack('<Q', buffer[len(MAGIC):prefix_size].tobytes())
+    header = json.loads(buffer[prefix_size:prefix_size + header_size].tobytes())
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path} has artifact format {header.get('version')}, expected {FORMAT_VERSION}")
+
+    base = _aligned(prefix_size + header_size)
+    tables = {}
+    for name, table in header.pop('tables').items():
+        rows = table['rows']
+        names = [column['name'] for column in table['columns']]
+        tables[name] = pd.DataFrame({column['name']: _decode_column(buffer, column, rows, base)
+                                     for column in table['columns']}, columns=names)
+    return header, tables
+
+
+def compile_reference(data_dir, artifact_dir):
+    """Parse a season folder and write its artifact to `artifact_dir`, returning the snapshot built on the way."""
+    year = os.path.basename(os.path.normpath(data_dir))
+    fingerprint = reference_fingerprint(season_source_paths(data_dir, year))
+    mappings_df, auction_values_df, positional_rankings = read_season_tables(data_dir)
+    expected_values, avg_tier_costs = merge_expected_values(positional_rankings, auction_values_df)
+
+    tables = {'mappings': mappings_df, 'auction_values': auction_values_df, 'expected_values': expected_values,
+              'avg_tier_costs': pd.DataFrame(
+                  [(position, tier, cost) for (position, tier), cost in avg_tier_costs.items()],
+                  columns=['position', 'tier', 'cost'])}
+    tables.update({f'rankings_{position}': frame for position, frame in positional_rankings.items()})
+    os.makedirs(artifact_dir, exist_ok=True)
+    write_artifact(artifact_path(artifact_dir, year), tables, {
+        'year': year,
+        'fingerprint': fingerprint,
+        'positions': list(positional_rankings),
+    })
+    return build_reference_snapshot(data_dir, mappings_df, auction_values_df, positional_rankings, expected_values,
+                                    avg_tier_costs, fingerprint)
+
+
+def snapshot_from_tables(data_dir, metadata, tables):
+    positional_rankings = {position: tables[f'rankings_{position}'] for position in metadata['positions']}
+    costs = tables['avg_tier_costs']
+    avg_tier_costs = {(position, tier): cost
+                      for position, tier, cost in zip(costs['position'], costs['tier'], costs['cost'].tolist())}
+    return build_reference_snapshot(data_dir, tables['mappings'], tables['auction_values'], positional_rankings,
+                                    tables['expected_values'], avg_tier_costs, metadata['fingerprint'])
+
+
+def load_compiled_reference(data_dir, artifact_dir):
+    """Snapshot of a season folder from its artifact, compiling it first when missing or older than the CSVs.
+
+    A folder the artifact cannot be written to still loads, straight from the CSVs.
+    """
+    year = os.path.basename(os.path.normpath(data_dir))
+    path = artifact_path(artifact_dir, year)
+    if os.path.exists(path):
+        try:
+            metadata, tables = read_artifact(path)
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring unreadable reference artifact %s: %s", path, e)
+        else:
+            if metadata.get('fingerprint') == reference_fingerprint(season_source_paths(data_dir, year)):
+                return snapshot_from_tables(data_dir, metadata, tables)
+            logging.info("Reference data for %s changed, recompiling %s", year, path)
+
+    try:
+        return compile_reference(data_dir, artifact_dir)
+    except OSError as e:
+        logging.warning("Could not write reference artifact %s: %s", path, e)
+        return load_reference_snapshot(data_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile season folders into binary reference artifacts.")
+    parser.add_argument('data_dirs', nargs='+', help="Season folders, e.g. backend/2024")
+    parser.add_argument('--out', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache'),
+                        help="Directory the artifacts are written to (default: backend/cache)")
+    args = parser.parse_args(argv)
+
+    for data_dir in args.data_dirs:
+        snapshot = compile_reference(data_dir, args.out)
+        path = artifact_path(args.out, snapshot.year)
+        print(f"{path}: {len(snapshot.expected_values)} players, {os.path.getsize(path)} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,364 @@
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # Without flock (Windows) file locks only hold within one process
+    fcntl = None
+
+try:
+    from .name_resolver import NameResolver
+    from .player_index import PlayerIndex
+except ImportError:
+    from name_resolver import NameResolver
+    from player_index import PlayerIndex
+
+RANKING_POSITIONS = ["QB", "RB", "WR", "TE"]
+SEASON_PATTERN = re.compile(r'^20[0-9]{2}$')
+AUCTION_VALUES_FILENAME = 'Standard_Auction_Values.csv'
+MAPPINGS_FILENAME = 'player_name_mappings.csv'
+
+# Columns each uploaded file must have before it is allowed into a season folder
+REQUIRED_COLUMNS = {
+    'rankings': ['TIERS', 'PLAYER NAME'],
+    'auction_values': ['Player', 'Position', 'Value'],
+    'mappings': ['Sleeper Name', 'Auction Value Name', 'Tier Name'],
+}
+
+
+def ranking_filenames(year):
+    return {position: f'FantasyPros_{year}_Draft_{position}_Rankings.csv' for position in RANKING_POSITIONS}
+
+
+def parse_dollar_values(values):
+    return pd.to_numeric(values.astype(str).str.replace('$', '', regex=False), errors='coerce').fillna(0)
+
+
+def get_avg_tier_cost(expected_values):
+    avg_tier_costs = {}
+
+    for position in RANKING_POSITIONS:
+        pos_data = expected_values[expected_values["Position"] == position]
+
+        for tier in pos_data["Tier"].unique():
+            tier_data = pos_data[pos_data["Tier"] == tier]
+            avg_cost = tier_data["Value"].mean()
+            avg_tier_costs[(position, tier)] = avg_cost
+
+    return avg_tier_costs
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """Everything loaded from one season folder, parsed and indexed once.
+
+    Snapshots are shared by every request thread, so the frames they hold are
+    treated as read-only; a reload builds a new snapshot rather than editing this one.
+    """
+    year: str
+    data_dir: str
+    mappings_df: pd.DataFrame
+    auction_values_df: pd.DataFrame
+    positional_rankings: dict
+    expected_values: pd.DataFrame
+    expected_values_records: list
+    tiers_by_position: dict
+    avg_tier_costs: dict
+    player_index: PlayerIndex
+    fingerprint: str = ''
+    loaded_at: float = field(default_factory=time.time)
+
+
+def reference_fingerprint(paths):
+    """Hash of the source files' contents, identical for every load of the same data."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def match_auction_names(positional_rankings, auction_values_data):
+    """Auction values name for every ranked player, in the order of the concatenated rankings.
+
+    Exact names win, then names equal after normalization within the position
+    ("Patrick Mahomes II" and "Patrick Mahomes"), then a confident fuzzy match from
+    the same position. Players with no auction value get None.
+    """
+    auction_names = set(auction_values_data['Player'].dropna())
+    records = [{'Player': player, 'Position': position}
+               for player, position in zip(auction_values_data['Player'], auction_values_data['Position'])
+               if isinstance(player, str)]
+    resolver = NameResolver(records)
+
+    matched = []
+    for position, ranking_df in positional_rankings.items():
+        for player_name in ranking_df['PLAYER NAME'].tolist():
+            if player_name in auction_names:
+                matched.append(player_name)
+                continue
+            record = resolver.resolve(player_name, position)
+            matched.append(record['Player'] if record is not None else None)
+    return matched
+
+
+def expected_values_records(expected_values):
+    """Rows of the expected values table as dicts, with missing cells as None so they encode as JSON null."""
+    return expected_values.astype(object).where(expected_values.notna(), None).to_dict(orient='records')
+
+
+def season_source_paths(data_dir, year):
+    """The CSVs a season's snapshot is built from, in fingerprint order."""
+    return ([os.path.join(data_dir, MAPPINGS_FILENAME), os.path.join(data_dir, AUCTION_VALUES_FILENAME)] +
+            [os.path.join(data_dir, filename) for filename in ranking_filenames(year).values()])
+
+
+def read_season_tables(data_dir):
+    """The mappings, auction values and per position rankings frames of a season folder."""
+    year = os.path.basename(os.path.normpath(data_dir))
+
+    mappings_path = os.path.join(data_dir, MAPPINGS_FILENAME)
+    if os.path.exists(mappings_path):
+        mappings_df = pd.read_csv(mappings_path)
+    else:
+        logging.warning("No %s in %s. Continuing without name anomalies.", MAPPINGS_FILENAME, data_dir)
+        mappings_df = pd.DataFrame(columns=REQUIRED_COLUMNS['mappings'])
+
+    # Auction values keep the published "$" strings, lookups report them as-is
+    auction_values_df = pd.read_csv(os.path.join(data_dir, AUCTION_VALUES_FILENAME))
+
+    positional_rankings = {position: pd.read_csv(os.path.join(data_dir, filename))
+                           for position, filename in ranking_filenames(year).items()}
+    return mappings_df, auction_values_df, positional_rankings
+
+
+def merge_expected_values(positional_rankings, auction_values_df):
+    """The expected values table of every ranked player and the average value per (position, tier)."""
+    auction_values_data = auction_values_df.copy()
+    auction_values_data['Value'] = parse_dollar_values(auction_values_data['Value'])
+
+    # Merge rankings with auction values, matching names the two sources spell differently
+    all_rankings = pd.concat(positional_rankings.values(), ignore_index=True)
+    all_rankings['_auction_name'] = match_auction_names(positional_rankings, auction_values_data)
+    expected_values = pd.merge(all_rankings, auction_values_data, left_on='_auction_name', right_on='Player', how='left')
+    expected_values = expected_values.drop(columns='_auction_name')
+
+    # Ensure the 'Tier' column is consistent
+    if 'TIERS' in expected_values.columns:
+        expected_values.rename(columns={'TIERS': 'Tier'}, inplace=True)
+
+    avg_tier_costs = {}
+    if 'Tier' in expected_values.columns:
+        avg_tier_costs = get_avg_tier_cost(expected_values)
+        expected_values['Tier'] = expected_values['Tier'].fillna('N/A')
+    else:
+        logging.error("The 'Tier' column is missing from the expected values data.")
+    expected_values['Value'] = expected_values['Value'].fillna(0)
+    return expected_values, avg_tier_costs
+
+
+def build_reference_snapshot(data_dir, mappings_df, auction_values_df, positional_rankings, expected_values,
+                             avg_tier_costs, fingerprint):
+    tiers_by_position = {position: ranking_df['TIERS'].dropna().unique().tolist()
+                         for position, ranking_df in positional_rankings.items() if 'TIERS' in ranking_df.columns}
+
+    return ReferenceSnapshot(
+        year=os.path.basename(os.path.normpath(data_dir)),
+        data_dir=data_dir,
+        mappings_df=mappings_df,
+        auction_values_df=auction_values_df,
+        positional_rankings=positional_rankings,
+        expected_values=expected_values,
+        expected_values_records=expected_values_records(expected_values),
+        tiers_by_position=tiers_by_position,
+        avg_tier_costs=avg_tier_costs,
+        player_index=PlayerIndex(expected_values),
+        fingerprint=fingerprint,
+    )
+
+
+def load_reference_snapshot(data_dir):
+    year = os.path.basename(os.path.normpath(data_dir))
+    mappings_df, auction_values_df, positional_rankings = read_season_tables(data_dir)
+    expected_values, avg_tier_costs = merge_expected_values(positional_rankings, auction_values_df)
+    return build_reference_snapshot(data_dir, mappings_df, auction_values_df, positional_rankings, expected_values,
+                                    avg_tier_costs, reference_fingerprint(season_source_paths(data_dir, year)))
+
+
+class ReferenceStore:
+    """Holds the current snapshot and swaps in rebuilt ones without blocking readers.
+
+    Readers only ever dereference `current`, which is replaced in a single
+    assignment once a new snapshot is fully built.
+    """
+
+    def __init__(self, snapshot, loader=load_reference_snapshot):
+        self.current = snapshot
+        self.loader = loader
+        self.reloading = False
+        self.last_error = None
+        self._reload_lock = threading.Lock()
+
+    def reload(self, data_dir):
+        # Rebuilds are serialized so the last upload always wins
+        with self._reload_lock:
+            self.reloading = True
+            try:
+                snapshot = self.loader(data_dir)
+            except Exception as e:
+                self.last_error = str(e)
+                self.reloading = False
+                logging.error("Failed to reload reference data from %s: %s", data_dir, e, exc_info=True)
+                return None
+
+            self.current = snapshot
+            self.last_error = None
+            self.reloading = False
+            logging.info("Reference data for %s loaded from %s", snapshot.year, data_dir)
+            return snapshot
+
+    def reload_in_background(self, data_dir):
+        self.reloading = True
+        thread = threading.Thread(target=self.reload, args=(data_dir,), daemon=True)
+        thread.start()
+        return thread
+
+
+def discover_seasons(base_dir):
+    """Every season folder (2019, 2024, ...) under `base_dir`, oldest first."""
+    if not os.path.isdir(base_dir):
+        return []
+    return sorted(name for name in os.listdir(base_dir)
+                  if SEASON_PATTERN.match(name) and os.path.isdir(os.path.join(base_dir, name)))
+
+
+class SeasonRegistry:
+    """A ReferenceStore per season folder, each loaded on first use.
+
+    At most `max_loaded` seasons stay in memory, least recently used evicted
+    first. The default season, the newest folder unless one is named, is loaded
+    up front and never evicted.
+    """
+
+    def __init__(self, base_dir, loader=load_reference_snapshot, max_loaded=4, default=None):
+        self.base_dir = base_dir
+        self.loader = loader
+        self.max_loaded = max_loaded
+        seasons = discover_seasons(base_dir)
+        if default is None and not seasons:
+            raise FileNotFoundError(f"No season folders in {base_dir}")
+        self.default = default or seasons[-1]
+        self.loads = 0
+        self.evictions = 0
+        self._stores = OrderedDict()
+        self._lock = threading.Lock()
+        # Held while loading, so concurrent first requests for a season parse it once
+        self._load_lock = threading.Lock()
+        self.store(self.default)
+
+    def seasons(self):
+        return discover_seasons(self.base_dir)
+
+    def loaded(self):
+        with self._lock:
+            return list(self._stores)
+
+    def _cached(self, season):
+        with self._lock:
+            store = self._stores.get(season)
+            if store is not None:
+                self._stores.move_to_end(season)
+            return store
+
+    def store(self, season=None):
+        """The ReferenceStore of `season` (default season for None), loading it if needed.
+
+        Raises KeyError for a season with no folder.
+        """
+        season = str(season or self.default)
+        store = self._cached(season)
+        if store is not None:
+            return store
+
+        data_dir = os.path.join(self.base_dir, season)
+        if not (SEASON_PATTERN.match(season) and os.path.isdir(data_dir)):
+            raise KeyError(season)
+
+        with self._load_lock:
+            store = self._cached(season)
+            if store is not None:
+                return store
+            store = ReferenceStore(self.loader(data_dir), loader=self.loader)
+            self.loads += 1
+            with self._lock:
+                self._stores[season] = store
+                evictable = [name for name in self._stores if name != self.default]
+                while len(self._stores) > self.max_loaded and evictable:
+                    self._stores.pop(evictable.pop(0))
+                    self.evictions += 1
+        return store
+
+    def get(self, season=None):
+        """The current snapshot of `season`."""
+        return self.store(season).current
+
+    def reload_in_background(self, season, data_dir):
+        """Rebuild a loaded season from `data_dir`; one not loaded yet is read fresh on first use."""
+        with self._lock:
+            store = self._stores.get(str(season))
+        if store is None:
+            return None
+        return store.reload_in_background(data_dir)
+
+    def stats(self):
+        with self._lock:
+            loaded = list(self._stores)
+        return {'default': self.default, 'loaded': loaded, 'max_loaded': self.max_loaded,
+                'loads': self.loads, 'evictions': self.evictions}
+
+
+def validate_upload(kind, frame):
+    """Return the required columns missing from an uploaded CSV."""
+    return [column for column in REQUIRED_COLUMNS[kind] if column not in frame.columns]
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive lock on `path`, created if missing, against other processes while the block runs."""
+    with open(path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        # Released when the file is closed
+        yield
+
+
+def write_atomically(path, content):
+    # Readers of the season folder never see a half-written CSV, and concurrent
+    # writers of the same file, in other threads or workers, each get their own temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f".{os.path.basename(path)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        # mkstemp creates the file private to the owner, keep the mode the file had
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,92 @@
+class RunningRegression:
+    """Least squares line of y on x kept as running sums, so each new point costs O(1).
+
+    Integer points keep the sums exact, and the fit is read off them in closed form.
+    """
+
+    __slots__ = ('n', 'sum_x', 'sum_y', 'sum_xy', 'sum_xx', 'sum_yy', 'min_x', 'max_x')
+
+    def __init__(self):
+        self.n = 0
+        self.sum_x = 0
+        self.sum_y = 0
+        self.sum_xy = 0
+        self.sum_xx = 0
+        self.sum_yy = 0
+        self.min_x = None
+        self.max_x = None
+
+    def add(self, x, y):
+        self.n += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xy += x * y
+        self.sum_xx += x * x
+        self.sum_yy += y * y
+        self.min_x = x if self.min_x is None else min(self.min_x, x)
+        self.max_x = x if self.max_x is None else max(self.max_x, x)
+
+    def fit(self):
+        """Slope, intercept and R^2 of the line, or None while fewer than two distinct x values were added."""
+        # n^2 times the variances and covariance, exact for integer points
+        sxx = self.n * self.sum_xx - self.sum_x * self.sum_x
+        if self.n < 2 or sxx <= 0:
+            return None
+        sxy = self.n * self.sum_xy - self.sum_x * self.sum_y
+        syy = self.n * self.sum_yy - self.sum_y * self.sum_y
+
+        slope = sxy / sxx
+        intercept = (self.sum_y - slope * self.sum_x) / self.n
+        # Every y equal is fitted exactly, as sklearn's r2_score scores it
+        r2 = sxy * sxy / (sxx * syy) if syy > 0 else 1.0
+        return {'slope': slope, 'intercept': intercept, 'r2': r2, 'n': self.n}
+
+
+class PriceCurves:
+    """Price against pick number per position and per (position, tier), for one draft."""
+
+    def __init__(self):
+        self.positions = {}
+        self.tiers = {}
+
+    def add(self, position, tier, pick_no, amount):
+        regression = self.positions.get(position)
+        if regression is None:
+            regression = self.positions[position] = RunningRegression()
+        regression.add(pick_no, amount)
+
+        if tier is not None:
+            regression = self.tiers.get((position, tier))
+            if regression is None:
+                regression = self.tiers[(position, tier)] = RunningRegression()
+            regression.add(pick_no, amount)
+
+    def fit(self, position, tier=None):
+        regression = self.positions.get(position) if tier is None else self.tiers.get((position, tier))
+        return regression.fit() if regression is not None else None
+
+    def trend_lines(self, positions):
+        """Fitted line per position, with its tiers and the end points to draw it between."""
+        lines = {}
+        for position in positions:
+            fit = self.fit(position)
+            if fit is None:
+                continue
+            regression = self.positions[position]
+            tiers = {tier: self.tiers[(pos, tier)].fit() for pos, tier in self.tiers if pos == position}
+            lines[position] = {
+                **fit,
+                'pick_no': [regression.min_x, regression.max_x],
+                'price': [fit['intercept'] + fit['slope'] * x for x in (regression.min_x, regression.max_x)],
+                'tiers': {tier: tier_fit for tier, tier_fit in tiers.items() if tier_fit is not None},
+            }
+        return lines
+
+
+def price_curves(picks):
+    """PriceCurves of (position, tier, pick_no, amount) tuples, picks without a number are skipped."""
+    curves = PriceCurves()
+    for position, tier, pick_no, amount in picks:
+        if pick_no is not None:
+            curves.add(position, tier, pick_no, amount)
+    return curves
@@ -0,0 +1,127 @@
+import json
+import logging
+import os
+import threading
+
+try:
+    from .reference_data import file_lock, write_atomically
+except ImportError:
+    from reference_data import file_lock, write_atomically
+
+
+class PlayerResolutionCache:
+    """Sleeper player_id -> resolved auction name, tier name, value and tier.
+
+    Entries belong to one reference snapshot per season. They are saved per season
+    together with the snapshot's fingerprint, so a restart reuses them while the
+    CSVs are unchanged and any upload or reload starts that season's cache over.
+    """
+
+    def __init__(self, cache_dir, resolve):
+        self.cache_dir = cache_dir
+        # resolve(snapshot, player_name, position) -> entry dict
+        self.resolve = resolve
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        # season -> {'fingerprint', 'entries', 'dirty'}
+        self._seasons = {}
+
+    def _path(self, season):
+        return os.path.join(self.cache_dir, f"player_resolution_{season}.json")
+
+    def _bind(self, snapshot):
+        # Caller holds the lock
+        season = self._seasons.get(snapshot.year)
+        if season is not None and season['fingerprint'] == snapshot.fingerprint:
+            return season
+        season = self._seasons[snapshot.year] = {'fingerprint': snapshot.fingerprint, 'entries': {}, 'dirty': False}
+
+        saved = self._read_saved(snapshot.year)
+        if saved is None:
+            return season
+        if saved.get('fingerprint') == snapshot.fingerprint:
+            season['entries'] = saved.get('players', {})
+        else:
+            logging.info("Reference data for %s changed, discarding saved player resolutions", snapshot.year)
+        return season
+
+    def _read_saved(self, year):
+        path = self._path(year)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring unreadable player resolution cache %s: %s", path, e)
+            return None
+
+    def warm(self, snapshot):
+        """Load the saved resolutions for `snapshot`, returning how many were restored."""
+        with self._lock:
+            return len(self._bind(snapshot)['entries'])
+
+    def get(self, snapshot, player_id, player_name, position):
+        entry = self.get_many(snapshot, [player_id])[0]
+        if entry is None:
+            entry = self.resolve(snapshot, player_name, position)
+            self.put_many(snapshot, {player_id: entry})
+        return entry
+
+    def get_many(self, snapshot, player_ids):
+        """Cached entries for `player_ids`, in order, with None for each miss."""
+        with self._lock:
+            cached = self._bind(snapshot)['entries']
+            entries = [cached.get(str(player_id)) if player_id else None for player_id in player_ids]
+            hits = sum(entry is not None for entry in entries)
+            self.hits += hits
+            self.misses += len(entries) - hits
+        return entries
+
+    def put_many(self, snapshot, entries):
+        """Store freshly resolved `{player_id: entry}` pairs for `snapshot`."""
+        with self._lock:
+            # A reload may have happened while resolving; keep the entries only if they still apply
+            season = self._seasons.get(snapshot.year)
+            if season is None or snapshot.fingerprint != season['fingerprint'] or not entries:
+                return
+            for player_id, entry in entries.items():
+                season['entries'][str(player_id)] = entry
+            season['dirty'] = True
+
+    def save(self):
+        with self._save_lock:
+            return self._save()
+
+    def _save(self):
+        with self._lock:
+            pending = []
+            for year, season in self._seasons.items():
+                if season['dirty']:
+                    pending.append((year, season['fingerprint'], dict(season['entries'])))
+                    season['dirty'] = False
+        if not pending:
+            return False
+
+        saved = True
+        for year, fingerprint, entries in pending:
+            path = self._path(year)
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Other worker processes save the same file, keep what they resolved too
+                with file_lock(f"{path}.lock"):
+                    on_disk = self._read_saved(year) or {}
+                    players = on_disk.get('players', {}) if on_disk.get('fingerprint') == fingerprint else {}
+                    players.update(entries)
+                    write_atomically(path, json.dumps({'fingerprint': fingerprint, 'players': players}).encode())
+            except OSError as e:
+                logging.error("Could not save player resolution cache %s: %s", path, e)
+                saved = False
+        return saved
+
+    def stats(self):
+        with self._lock:
+            return {'entries': sum(len(season['entries']) for season in self._seasons.values()),
+                    'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,106 @@
+"""Gunicorn hooks for the production server, configured in gunicorn.conf.py:
+
+    gunicorn -c backend/gunicorn.conf.py backend.trial_backend:app
+
+The master imports the app (preload_app) and, in when_ready, loads the seasons
+to preload and the caches built from them, then freezes those objects out of the
+garbage collector so forked workers keep sharing the pages instead of copying
+them as the collector touches them. Gunicorn binds the port before when_ready
+and forks the workers after it, so connections made while it loads wait in the
+listen backlog and a GET /ready probe is answered once the data is in memory.
+
+HUP makes gunicorn replace every worker. on_reload first reloads the preloaded
+seasons from disk, so CSVs uploaded through POST /rankings on one worker are
+served by all of them once the master gets a HUP.
+
+Workers share fetched pick lists and computed draft analytics through a SQLite
+cache in a temp directory created for the run and removed when it stops. Set
+SHARED_CACHE_PATH to keep the cache somewhere else, or to nothing to go without.
+
+Workers write to the same files on disk. Uploaded CSVs, reference artifacts and
+player resolution caches are replaced atomically through a temp file private to
+each writer, and saved resolutions are merged under a file lock. Draft archive
+ingests lock the archive's manifest.
+"""
+import gc
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the parent directory to sys.path so the backend package can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.reference_data import reference_fingerprint, season_source_paths
+
+# Comma separated seasons to share between workers (default: as many of the newest as MAX_LOADED_SEASONS allows)
+PRELOAD_SEASONS = os.environ.get('PRELOAD_SEASONS', '')
+
+# Temp directory holding the shared cache of this run, removed when the master exits
+run_dir = None
+
+
+def use_run_dir():
+    """Point SHARED_CACHE_PATH at a temp directory of this run unless it is set; call before the app is imported."""
+    global run_dir
+    if 'SHARED_CACHE_PATH' not in os.environ:
+        run_dir = tempfile.mkdtemp(prefix='draft-backend-')
+        os.environ['SHARED_CACHE_PATH'] = os.path.join(run_dir, 'shared_cache.sqlite3')
+
+
+def preload(backend, seasons):
+    """Load `seasons` and everything requests would otherwise build lazily in each worker."""
+    for season in seasons:
+        snapshot = backend.season_registry.get(season)
+        backend.get_reference_payload(snapshot)
+        backend.get_resolve_tables(snapshot)
+        backend.player_resolution_cache.warm(snapshot)
+    # Objects alive now are never collected, so the collector does not write to their shared pages
+    gc.collect()
+    gc.freeze()
+
+
+def reload_changed_seasons(registry, force=False):
+    """Reload every loaded season whose CSVs changed on disk (every one with `force`), returning those reloaded."""
+    reloaded = []
+    for season in registry.loaded():
+        store = registry.store(season)
+        data_dir = store.current.data_dir
+        fingerprint = reference_fingerprint(season_source_paths(data_dir, season))
+        if (force or fingerprint != store.current.fingerprint) and store.reload(data_dir) is not None:
+            reloaded.append(season)
+    return reloaded
+
+
+def when_ready(server):
+    import backend.trial_backend as trial_backend
+
+    registry = trial_backend.season_registry
+    seasons = [season.strip() for season in PRELOAD_SEASONS.split(',') if season.strip()]
+    started = time.monotonic()
+    preload(trial_backend, seasons or registry.seasons()[-registry.max_loaded:])
+    logging.info("Preloaded seasons %s in %.2fs", ', '.join(registry.loaded()), time.monotonic() - started)
+
+
+def on_reload(server):
+    import backend.trial_backend as trial_backend
+
+    reloaded = reload_changed_seasons(trial_backend.season_registry, force=True)
+    logging.info("Reloaded reference data for %s", ', '.join(reloaded) or 'no seasons')
+    gc.unfreeze()
+    preload(trial_backend, trial_backend.season_registry.loaded())
+
+
+def worker_exit(server, worker):
+    import backend.trial_backend as trial_backend
+
+    trial_backend.player_resolution_cache.save()
+    if trial_backend.shared_cache is not None:
+        trial_backend.shared_cache.close()
+
+
+def on_exit(server):
+    if run_dir is not None:
+        shutil.rmtree(run_dir, ignore_errors=True)
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+try:
+    from .json_codec import dumps
+except ImportError:
+    from json_codec import dumps
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+# A hit refreshes an entry's place in the eviction order at most this often, so most hits do not write
+ACCESS_RESOLUTION = 1.0
+
+# Idle connections a process keeps open; request threads come and go, the connections outlive them
+POOL_SIZE = 4
+
+
+class SharedCache:
+    """JSON values with TTLs in a SQLite file that every worker process on the host shares.
+
+    The database runs in WAL mode, so readers in any process never wait for the
+    one writer. Values are stored zlib compressed; once the stored bytes exceed
+    `max_bytes`, expired entries and then the least recently used ones are
+    deleted. The cache only ever saves work: when the file cannot be opened or
+    written, lookups miss and stores are dropped.
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024, busy_timeout=1.0, clock=time.time):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        # Wall clock time, shared with the other processes through the expiry columns
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._pool = []
+        self._pid = os.getpid()
+        self._ready = False
+
+    def _open(self):
+        if not self._ready:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None,
+                                     check_same_thread=False)
+        try:
+            # A crash may lose the last writes but never corrupts the file, fine for a cache
+            connection.execute('PRAGMA synchronous=NORMAL')
+            if not self._ready:
+                # WAL mode is kept in the file itself, so it and the schema are set up once per process
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.executescript(SCHEMA)
+                self._ready = True
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    @contextmanager
+    def _connection(self):
+        """A connection of this process's pool, returned to it (or closed when the pool is full) afterwards."""
+        with self._pool_lock:
+            if self._pid != os.getpid():
+                # Connections inherited from the parent stay with it, a forked worker opens its own
+                self._pool = []
+                self._pid = os.getpid()
+            connection = self._pool.pop() if self._pool else None
+        if connection is None:
+            connection = self._open()
+
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+        with self._pool_lock:
+            if self._pid == os.getpid() and len(self._pool) < POOL_SIZE:
+                self._pool.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """Close the idle connections of this process."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        if self._pid == os.getpid():
+            for connection in pool:
+                connection.close()
+
+    def _count(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key):
+        """The value stored under `key`, or None when it is missing or expired."""
+        now = self.clock()
+        try:
+            with self._connection() as connection:
+                row = connection.execute('SELECT value, expires_at, accessed_at FROM entries WHERE key = ?',
+                                         (key,)).fetchone()
+                if row is None or row[1] <= now:
+                    self._count('misses')
+                    return None
+                if now - row[2] >= ACCESS_RESOLUTION:
+                    connection.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+            value = json.loads(zlib.decompress(row[0]))
+        except (sqlite3.Error, OSError, zlib.error, ValueError) as e:
+            logging.warning("Shared cache lookup of %s failed: %s", key, e)
+            self._count('errors')
+            return None
+        self._count('hits')
+        return value
+
+    def put(self, key, value, ttl):
+        """Store `value` under `key` for `ttl` seconds, returning whether it was stored."""
+        now = self.clock()
+        blob = zlib.compress(dumps(value).encode('utf-8'), 1)
+        if len(blob) > self.max_bytes:
+            return False
+        try:
+            with self._connection() as connection:
+                connection.execute('BEGIN IMMEDIATE')
+                try:
+                    connection.execute('INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) '
+                                       'VALUES (?, ?, ?, ?, ?)', (key, blob, len(blob), now + ttl, now))
+                    evicted = self._evict(connection, now)
+                    connection.execute('COMMIT')
+                except BaseException:
+                    connection.execute('ROLLBACK')
+                    raise
+        except (sqlite3.Error, OSError) as e:
+            logging.warning("Shared cache store of %s failed: %s", key, e)
+            self._count('errors')
+            return False
+        self._count('stores')
+        if evicted:
+            self._count('evictions', evicted)
+        return True
+
+    def _evict(self, connection, now):
+        # Caller holds the write transaction
+        total, = connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+        if total <= self.max_bytes:
+            return 0
+
+        evicted = connection.execute('DELETE FROM entries WHERE expires_at <= ?', (now,)).rowcount
+        total, = connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+        if total <= self.max_bytes:
+            return evicted
+
+        # Least recently used first, until the rest fits
+        keys = []
+        for key, size in connection.execute('SELECT key, size FROM entries ORDER BY accessed_at'):
+            if total <= self.max_bytes:
+                break
+            keys.append((key,))
+            total -= size
+        connection.executemany('DELETE FROM entries WHERE key = ?', keys)
+        return evicted + len(keys)
+
+    def invalidate(self, prefix=None):
+        """Delete every entry, or the ones whose key starts with `prefix`."""
+        try:
+            with self._connection() as connection:
+                if prefix is None:
+                    connection.execute('DELETE FROM entries')
+                else:
+                    connection.execute("DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+        except (sqlite3.Error, OSError) as e:
+            logging.warning("Shared cache invalidation failed: %s", e)
+            self._count('errors')
+
+    def stats(self):
+        entries = size = 0
+        try:
+            with self._connection() as connection:
+                entries, size = connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        except (sqlite3.Error, OSError):
+            pass
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'errors': self.errors,
+                'entries': entries,
+                'bytes': size,
+                'hit_rate': self.hits / lookups if lookups else 0,
+            }
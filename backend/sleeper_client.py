@@ -0,0 +1,66 @@
+import logging
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Upstream responses worth retrying: rate limiting and server-side failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class SleeperClient:
+    """Shared HTTP client for the Sleeper API.
+
+    Keeps a pooled keep-alive session, bounds every call with connect and read
+    timeouts so a stalled upstream cannot hold a worker thread, and retries
+    5xx/429 responses and connection errors with jittered exponential backoff.
+    """
+
+    def __init__(self, connect_timeout=3.05, read_timeout=10.0, retries=2, backoff=0.25, max_backoff=4.0,
+                 pool_size=32, session=None, sleep=time.sleep):
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sleep = sleep
+        self.requests_sent = 0
+        self.retries_made = 0
+
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_json(self, url):
+        """GET `url` and return its decoded JSON body, retrying transient failures."""
+        attempt = 0
+        while True:
+            try:
+                self.requests_sent += 1
+                response = self.session.get(url, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.retries:
+                    raise
+                logging.warning("Request to %s failed (%s), retrying", url, e)
+                self._wait(attempt)
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                logging.warning("Request to %s returned %s, retrying", url, response.status_code)
+                self._wait(attempt, response.headers.get('Retry-After'))
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    def _wait(self, attempt, retry_after=None):
+        self.retries_made += 1
+        delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+        # Full jitter keeps many workers from retrying in lockstep
+        delay = random.uniform(0, delay)
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+        self.sleep(delay)
@@ -0,0 +1,173 @@
+"""Local stand-in for the Sleeper draft API, revealing picks over time like a live auction.
+
+    python backend/sleeper_standin.py --port 8000 --pick-interval 5
+    SLEEPER_API_BASE=http://127.0.0.1:8000/v1 python backend/trial_backend.py
+
+Any draft ID is served: from a recorded picks file when one is given, otherwise
+from a synthetic draft seeded by the ID.
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.reference_data import load_reference_snapshot
+from backend.synthetic_draft import DEFAULT_BUDGET, DEFAULT_TEAMS, generate_draft
+
+DRAFT_PATH = re.compile(r'^/v1/draft/([^/]+)(/picks)?/?$')
+
+
+class SleeperStandIn:
+    """Draft pick lists that grow by one pick every `pick_interval` seconds after first being requested."""
+
+    def __init__(self, reference, pick_interval=5.0, initial_picks=0, num_picks=192, teams=DEFAULT_TEAMS,
+                 budget=DEFAULT_BUDGET, recorded=None, latency=0.0, error_rate=0.0, clock=time.monotonic):
+        self.reference = reference
+        self.pick_interval = pick_interval
+        self.initial_picks = initial_picks
+        self.num_picks = num_picks
+        self.teams = teams
+        self.budget = budget
+        # draft_id -> picks, with '*' used for any other draft ID
+        self.recorded = recorded or {}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.clock = clock
+        self.requests_served = 0
+        self._drafts = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+
+    def _draft(self, draft_id):
+        with self._lock:
+            self.requests_served += 1
+            draft = self._drafts.get(draft_id)
+            if draft is not None:
+                return draft
+
+        picks = self.recorded.get(draft_id, self.recorded.get('*'))
+        if picks is None:
+            picks = generate_draft(self.reference, self.num_picks, teams=self.teams, budget=self.budget,
+                                   seed=zlib.crc32(draft_id.encode()), draft_id=draft_id)
+        else:
+            picks = [dict(pick, draft_id=draft_id) for pick in picks]
+
+        with self._lock:
+            return self._drafts.setdefault(draft_id, {'picks': picks, 'started': self.clock()})
+
+    def revealed(self, draft_id):
+        draft = self._draft(draft_id)
+        if self.pick_interval <= 0:
+            return draft['picks'], True
+        count = self.initial_picks + int((self.clock() - draft['started']) / self.pick_interval)
+        return draft['picks'][:count], count >= len(draft['picks'])
+
+    def picks(self, draft_id):
+        return self.revealed(draft_id)[0]
+
+    def draft(self, draft_id):
+        picks, complete = self.revealed(draft_id)
+        return {
+            'draft_id': draft_id,
+            'type': 'auction',
+            'season': self.reference.year,
+            'sport': 'nfl',
+            'status': 'complete' if complete else 'drafting',
+            'settings': {'teams': self.teams, 'budget': self.budget},
+            'last_picked': picks[-1]['pick_no'] if picks else None,
+        }
+
+    def should_fail(self):
+        with self._lock:
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+def make_handler(standin):
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            match = DRAFT_PATH.match(self.path.split('?', 1)[0])
+            if match is None:
+                return self.send_json(404, None)
+            if standin.latency:
+                time.sleep(standin.latency)
+            if standin.should_fail():
+                return self.send_json(503, {'error': 'stand-in injected failure'})
+
+            draft_id, picks = match.groups()
+            body = standin.picks(draft_id) if picks else standin.draft(draft_id)
+            self.send_json(200, body)
+
+        def send_json(self, status, body):
+            content = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StandInHandler
+
+
+def make_server(standin, host='127.0.0.1', port=8000):
+    return ThreadingHTTPServer((host, port), make_handler(standin))
+
+
+def load_recorded(path):
+    """Recorded picks from one JSON file (served for every draft) or a directory of <draft_id>.json files."""
+    if os.path.isdir(path):
+        recorded = {}
+        for filename in glob.glob(os.path.join(path, '*.json')):
+            with open(filename, 'r') as f:
+                recorded[os.path.splitext(os.path.basename(filename))[0]] = json.load(f)
+        return recorded
+    with open(path, 'r') as f:
+        return {'*': json.load(f)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--data-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '2024'),
+                        help='season folder the synthetic drafts are built from')
+    parser.add_argument('--recorded', help='picks JSON file, or a directory of <draft_id>.json files')
+    parser.add_argument('--pick-interval', type=float, default=5.0, help='seconds between revealed picks, 0 for all')
+    parser.add_argument('--initial-picks', type=int, default=1, help='picks already made when a draft is first seen')
+    parser.add_argument('--picks', type=int, default=192, help='picks per synthetic draft')
+    parser.add_argument('--teams', type=int, default=DEFAULT_TEAMS)
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with a 503')
+    args = parser.parse_args(argv)
+
+    standin = SleeperStandIn(
+        load_reference_snapshot(args.data_dir), pick_interval=args.pick_interval, initial_picks=args.initial_picks,
+        num_picks=args.picks, teams=args.teams, budget=args.budget,
+        recorded=load_recorded(args.recorded) if args.recorded else None,
+        latency=args.latency, error_rate=args.error_rate)
+    server = make_server(standin, args.host, args.port)
+    print(f"Sleeper stand-in listening on http://{args.host}:{server.server_port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import math
+import random
+
+try:
+    from .name_resolver import NAME_SUFFIXES
+    from .reference_data import RANKING_POSITIONS
+except ImportError:
+    from name_resolver import NAME_SUFFIXES
+    from reference_data import RANKING_POSITIONS
+
+DEFAULT_TEAMS = 12
+DEFAULT_BUDGET = 200
+
+
+def sleeper_name(name):
+    """The name as Sleeper lists it: generational suffixes are dropped."""
+    tokens = name.split()
+    while len(tokens) > 2 and tokens[-1].lower().rstrip('.') in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def name_anomaly(name, rng):
+    """A spelling of `name` that differs from the rankings the way real Sleeper names do."""
+    variants = []
+    if '.' in name:
+        variants.append(name.replace('.', ''))
+    if any(c.isupper() for c in name.split()[0][1:]):
+        # "DeVonta" -> "Devonta"
+        first, _, rest = name.partition(' ')
+        variants.append(f"{first[0]}{first[1:].lower()} {rest}")
+    if "'" in name:
+        variants.append(name.replace("'", ''))
+    if not variants:
+        # A doubled letter in the last name, the kind of typo fuzzy matching has to absorb
+        first, _, last = name.rpartition(' ')
+        i = rng.randrange(1, len(last)) if len(last) > 1 else 0
+        variants.append(f"{first} {last[:i]}{last[i - 1 if i else 0]}{last[i:]}".strip())
+    return rng.choice(variants)
+
+
+def player_pool(reference):
+    """Ranked QB/RB/WR/TE players with their expected value, most valuable first."""
+    pool = []
+    for position in RANKING_POSITIONS:
+        ranking_df = reference.positional_rankings.get(position)
+        if ranking_df is None:
+            continue
+        teams = ranking_df['TEAM'].tolist() if 'TEAM' in ranking_df.columns else [''] * len(ranking_df)
+        for name, team in zip(ranking_df['PLAYER NAME'].tolist(), teams):
+            record = reference.player_index.lookup(name, position)
+            value = record['Value'] if record is not None else 0
+            pool.append({'name': name, 'position': position, 'team': team if isinstance(team, str) else '',
+                         'value': value})
+    pool.sort(key=lambda player: -player['value'])
+    return pool
+
+
+def generate_draft(reference, num_picks, teams=DEFAULT_TEAMS, budget=DEFAULT_BUDGET, anomaly_rate=0.05,
+                   seed=0, draft_id='synthetic'):
+    """A completed auction draft of `num_picks` picks in the Sleeper `/draft/<id>/picks` schema.
+
+    Players are nominated roughly in expected value order and sold for their value
+    with noise, to a team that still has a roster spot and enough budget left to
+    fill the rest of its roster at $1. Sleeper drops name suffixes, and
+    `anomaly_rate` of the names are additionally respelled. When `num_picks` is
+    larger than the ranked player pool the pool is reused.
+    """
+    rng = random.Random(seed)
+    roster_size = math.ceil(num_picks / teams)
+    if roster_size > budget:
+        raise ValueError(f"A budget of {budget} cannot fill {roster_size} roster spots per team")
+
+    pool = player_pool(reference)
+    if not pool:
+        raise ValueError("The reference data has no ranked players")
+
+    # Nomination order: expected value plus noise, so close players swap places
+    order = sorted(range(len(pool)), key=lambda i: -(pool[i]['value'] + rng.gauss(0, 2 + 0.15 * pool[i]['value'])))
+    spent = [0] * teams
+    roster = [0] * teams
+    picks = []
+
+    for pick_no in range(1, num_picks + 1):
+        index = order[(pick_no - 1) % len(order)]
+        player = pool[index]
+
+        open_teams = [team for team in range(teams) if roster[team] < roster_size]
+        # The most a team can bid and still fill the rest of its roster at $1
+        max_bid = {team: budget - spent[team] - (roster_size - roster[team] - 1) for team in open_teams}
+        price = max(1, round(player['value'] * rng.uniform(0.75, 1.35))) if player['value'] > 0 else 1
+        bidders = [team for team in open_teams if max_bid[team] >= price]
+        if bidders:
+            team = rng.choice(bidders)
+        else:
+            team = max(open_teams, key=lambda team: max_bid[team])
+            price = max(1, max_bid[team])
+
+        spent[team] += price
+        roster[team] += 1
+
+        name = sleeper_name(player['name'])
+        if rng.random() < anomaly_rate:
+            name = name_anomaly(name, rng)
+        first_name, _, last_name = name.partition(' ')
+        player_id = str(1000 + index)
+
+        picks.append({
+            "draft_id": draft_id,
+            "draft_slot": team + 1,
+            "is_keeper": None,
+            "metadata": {
+                "amount": str(price),
+                "first_name": first_name,
+                "injury_status": "",
+                "last_name": last_name,
+                "news_updated": "",
+                "number": "",
+                "player_id": player_id,
+                "position": player['position'],
+                "slot": str(team + 1),
+                "sport": "nfl",
+                "status": "Active",
+                "team": player['team'],
+                "team_abbr": "",
+                "years_exp": "",
+            },
+            "pick_no": pick_no,
+            "picked_by": "",
+            "player_id": player_id,
+            "roster_id": None,
+            "round": (pick_no - 1) // teams + 1,
+        })
+
+    return picks
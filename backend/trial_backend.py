@@ -1,57 +1,94 @@
 import pandas as pd
 import requests
-import json
 import numpy as np
 import os
-from flask import Flask, jsonify, request
+import io
+import time
+import hashlib
+import threading
+from flask import Flask, Response, g, has_request_context, jsonify, request
 from flask_cors import CORS
 import logging
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
-import glob
-from fuzzywuzzy import process
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from .player_index import PlayerIndex, pick_player_name
+    from .inflation_engine import (build_picks_frame, build_scatter_series, calculate_doe, calculate_inflation,
+                                   count_picks_per_tier, tier_sort_key)
+    from .compression import COMPRESSIBLE_MIMETYPES, compress, negotiate_encoding
+    from .draft_archive import DraftArchive
+    from .draft_cache import DraftPicksCache
+    from .draft_poller import DraftPoller
+    from .draft_state import DraftStateRegistry
+    from .json_codec import JSONEncoder, dumps
+    from .metrics import Metrics
+    from .regression import price_curves
+    from .sleeper_client import SleeperClient
+    from .resolution_cache import PlayerResolutionCache
+    from .shared_cache import SharedCache
+    from .reference_data import (AUCTION_VALUES_FILENAME, MAPPINGS_FILENAME, SeasonRegistry, load_reference_snapshot,
+                                 ranking_filenames, validate_upload, write_atomically)
+    from .reference_artifact import load_compiled_reference
+except ImportError:
+    from player_index import PlayerIndex, pick_player_name
+    from inflation_engine import (build_picks_frame, build_scatter_series, calculate_doe, calculate_inflation,
+                                  count_picks_per_tier, tier_sort_key)
+    from compression import COMPRESSIBLE_MIMETYPES, compress, negotiate_encoding
+    from draft_archive import DraftArchive
+    from draft_cache import DraftPicksCache
+    from draft_poller import DraftPoller
+    from draft_state import DraftStateRegistry
+    from json_codec import JSONEncoder, dumps
+    from metrics import Metrics
+    from regression import price_curves
+    from sleeper_client import SleeperClient
+    from resolution_cache import PlayerResolutionCache
+    from shared_cache import SharedCache
+    from reference_data import (AUCTION_VALUES_FILENAME, MAPPINGS_FILENAME, SeasonRegistry, load_reference_snapshot,
+                                ranking_filenames, validate_upload, write_atomically)
+    from reference_artifact import load_compiled_reference
 
 # Define base directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def get_latest_data_folder(base_dir):
-    """Retrieve the most recent year folder for data files."""
-    year_folders = glob.glob(os.path.join(base_dir, "20[0-9][0-9]"))
-    return max(year_folders, key=os.path.getmtime)
-
-# Use the latest data folder
-LATEST_DATA_DIR = get_latest_data_folder(BASE_DIR)
-LATEST_YEAR = os.path.basename(LATEST_DATA_DIR)
-
-# Dynamic paths
-EXPECTED_VALUES_PATH = os.path.join(LATEST_DATA_DIR, 'Standard_Auction_Values.csv')
-MAPPINGS_PATH = os.path.join(LATEST_DATA_DIR, 'player_name_mappings.csv')
-
-# Dynamic filenames for CSV data
-csv_filenames = {
-    'QB': f'FantasyPros_{LATEST_YEAR}_Draft_QB_Rankings.csv',
-    'RB': f'FantasyPros_{LATEST_YEAR}_Draft_RB_Rankings.csv',
-    'WR': f'FantasyPros_{LATEST_YEAR}_Draft_WR_Rankings.csv',
-    'TE': f'FantasyPros_{LATEST_YEAR}_Draft_TE_Rankings.csv'
-}
+# Stage timings, counters and payload sizes, exported at /metrics
+metrics = Metrics()
+
+# Seasons are compiled once into a binary artifact, so startup and reloads skip
+# parsing the CSVs while they are unchanged. REFERENCE_ARTIFACT_DIR= (empty) always parses.
+REFERENCE_ARTIFACT_DIR = os.environ.get('REFERENCE_ARTIFACT_DIR', os.path.join(BASE_DIR, 'cache'))
+
+def load_reference(data_dir):
+    if REFERENCE_ARTIFACT_DIR:
+        return load_compiled_reference(data_dir, REFERENCE_ARTIFACT_DIR)
+    return load_reference_snapshot(data_dir)
 
-# Load the player name mappings CSV
-mappings_df = pd.read_csv(MAPPINGS_PATH)
+# Parse and index the reference data once; uploads swap in a rebuilt snapshot
+timed_load_reference_snapshot = metrics.timed('reference_load')(load_reference)
 
-# Load Auction Values
-auction_values_df = pd.read_csv(EXPECTED_VALUES_PATH)
+# Every season folder can be served with ?season=; the newest one (or DEFAULT_SEASON)
+# is loaded at startup and the others on first use, at most MAX_LOADED_SEASONS at a time
+DEFAULT_SEASON = os.environ.get('DEFAULT_SEASON') or None
+MAX_LOADED_SEASONS = int(os.environ.get('MAX_LOADED_SEASONS', '4'))
+season_registry = SeasonRegistry(BASE_DIR, loader=timed_load_reference_snapshot, max_loaded=MAX_LOADED_SEASONS,
+                                 default=DEFAULT_SEASON)
+reference_store = season_registry.store()
+LATEST_YEAR = season_registry.default
+LATEST_DATA_DIR = os.path.join(BASE_DIR, LATEST_YEAR)
 
-# Load Positional Rankings into a dictionary
-positional_rankings = {position: pd.read_csv(os.path.join(LATEST_DATA_DIR, filename))
-                       for position, filename in csv_filenames.items()}
+def current_store():
+    """ReferenceStore of the season the current request asked for, the default season outside a request."""
+    if has_request_context() and 'reference_store' in g:
+        return g.reference_store
+    return reference_store
 
-# Convert the mappings to a dictionary for easy lookup
-player_name_mappings = dict(zip(mappings_df['Sleeper Name'], mappings_df['Auction Value Name']))
+def current_reference():
+    return current_store().current
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
 app.config['SECRET_KEY'] = 'qZw6G6Zy8EGdgR6UfHMgERGYiEZpvODt'
 
 # Define position colors for scatter plot
@@ -62,29 +99,118 @@ POSITION_COLORS = {
     "TE": "yellow"
 }
 
-class CustomEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, np.generic):
-            return obj.item()
-        return super().default(obj)
+app.json_encoder = JSONEncoder
 
-app.json_encoder = CustomEncoder
+# Numbers in /inflation and /draft_snapshot used to be sent as strings. Set
+# STRING_NUMBERS=1, or pass ?numbers=string, for clients that still expect that
+STRING_NUMBERS = os.environ.get('STRING_NUMBERS', '0') == '1'
 
-def get_draft_data(draft_id):
-    url = f"https://api.sleeper.app/v1/draft/{draft_id}/picks"
+# Upstream Sleeper API, overridable so the app can be pointed at a local stub
+SLEEPER_API_BASE = os.environ.get('SLEEPER_API_BASE', 'https://api.sleeper.app/v1')
+
+# Seconds a fetched pick list is reused across requests for the same draft
+DRAFT_CACHE_TTL = float(os.environ.get('DRAFT_CACHE_TTL', '3'))
+
+# Connect/read timeouts and retry budget for calls to Sleeper
+SLEEPER_CONNECT_TIMEOUT = float(os.environ.get('SLEEPER_CONNECT_TIMEOUT', '3.05'))
+SLEEPER_READ_TIMEOUT = float(os.environ.get('SLEEPER_READ_TIMEOUT', '10'))
+SLEEPER_RETRIES = int(os.environ.get('SLEEPER_RETRIES', '2'))
+sleeper_client = SleeperClient(connect_timeout=SLEEPER_CONNECT_TIMEOUT, read_timeout=SLEEPER_READ_TIMEOUT,
+                               retries=SLEEPER_RETRIES)
+
+@metrics.timed('sleeper_fetch')
+def fetch_draft_data(draft_id):
+    url = f"{SLEEPER_API_BASE}/draft/{draft_id}/picks"
     try:
-        response = requests.get(url)
-        logging.debug(f"Response Status Code: {response.status_code}")
-        if response.status_code == 200:
-            logging.debug(f"Response Data: {response.json()}")
-            return response.json()
-        else:
-            logging.error(f"Error: Unable to fetch data for draft ID {draft_id}.")
-            return []
+        draft_data = sleeper_client.get_json(url) or []
+        logging.debug("Fetched %d picks for draft ID %s", len(draft_data), draft_id)
+        return draft_data
+    except requests.HTTPError as e:
+        logging.error("Error: Unable to fetch data for draft ID %s: %s", draft_id, e)
+        return []
     except Exception as e:
-        logging.error(f"Exception occurred while fetching draft data: {e}")
+        logging.error("Exception occurred while fetching draft data: %s", e)
         return []
 
+def fetch_draft_info(draft_id):
+    """Draft metadata such as status and season. Unlike the picks fetch, failures are raised."""
+    return sleeper_client.get_json(f"{SLEEPER_API_BASE}/draft/{draft_id}")
+
+# Pick lists and computed draft analytics shared by every worker process on the host, in
+# a SQLite file. Off unless set; gunicorn.conf.py sets it to a file in a temp directory for its run
+SHARED_CACHE_PATH = os.environ.get('SHARED_CACHE_PATH', '')
+SHARED_CACHE_MAX_MB = float(os.environ.get('SHARED_CACHE_MAX_MB', '64'))
+# Analytics are keyed by the draft's pick count, so they only go stale when a pick is edited
+ANALYTICS_CACHE_TTL = float(os.environ.get('ANALYTICS_CACHE_TTL', '600'))
+shared_cache = (SharedCache(SHARED_CACHE_PATH, max_bytes=int(SHARED_CACHE_MAX_MB * 1024 * 1024))
+                if SHARED_CACHE_PATH else None)
+
+def fetch_shared_draft_data(draft_id):
+    """Picks of a draft, fetched from Sleeper by at most one process on the host per DRAFT_CACHE_TTL."""
+    if shared_cache is None:
+        return fetch_draft_data(draft_id)
+    key = f"picks:{draft_id}"
+    draft_data = shared_cache.get(key)
+    if draft_data is None:
+        draft_data = fetch_draft_data(draft_id)
+        # Empty results are not shared, like in the draft cache
+        if draft_data:
+            shared_cache.put(key, draft_data, DRAFT_CACHE_TTL)
+    return draft_data
+
+draft_cache = DraftPicksCache(fetch_shared_draft_data, ttl=DRAFT_CACHE_TTL)
+
+# One background poll per watched draft, shared by every viewer of that draft
+DRAFT_POLLER_ENABLED = os.environ.get('DRAFT_POLLER_ENABLED', '1') != '0'
+DRAFT_POLL_INTERVAL = float(os.environ.get('DRAFT_POLL_INTERVAL', '2'))
+draft_poller = DraftPoller(fetch_shared_draft_data, interval=DRAFT_POLL_INTERVAL)
+
+def get_draft_data(draft_id):
+    # Pick lists are shared between requests, callers must not modify them
+    if not DRAFT_POLLER_ENABLED:
+        return draft_cache.get(draft_id)
+
+    draft_poller.watch(draft_id)
+    draft_data = draft_poller.latest(draft_id)
+    if draft_data is None:
+        # First viewer of this draft, fetch it now and hand the result to the poller
+        draft_data = draft_cache.get(draft_id)
+        draft_poller.publish(draft_id, draft_data)
+    return draft_data
+
+def parse_since(value):
+    """The since=pick_no cursor of the draft endpoints, None when it was not given."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    raise ValueError("since must be a pick number")
+
+def draft_cursor(draft_data):
+    return max((pick.get('pick_no') or 0 for pick in draft_data), default=0)
+
+def picks_after(draft_data, since):
+    return [pick for pick in draft_data if (pick.get('pick_no') or 0) > since]
+
+# Running per-draft totals, so each poll only processes the picks made since the last one
+draft_states = DraftStateRegistry()
+
+# Seconds between upstream checks on an open stream, and between keep-alive comments
+STREAM_POLL_INTERVAL = float(os.environ.get('STREAM_POLL_INTERVAL', '2'))
+STREAM_HEARTBEAT_INTERVAL = float(os.environ.get('STREAM_HEARTBEAT_INTERVAL', '15'))
+
+# Each open stream holds a server thread for as long as the client listens, so a worker
+# serves at most this many at once and leaves its other threads to ordinary requests
+MAX_OPEN_STREAMS = int(os.environ.get('MAX_OPEN_STREAMS', '8'))
+open_streams = threading.BoundedSemaphore(MAX_OPEN_STREAMS)
+
+@metrics.timed('draft_state_update')
+def get_draft_state(draft_id, draft_data, reference=None):
+    return draft_states.update(draft_id, draft_data, reference or current_reference())
+
+@metrics.timed('sanitize_data')
 def sanitize_data(data):
     if isinstance(data, dict):
         return {str(sanitize_data(key)): sanitize_data(value) for key, value in data.items()}
@@ -96,53 +222,109 @@ def sanitize_data(data):
         return str(data)
     return data
 
+def json_response(data):
+    """Response with `data` encoded as JSON, or with every number as a string in compatibility mode."""
+    if STRING_NUMBERS or request.args.get('numbers') == 'string':
+        data = sanitize_data(data)
+    with metrics.stage('json_encode'):
+        return Response(dumps(data), mimetype='application/json')
+
+def per_season_cached(cache, snapshot, build):
+    """build(snapshot), memoized per season in `cache` until the season's snapshot changes.
+
+    Seasons the registry has since evicted are dropped, so their snapshots are not kept alive.
+    """
+    cached = cache.get(snapshot.year)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    value = build(snapshot)
+    loaded = season_registry.loaded()
+    for year in list(cache):
+        if year not in loaded:
+            cache.pop(year, None)
+    cache[snapshot.year] = (snapshot, value)
+    return value
+
+# season -> (snapshot, (version, body))
+_reference_payload_cache = {}
+
+def build_reference_payload(snapshot):
+    version = hashlib.sha256(dumps(snapshot.expected_values_records).encode()).hexdigest()[:16]
+    body = dumps({'version': version, 'year': snapshot.year, 'expected_values': snapshot.expected_values_records})
+    return version, body
+
+def get_reference_payload(snapshot):
+    """Version and encoded /reference body of a snapshot, the version being a hash of its expected values."""
+    return per_season_cached(_reference_payload_cache, snapshot, build_reference_payload)
+
+def analytics_key(kind, draft_id, draft_data, reference, *extra):
+    """Shared cache key of a computed payload for the draft as of its current pick count, None without the cache."""
+    if shared_cache is None:
+        return None
+    version = get_reference_payload(reference)[0]
+    return 'analytics:' + dumps([kind, reference.year, version, draft_id, len(draft_data), draft_cursor(draft_data),
+                                 *extra])
+
+def load_analytics(key):
+    return shared_cache.get(key) if key is not None else None
+
+def store_analytics(key, payload):
+    if key is not None:
+        shared_cache.put(key, payload, ANALYTICS_CACHE_TTL)
+
+def to_native(value):
+    # Plain python values so resolutions can be saved as JSON
+    return value.item() if isinstance(value, np.generic) else value
+
+def resolve_player(snapshot, player_name, position):
+    """Auction value and tier for a Sleeper name, plus the reference names they were found under."""
+    auction_values_df = snapshot.auction_values_df
+    positional_rankings = snapshot.positional_rankings
+    mappings_df = snapshot.mappings_df
 
-# Load the player name mappings CSV
-mappings_df = pd.read_csv(MAPPINGS_PATH)
-
-# Convert the mappings to a dictionary for easy lookup
-player_name_mappings = dict(zip(mappings_df['Sleeper Name'], mappings_df['Auction Value Name']))
-
-def get_player_info(player_name, position):
-    logging.debug(f"Looking up info for player: {player_name}, Position: {position}")
-    
     # Initialize default values
+    auction_name = None
+    tier_name = None
     auction_value = 'N/A'
     tier = 'N/A'
 
     # Direct lookup in main datasets first
     auction_value_row = auction_values_df[auction_values_df['Player'] == player_name]
     if not auction_value_row.empty:
+        auction_name = player_name
         auction_value = auction_value_row['Value'].values[0]
-        logging.debug(f"Auction value found directly for {player_name}: {auction_value}")
+        logging.debug("Auction value found directly for %s: %s", player_name, auction_value)
     else:
-        logging.warning(f"No auction value found for {player_name}. Defaulting to $0.")
+        logging.warning("No auction value found for %s. Defaulting to $0.", player_name)
         auction_value = 0
 
     if position in positional_rankings:
         ranking_df = positional_rankings[position]
         tier_row = ranking_df[ranking_df['PLAYER NAME'] == player_name]
         if not tier_row.empty:
+            tier_name = player_name
             tier = tier_row['TIERS'].values[0] if 'TIERS' in ranking_df.columns else 'N/A'
-            logging.debug(f"Correct Tier found directly for {player_name}: {tier}")
+            logging.debug("Correct Tier found directly for %s: %s", player_name, tier)
         else:
-            logging.warning(f"No matching tier found for {player_name} in positional rankings.")
+            logging.warning("No matching tier found for %s in positional rankings.", player_name)
 
     # Check if player name is in mappings (only for anomalies)
     if auction_value == 'N/A' or tier == 'N/A':
         mapped_row = mappings_df[mappings_df['Sleeper Name'] == player_name]
         if not mapped_row.empty:
-            auction_name = mapped_row['Auction Value Name'].values[0]
+            mapped_auction_name = mapped_row['Auction Value Name'].values[0]
             tier_name_key = mapped_row['Tier Name'].values[0]
-            logging.debug(f"Mapping found for anomaly: Auction Name = {auction_name}, Tier Lookup Key = {tier_name_key}")
+            logging.debug("Mapping found for anomaly: Auction Name = %s, Tier Lookup Key = %s", mapped_auction_name, tier_name_key)
 
             # Fetch the auction value using the mapped name
-            auction_value_row = auction_values_df[auction_values_df['Player'] == auction_name]
+            auction_value_row = auction_values_df[auction_values_df['Player'] == mapped_auction_name]
             if not auction_value_row.empty:
+                auction_name = mapped_auction_name
                 auction_value = auction_value_row['Value'].values[0]
-                logging.debug(f"Auction value found for anomaly {auction_name}: {auction_value}")
+                logging.debug("Auction value found for anomaly %s: %s", mapped_auction_name, auction_value)
             else:
-                logging.warning(f"No auction value found for anomaly {auction_name}. Defaulting to $0.")
+                logging.warning("No auction value found for anomaly %s. Defaulting to $0.", mapped_auction_name)
                 auction_value = 0
 
             # Proceed to tier lookup regardless of auction value status
@@ -150,23 +332,160 @@ def get_player_info(player_name, position):
                 ranking_df = positional_rankings[position]
                 tier_row = ranking_df[ranking_df['PLAYER NAME'] == tier_name_key]
                 if not tier_row.empty:
+                    tier_name = tier_name_key
                     tier = tier_row['TIERS'].values[0] if 'TIERS' in ranking_df.columns else 'N/A'
-                    logging.debug(f"Correct Tier found for anomaly {tier_name_key}: {tier}")
+                    logging.debug("Correct Tier found for anomaly %s: %s", tier_name_key, tier)
                 else:
-                    logging.warning(f"No matching tier found for anomaly {tier_name_key} in positional rankings.")
+                    logging.warning("No matching tier found for anomaly %s in positional rankings.", tier_name_key)
+
+    # Names the CSVs spell differently ("Patrick Mahomes II") resolve through the player index
+    if auction_name is None or tier_name is None:
+        record = snapshot.player_index.lookup(player_name, position)
+        if record is not None:
+            logging.debug("Player index resolved %s to %s", player_name, record['Player'])
+            if auction_name is None:
+                auction_value_row = auction_values_df[auction_values_df['Player'] == record['Player']]
+                if not auction_value_row.empty:
+                    auction_name = record['Player']
+                    auction_value = auction_value_row['Value'].values[0]
+            if tier_name is None and record['Tier'] not in (None, 'N/A'):
+                tier_name = record['Ranking Name']
+                tier = record['Tier']
 
     # Fallback to $0 if auction value is still 'N/A'
     if auction_value == 'N/A':
-        logging.warning(f"Unable to determine auction value for {player_name}. Defaulting to $0.")
+        logging.warning("Unable to determine auction value for %s. Defaulting to $0.", player_name)
         auction_value = 0
 
-    return auction_value, tier
+    return {
+        'auction_name': auction_name,
+        'tier_name': tier_name,
+        'value': to_native(auction_value),
+        'tier': to_native(tier),
+    }
+
+# Lookup tables for resolve_players per season, rebuilt when the reference snapshot changes
+_resolve_tables_cache = {}
+
+def get_resolve_tables(snapshot):
+    """Key indexes over the auction values, ranking tiers and mappings, first row per key."""
+    return per_season_cached(_resolve_tables_cache, snapshot, build_resolve_tables)
+
+def build_resolve_tables(snapshot):
+    auction_values = snapshot.auction_values_df[['Player', 'Value']].drop_duplicates('Player')
+
+    tier_names, tier_positions, tier_values = [], [], []
+    for position, ranking_df in snapshot.positional_rankings.items():
+        tier_names.extend(ranking_df['PLAYER NAME'].tolist())
+        tier_positions.extend([position] * len(ranking_df))
+        tier_values.extend(ranking_df['TIERS'].tolist() if 'TIERS' in ranking_df.columns else ['N/A'] * len(ranking_df))
+    tiers = pd.DataFrame({'name': tier_names, 'position': tier_positions, 'tier': pd.Series(tier_values, dtype=object)})
+    tiers = tiers.drop_duplicates(['name', 'position'])
+
+    mappings = snapshot.mappings_df[['Sleeper Name', 'Auction Value Name', 'Tier Name']].drop_duplicates('Sleeper Name')
 
+    return {
+        'auction_index': pd.Index(auction_values['Player']),
+        'auction_values': auction_values['Value'].to_numpy(dtype=object),
+        'auction_values_by_name': dict(zip(auction_values['Player'], auction_values['Value'])),
+        'tier_index': pd.MultiIndex.from_frame(tiers[['name', 'position']]),
+        'tier_names': tiers['name'].to_numpy(dtype=object),
+        'tiers': tiers['tier'].to_numpy(dtype=object),
+        'mapping_index': pd.Index(mappings['Sleeper Name']),
+        'mapping_auction_names': mappings['Auction Value Name'].to_numpy(dtype=object),
+        'mapping_tier_names': mappings['Tier Name'].to_numpy(dtype=object),
+    }
+
+@metrics.timed('resolve_players')
+def resolve_players(snapshot, players):
+    """resolve_player for a list of (player_name, position) pairs, using index joins instead of per-player filters."""
+    if not players:
+        return []
+
+    tables = get_resolve_tables(snapshot)
+    player_names = np.array([player_name for player_name, _ in players], dtype=object)
+    positions = np.array([position for _, position in players], dtype=object)
+    nothing = np.full(len(players), None, dtype=object)
+
+    # Direct lookups in the main datasets
+    found = tables['auction_index'].get_indexer(player_names)
+    auction_names = np.where(found >= 0, player_names, nothing)
+    values = np.where(found >= 0, tables['auction_values'][found], 0)
+
+    found = tables['tier_index'].get_indexer(pd.MultiIndex.from_arrays([player_names, positions]))
+    tier_names = np.where(found >= 0, tables['tier_names'][found], nothing)
+    tiers = np.where(found >= 0, tables['tiers'][found], 'N/A').astype(object)
+
+    # Mapping anomalies, only for players whose tier was not found directly
+    anomalies = np.flatnonzero(found < 0)
+    mapped = tables['mapping_index'].get_indexer(player_names[anomalies])
+    anomalies, mapped = anomalies[mapped >= 0], mapped[mapped >= 0]
+    if len(anomalies):
+        mapped_auction_names = tables['mapping_auction_names'][mapped]
+        found = tables['auction_index'].get_indexer(mapped_auction_names)
+        values[anomalies] = np.where(found >= 0, tables['auction_values'][found], 0)
+        auction_names[anomalies] = np.where(found >= 0, mapped_auction_names, auction_names[anomalies])
+
+        mapped_tier_names = tables['mapping_tier_names'][mapped]
+        found = tables['tier_index'].get_indexer(pd.MultiIndex.from_arrays([mapped_tier_names, positions[anomalies]]))
+        tier_names[anomalies] = np.where(found >= 0, mapped_tier_names, tier_names[anomalies])
+        tiers[anomalies] = np.where(found >= 0, tables['tiers'][found], tiers[anomalies])
+
+    # Whatever is left goes through the player index, a handful of dict probes per player
+    auction_values_by_name = tables['auction_values_by_name']
+    entries = []
+    for player_name, position, auction_name, value, tier_name, tier in zip(
+            player_names, positions, auction_names, values, tier_names, tiers):
+        if auction_name is None or tier_name is None:
+            record = snapshot.player_index.lookup(player_name, position)
+            if record is not None:
+                if auction_name is None and record['Player'] in auction_values_by_name:
+                    auction_name = record['Player']
+                    value = auction_values_by_name[auction_name]
+                if tier_name is None and record['Tier'] not in (None, 'N/A'):
+                    tier_name = record['Ranking Name']
+                    tier = record['Tier']
+        entries.append({
+            'auction_name': auction_name,
+            'tier_name': tier_name,
+            'value': to_native(value),
+            'tier': to_native(tier),
+        })
 
+    unresolved = sum(entry['auction_name'] is None for entry in entries)
+    logging.debug("Resolved %d players in one batch, %d without an auction value", len(entries), unresolved)
+    return entries
+
+# Resolutions keyed by Sleeper player_id, saved per season and dropped when the reference data changes
+PLAYER_CACHE_DIR = os.environ.get('PLAYER_CACHE_DIR', os.path.join(BASE_DIR, 'cache'))
+player_resolution_cache = PlayerResolutionCache(PLAYER_CACHE_DIR, resolve_player)
+player_resolution_cache.warm(reference_store.current)
+
+def get_player_info(player_name, position, player_id=None):
+    logging.debug("Looking up info for player: %s, Position: %s", player_name, position)
+    snapshot = current_reference()
+    if player_id:
+        entry = player_resolution_cache.get(snapshot, player_id, player_name, position)
+    else:
+        entry = resolve_player(snapshot, player_name, position)
+    return entry['value'], entry['tier']
+
+def get_players_info(players):
+    """get_player_info for many (player_name, position, player_id) triples at once."""
+    snapshot = current_reference()
+    entries = player_resolution_cache.get_many(snapshot, [player_id for _, _, player_id in players])
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    resolved = resolve_players(snapshot, [players[i][:2] for i in missing])
+    for i, entry in zip(missing, resolved):
+        entries[i] = entry
+    player_resolution_cache.put_many(snapshot, {players[i][2]: entry for i, entry in zip(missing, resolved)
+                                                if players[i][2]})
+    return [(entry['value'], entry['tier']) for entry in entries]
+
+
+@metrics.timed('map_players_to_ev_data')
 def map_players_to_ev_data(draft_data):
-    # Merge player data with auction values data
-    all_data = pd.concat([positional_rankings['QB'], positional_rankings['RB'], positional_rankings['WR'], positional_rankings['TE']], ignore_index=True)
-    merged_data = pd.merge(all_data, auction_values_df, left_on='PLAYER NAME', right_on='Player', how='left')
+    player_index = current_reference().player_index
 
     # Collect logs to print once per player
     consolidated_logs = []
@@ -174,28 +493,27 @@ def map_players_to_ev_data(draft_data):
     # Initialize lists for unmatched players and fuzzy matches
     unmatched_players = []
     fuzzy_matches = []
+    mapped_data = []
 
     for player in draft_data:
-        player_name = player['metadata']['first_name'] + ' ' + player['metadata']['last_name']
-        position = player['metadata']['position']
-        matched_row = merged_data[merged_data['PLAYER NAME'] == player_name]
-
-        # CSV Lookup or Fuzzy Matching
-        if matched_row.empty:
-            auction_name, tier_name = get_player_info(player_name, position)
-            if auction_name:
-                consolidated_logs.append(f"Lookup used for player: {player_name} -> {auction_name}")
-                matched_row = merged_data[merged_data['PLAYER NAME'] == auction_name]
+        player_name = pick_player_name(player)
+        record = player_index.lookup_pick(player)
+
+        # Annotate a copy, the pick itself may be shared through the draft cache
+        player = dict(player)
+        mapped_data.append(player)
+
+        # Log the results
+        if record is not None:
+            if record['Ranking Name'] != player_name:
+                consolidated_logs.append(f"Lookup used for player: {player_name} -> {record['Ranking Name']}")
                 fuzzy_matches.append({
                     'Original Name': player_name,
-                    'Best Match': auction_name,
+                    'Best Match': record['Ranking Name'],
                     'Similarity Score': 100  # Assuming direct match in this case
                 })
-
-        # Log the results
-        if not matched_row.empty:
-            player['Value'] = matched_row['Value'].values[0]
-            player['Tier'] = matched_row['TIERS'].values[0] if 'TIERS' in merged_data.columns else 'N/A'
+            player['Value'] = record['Value']
+            player['Tier'] = record['Tier'] if record['Tier'] is not None else 'N/A'
             consolidated_logs.append(f"Matched player: {player_name} with Value: {player['Value']} and Tier: {player['Tier']}")
         else:
             unmatched_players.append(player_name)
@@ -204,24 +522,42 @@ def map_players_to_ev_data(draft_data):
             player['Tier'] = 'N/A'
 
     # Print consolidated logs only once per player
-    for log in consolidated_logs:
-        logging.debug(log)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        for log in consolidated_logs:
+            logging.debug(log)
+
+    return mapped_data, unmatched_players, fuzzy_matches
+
+# Most recently built index, reused while callers keep passing the same expected values frame
+_player_index_cache = (None, None)
 
-    return draft_data, unmatched_players, fuzzy_matches
+def get_player_index(expected_values):
+    global _player_index_cache
+    snapshot = current_reference()
+    if snapshot.expected_values is expected_values:
+        return snapshot.player_index
+
+    cached_frame, cached_index = _player_index_cache
+    if cached_frame is expected_values:
+        return cached_index
+
+    player_index = PlayerIndex(expected_values)
+    _player_index_cache = (expected_values, player_index)
+    return player_index
 
 def get_picks_per_tier(draft_data, expected_values):
     picks_per_tier = {"QB": {}, "RB": {}, "WR": {}, "TE": {}}
+    player_index = get_player_index(expected_values)
 
     for player in draft_data:
-        player_full_name = f"{player['metadata']['first_name']} {player['metadata']['last_name']}"
         player_position = player["metadata"]["position"]
-        player_tier = expected_values.loc[expected_values["Player"] == player_full_name, "Tier"]
 
         if player_position in ["K", "DEF"]:
             continue
 
-        if not player_tier.empty:
-            tier = player_tier.values[0]
+        record = player_index.lookup_pick(player)
+        if record is not None and record['Tier'] is not None:
+            tier = record['Tier']
             if tier in picks_per_tier[player_position]:
                 picks_per_tier[player_position][tier] += 1
             else:
@@ -229,118 +565,37 @@ def get_picks_per_tier(draft_data, expected_values):
 
     return picks_per_tier
 
-def get_avg_tier_cost(draft_data, expected_values):
-    avg_tier_costs = {}
-    
-    for position in ["QB", "RB", "WR", "TE"]:
-        pos_data = expected_values[expected_values["Position"] == position]
-
-        for tier in pos_data["Tier"].unique():
-            tier_data = pos_data[pos_data["Tier"] == tier]
-            avg_cost = tier_data["Value"].mean()
-            avg_tier_costs[(position, tier)] = avg_cost
-
-    return avg_tier_costs
-
+@metrics.timed('calculate_inflation_rates')
 def calculate_inflation_rates(draft_data):
-    rankings = {
-        "QB": pd.read_csv(os.path.join(LATEST_DATA_DIR, csv_filenames['QB'])),
-        "RB": pd.read_csv(os.path.join(LATEST_DATA_DIR, csv_filenames['RB'])),
-        "WR": pd.read_csv(os.path.join(LATEST_DATA_DIR, csv_filenames['WR'])),
-        "TE": pd.read_csv(os.path.join(LATEST_DATA_DIR, csv_filenames['TE']))
-    }
-
-    auction_values_data = pd.read_csv(EXPECTED_VALUES_PATH)
-    auction_values_data['Value'] = pd.to_numeric(auction_values_data['Value'].str.replace('$', ''), errors='coerce').fillna(0)
-
-    # Merge rankings with auction values
-    all_rankings = pd.concat(rankings.values(), ignore_index=True)
-    expected_values = pd.merge(all_rankings, auction_values_data, left_on='PLAYER NAME', right_on='Player', how='left')
-
-    # Ensure the 'Tier' column is consistent
-    if 'TIERS' in expected_values.columns:
-        expected_values.rename(columns={'TIERS': 'Tier'}, inplace=True)
+    snapshot = current_reference()
+    expected_values = snapshot.expected_values
 
     if 'Tier' not in expected_values.columns:
         logging.error("The 'Tier' column is missing from the expected values data.")
         return {"overall": 0, "positional": {}, "positional_tiered": {}}, expected_values
 
-    total_spent = sum([int(player["metadata"]["amount"]) for player in draft_data if player["metadata"]["position"] not in ['K', 'DEF']])
-    total_value = sum(
-        expected_values.loc[expected_values["Player"] == (player["metadata"]["first_name"] + " " + player["metadata"]["last_name"]), "Value"].fillna(0).sum() 
-        for player in draft_data
-    )
-
-    inflation = (total_spent - total_value) / total_value if total_value != 0 else 0
-    positional_inflation = {}
-    positional_tier_inflation = {}
-    
-    # Call the function to calculate average tier costs
-    avg_tier_costs = get_avg_tier_cost(draft_data, expected_values)
-
-    # Include tier and value in the expected_values
-    expected_values['Tier'] = expected_values['Tier'].fillna('N/A')
-    expected_values['Value'] = expected_values['Value'].fillna(0)
-
-    for position in ["QB", "RB", "WR", "TE"]:
-        pos_players = [player for player in draft_data if player["metadata"]["position"] == position]
-        pos_spent = sum([int(player["metadata"]["amount"]) for player in pos_players])
-
-        pos_values = sum([
-            expected_values.loc[
-                expected_values["Player"] == player["metadata"]["first_name"] + " " + player["metadata"]["last_name"],
-                "Value"
-            ].fillna(0).sum() for player in pos_players
-        ])
-
-        positional_inflation[position] = (pos_spent - pos_values) / pos_values if pos_values != 0 else 0
-
-        for tier in range(1, 11):  # Assuming TIER_COUNT is 10
-            tier_players = [
-                player for player in pos_players 
-                if not expected_values.loc[expected_values["Player"] == player["metadata"]["first_name"] + " " + player["metadata"]["last_name"], "Tier"].empty and 
-                expected_values.loc[expected_values["Player"] == player["metadata"]["first_name"] + " " + player["metadata"]["last_name"], "Tier"].values[0] == tier
-            ]
-            tier_spent = sum([int(player["metadata"]["amount"]) for player in tier_players])
-            tier_value = sum(
-                np.nan_to_num(
-                    pd.to_numeric(
-                        expected_values.loc[
-                            expected_values["Player"] == player["metadata"]["first_name"] + " " + player["metadata"]["last_name"], 
-                            "Value"
-                        ].values,
-                        errors='coerce'
-                    )
-                )
-                for player in tier_players
-            )
-
-            positional_tier_inflation[position] = positional_tier_inflation.get(position, {})
-            positional_tier_inflation[position][tier] = (tier_spent - tier_value) / tier_value if tier_value != 0 else 0
+    # Join the picks to the expected values once and aggregate every tier in one grouped pass
+    picks = build_picks_frame(draft_data, snapshot.player_index)
+    inflation_rates = calculate_inflation(picks, snapshot.tiers_by_position)
 
     return {
-        "overall": inflation,
-        "positional": positional_inflation,
-        "positional_tiered": positional_tier_inflation,
-        "avg_tier_costs": avg_tier_costs,
-        "expected_values": expected_values.to_dict(orient='records')  # Include expected values in the response
+        "overall": inflation_rates["overall"],
+        "positional": inflation_rates["positional"],
+        "positional_tiered": inflation_rates["positional_tiered"],
+        "avg_tier_costs": snapshot.avg_tier_costs,
+        "expected_values": snapshot.expected_values_records  # Include expected values in the response
     }, expected_values
 
-def calculate_r2_by_position(draft_data):
+R2_POSITIONS = ["QB", "RB", "WR", "TE"]
+
+def r2_values_from_curves(curves):
+    """R^2 of price against pick number per position, and the cost of waiting derived from it."""
     position_r2 = {}
 
-    for position in ["QB", "RB", "WR", "TE"]:
-        x = [pick["pick_no"] for pick in draft_data if pick["metadata"]["position"] == position]
-        y = [int(pick["metadata"]["amount"]) for pick in draft_data if pick["metadata"]["position"] == position]
-        
-        if len(x) > 1 and len(set(x)) > 1:
-            x = np.array(x).reshape((-1, 1))
-            y = np.array(y)
-
-            model = LinearRegression().fit(x, y)
-            y_pred = model.predict(x)
-            
-            r2_value = r2_score(y, y_pred)
+    for position in R2_POSITIONS:
+        fit = curves.fit(position)
+        if fit is not None:
+            r2_value = fit['r2']
             position_r2[position] = {
                 "r2": r2_value,
                 "cost_of_waiting": {
@@ -363,24 +618,31 @@ def calculate_r2_by_position(draft_data):
 
     return position_r2
 
+@metrics.timed('calculate_r2_by_position')
+def calculate_r2_by_position(draft_data):
+    curves = price_curves((pick["metadata"]["position"], None, pick["pick_no"], int(pick["metadata"]["amount"]))
+                          for pick in draft_data)
+    return r2_values_from_curves(curves)
+
+def frame_price_curves(picks):
+    """Price curves of a picks frame, with a curve per tier for the resolved picks."""
+    tiers = [None if pd.isna(tier) else tier for tier in picks['tier'].tolist()]
+    pick_nos = [None if pd.isna(pick_no) else pick_no for pick_no in picks['pick_no'].tolist()]
+    return price_curves(zip(picks['position'].tolist(), tiers, pick_nos, picks['amount'].tolist()))
+
+@metrics.timed('calculate_doe_values')
 def calculate_doe_values(draft_data, expected_values, positional_tier_inflation):
     doe_values = {}
     player_counts = {}
+    player_index = get_player_index(expected_values)
 
     for player in draft_data:
-        player_name = f"{player['metadata']['first_name']} {player['metadata']['last_name']}"
         player_position = player["metadata"]["position"]
         amount_paid = int(player["metadata"]["amount"])
-        
-        expected_value = expected_values.loc[
-            expected_values["Player"] == player_name, "Value"
-        ].fillna(0).sum()
 
-        tier = expected_values.loc[
-            expected_values["Player"] == player_name, "Tier"
-        ].values[0] if not expected_values.loc[
-            expected_values["Player"] == player_name, "Tier"
-        ].empty else None
+        record = player_index.lookup_pick(player)
+        expected_value = record['Value'] if record is not None else 0
+        tier = record['Tier'] if record is not None else None
 
         if expected_value > 0:
             doe = amount_paid - expected_value
@@ -407,21 +669,18 @@ def calculate_doe_values(draft_data, expected_values, positional_tier_inflation)
     return doe_values
 
 
-def calculate_avg_tier_costs(expected_values):
+def calculate_avg_tier_costs(snapshot):
+    """The snapshot's average value per (position, tier), nested by position and in tier order for responses."""
     avg_tier_costs = {}
-
-    grouped = expected_values.groupby(['Position', 'Tier'])['Value'].mean().reset_index()
-
-    for _, row in grouped.iterrows():
-        position, tier, avg_cost = row['Position'], row['Tier'], row['Value']
-        if position not in avg_tier_costs:
-            avg_tier_costs[position] = {}
-        avg_tier_costs[position][tier] = avg_cost
-
+    for position, tier in sorted(snapshot.avg_tier_costs, key=lambda key: (key[0], tier_sort_key(to_native(key[1])))):
+        if not pd.isna(tier):
+            avg_tier_costs.setdefault(position, {})[to_native(tier)] = snapshot.avg_tier_costs[(position, tier)]
     return avg_tier_costs
 
+@metrics.timed('calculate_team_strengths_and_needs')
 def calculate_team_strengths_and_needs_by_tier(team_data, expected_values):
     strengths_and_needs = {}
+    player_index = get_player_index(expected_values)
 
     for team, data in team_data.items():
         strengths_and_needs[team] = {}
@@ -429,9 +688,9 @@ def calculate_team_strengths_and_needs_by_tier(team_data, expected_values):
         for player in data['starters']:
             player_name = player['name']
             position = player['position']
-            tier = expected_values.loc[expected_values["Player"] == player_name, "Tier"]
-            if not tier.empty:
-                tier_value = tier.values[0]
+            record = player_index.lookup(player_name, position)
+            if record is not None and record['Tier'] is not None:
+                tier_value = record['Tier']
                 # Classify the tier
                 if tier_value in [1, 2]:
                     strengths_and_needs[team][position] = 'Strong'
@@ -444,6 +703,7 @@ def calculate_team_strengths_and_needs_by_tier(team_data, expected_values):
 
     return strengths_and_needs
 
+@metrics.timed('process_team_breakdown')
 def process_team_breakdown(draft_data):
     team_data = {}
 
@@ -514,6 +774,11 @@ def team_breakdown():
     draft_id = request.args.get('draft_id')
     if not draft_id:
         return jsonify({"error": "Draft ID is required"}), 400
+
+    try:
+        since = parse_since(request.args.get('since'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     try:
         draft_data = get_draft_data(draft_id)
@@ -521,7 +786,13 @@ def team_breakdown():
             return jsonify({"error": "No draft data found"}), 404
         
         # Retrieve the auction values with expected tiers
-        _, expected_values = calculate_inflation_rates(draft_data)
+        expected_values = current_reference().expected_values
+
+        # With ?since= only the teams that made a pick after the cursor are sent
+        cursor = draft_cursor(draft_data)
+        if since is not None and cursor >= since:
+            slots = {pick['draft_slot'] for pick in picks_after(draft_data, since)}
+            draft_data = [pick for pick in draft_data if pick['draft_slot'] in slots]
         
         # Process team breakdown
         team_data = process_team_breakdown(draft_data)
@@ -533,18 +804,20 @@ def team_breakdown():
         for team, data in team_data.items():
             data['strengths_and_needs'] = strengths_and_needs.get(team, {})
 
+        if since is not None:
+            return jsonify({"cursor": cursor, "reset": cursor < since, "teams": team_data})
         return jsonify(team_data)
 
     except KeyError as e:
-        logging.error(f"KeyError: Missing key in draft data - {e}")
+        logging.error("KeyError: Missing key in draft data - %s", e)
         return jsonify({"error": f"KeyError: Missing key in draft data - {e}"}), 500
 
     except ValueError as e:
-        logging.error(f"ValueError: Invalid data format - {e}")
+        logging.error("ValueError: Invalid data format - %s", e)
         return jsonify({"error": f"ValueError: Invalid data format - {e}"}), 500
 
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}", exc_info=True)
+        logging.error("An unexpected error occurred: %s", e, exc_info=True)
         return jsonify({"error": "An unexpected error occurred"}), 500
 
 @app.route('/scatter_data', methods=['GET'])
@@ -554,11 +827,28 @@ def scatter_data():
         if not draft_id:
             return jsonify({"error": "Draft ID is required"}), 400
 
+        try:
+            since = parse_since(request.args.get('since'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         draft_data = get_draft_data(draft_id)
         if not draft_data:
             return jsonify({"error": "No draft data found"}), 404
 
-        draft_data, unmatched_players, fuzzy_matches = map_players_to_ev_data(draft_data)
+        # With ?since= only the points of later picks are resolved and sent, numbered by their place in the draft
+        cursor = draft_cursor(draft_data)
+        reset = since is not None and cursor < since
+        numbered = [(index + 1, pick) for index, pick in enumerate(draft_data)
+                    if since is None or reset or (pick.get('pick_no') or 0) > since]
+
+        # The regressions are kept up to date pick by pick in the draft's running state
+        state = get_draft_state(draft_id, draft_data)
+        with state.lock:
+            r2_values = r2_values_from_curves(state.price_curves) if numbered else None
+            trend_lines = state.price_curves.trend_lines(R2_POSITIONS) if numbered else None
+
+        mapped_data, unmatched_players, fuzzy_matches = map_players_to_ev_data([pick for _, pick in numbered])
 
         scatter_data = {
             "pick_no": [],
@@ -568,14 +858,14 @@ def scatter_data():
             "expected_values": []
         }
 
-        for index, player in enumerate(draft_data):
+        for (pick_no, _), player in zip(numbered, mapped_data):
             player_name = player['metadata']['first_name'] + ' ' + player['metadata']['last_name']
             expected_value = player['Value']
 
             if pd.isna(expected_value):
                 expected_value = "$0"
 
-            scatter_data["pick_no"].append(index + 1)
+            scatter_data["pick_no"].append(pick_no)
             scatter_data["metadata_amount"].append(int(player['metadata']['amount']))
             player_position = player['metadata']['position']
             color = POSITION_COLORS.get(player_position, "gray")
@@ -583,60 +873,23 @@ def scatter_data():
             scatter_data["player_names"].append(player_name)
             scatter_data["expected_values"].append(expected_value)
 
-        r2_values = calculate_r2_by_position(draft_data)
-
         response_data = {
             "scatterplot": scatter_data,
-            "r2_values": r2_values
+            "r2_values": r2_values,
+            "trend_lines": trend_lines,
         }
-
-        logging.debug(f"Scatter data response: {response_data}")
+        if since is not None:
+            response_data["cursor"] = cursor
+            response_data["reset"] = reset
+            if r2_values is None:
+                del response_data["r2_values"]
+                del response_data["trend_lines"]
+
+        logging.debug("Scatter data response: %s", response_data)
         return jsonify(response_data)
     except Exception as e:
-        logging.error(f"Error processing scatter data request: {e}", exc_info=True)
+        logging.error("Error processing scatter data request: %s", e, exc_info=True)
         return jsonify({"error": "Internal Server Error"}), 500
-    draft_id = request.args.get('draft_id')
-    if not draft_id:
-        return jsonify({"error": "Draft ID is required"}), 400
-
-    draft_data = get_draft_data(draft_id)
-    if not draft_data:
-        return jsonify({"error": "No draft data found"}), 404
-
-    draft_data, unmatched_players, fuzzy_matches = map_players_to_ev_data(draft_data)
-
-    scatter_data = {
-        "pick_no": [],
-        "metadata_amount": [],
-        "colors": [],
-        "player_names": [],
-        "expected_values": []
-    }
-
-    for index, player in enumerate(draft_data):
-        player_name = player['metadata']['first_name'] + ' ' + player['metadata']['last_name']
-        expected_value = player['Value']
-
-        if pd.isna(expected_value):
-            expected_value = "$0"
-
-        scatter_data["pick_no"].append(index + 1)
-        scatter_data["metadata_amount"].append(int(player['metadata']['amount']))
-        player_position = player['metadata']['position']
-        color = POSITION_COLORS.get(player_position, "gray")
-        scatter_data["colors"].append(color)
-        scatter_data["player_names"].append(player_name)
-        scatter_data["expected_values"].append(expected_value)
-
-    r2_values = calculate_r2_by_position(draft_data)
-
-    response_data = {
-        "scatterplot": scatter_data,
-        "r2_values": r2_values
-    }
-
-    logging.debug(f"Scatter data response: {response_data}")
-    return jsonify(response_data)
 
 @app.route('/picks', methods=['GET'])
 def get_picks():
@@ -644,11 +897,22 @@ def get_picks():
     if not draft_id:
         return jsonify({"error": "Draft ID is required"}), 400
 
+    try:
+        since = parse_since(request.args.get('since'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     draft_data = get_draft_data(draft_id)
     if not draft_data:
         return jsonify({"error": "No draft data found"}), 404
 
-    return jsonify(draft_data)
+    if since is None:
+        return jsonify(draft_data)
+
+    # Only the picks after the client's cursor, or all of them if the draft went back below it
+    cursor = draft_cursor(draft_data)
+    reset = cursor < since
+    return jsonify({"cursor": cursor, "reset": reset, "picks": draft_data if reset else picks_after(draft_data, since)})
 
 
 def convert_to_serializable(obj):
@@ -664,27 +928,22 @@ def convert_to_serializable(obj):
 def player_lookup():
     try:
         players = request.json.get('players', [])
-        results = []
-        for player in players:
-            player_name = f"{player['first_name']} {player['last_name']}"
-            position = player['position']
-            
-            # Call get_player_info with the correct arguments
-            auction_value, tier = get_player_info(player_name, position)
-            
-            # Convert data to serializable types
-            auction_value = convert_to_serializable(auction_value)
-            tier = convert_to_serializable(tier)
-            
-            results.append({
-                'player_name': player_name,
-                'auction_value': auction_value,
-                'tier': tier
-            })
-        
+        player_names = [f"{player['first_name']} {player['last_name']}" for player in players]
+
+        # Resolve the whole list in one batch
+        player_info = get_players_info([(player_name, player['position'], player.get('player_id'))
+                                        for player_name, player in zip(player_names, players)])
+
+        results = [{
+            'player_name': player_name,
+            'auction_value': auction_value,
+            'tier': tier
+        } for player_name, (auction_value, tier) in zip(player_names, player_info)]
+
+        player_resolution_cache.save()
         return jsonify(results)
     except Exception as e:
-        logging.error(f"Error processing player lookup: {str(e)}")
+        logging.error("Error processing player lookup: %s", e)
         return jsonify({"error": "An error occurred while processing the request"}), 500
     
 @app.route('/inflation', methods=['GET', 'POST'])
@@ -692,31 +951,61 @@ def get_inflation_rate():
     if request.method == 'POST':
         data = request.get_json()  # This will parse the incoming JSON data
         draft_id = data.get('draft_id')  # Extract 'draft_id' from JSON
+        since = data.get('since', request.args.get('since'))
     elif request.method == 'GET':
         draft_id = request.args.get('draft_id')
+        since = request.args.get('since')
 
     if not draft_id:
         return jsonify({"error": "Draft ID is required"}), 400
 
+    try:
+        since = parse_since(since)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     try:
         draft_data = get_draft_data(draft_id)
         if not draft_data:
             return jsonify({"error": "No draft data found"}), 404
 
-        # Calculate inflation rates and expected values
-        inflation_rates, expected_values = calculate_inflation_rates(draft_data)
+        # Another worker may already have computed the draft at this pick count
+        key = analytics_key('inflation', draft_id, draft_data, current_reference()) if since is None else None
+        cached = load_analytics(key)
+        if cached is not None:
+            return json_response(cached)
+
+        # Apply the new picks to the draft's running totals
+        state = get_draft_state(draft_id, draft_data)
+        with state.lock:
+            changes = state.changes_since(since) if since is not None else None
+            if changes is None:
+                inflation_rates = state.inflation()
+                picks_per_tier = state.picks_per_tier()
+                doe_values = state.doe_values()
+            cursor = state.last_pick_no
+        reference_version = get_reference_payload(state.reference)[0]
+
+        if changes is not None:
+            # Only the figures moved by picks after the client's cursor, to be merged into what it has
+            response_data = {
+                'cursor': cursor,
+                'positional_inflation': changes['inflation']['positional'],
+                'tiered_inflation': changes['inflation']['positional_tiered'],
+                'picks_per_tier': changes['picks_per_tier'],
+                'total_picks': changes['total_picks'],
+                'doe_values': changes['doe_values'],
+                'reference_version': reference_version,
+            }
+            if 'overall' in changes['inflation']:
+                response_data['overall_inflation'] = changes['inflation']['overall']
+            return json_response(response_data)
 
-        # Calculate picks per tier
-        picks_per_tier = get_picks_per_tier(draft_data, expected_values)
-        
         # Calculate total picks per position
         total_picks = {pos: sum(tier_counts.values()) for pos, tier_counts in picks_per_tier.items()}
 
-        # Calculate average tier costs
-        avg_tier_costs = calculate_avg_tier_costs(expected_values)
-
-        # Calculate DOE values
-        doe_values = calculate_doe_values(draft_data, expected_values, inflation_rates.get('positional_tiered', {}))
+        # Average tier costs only depend on the reference data and were computed when it was loaded
+        avg_tier_costs = calculate_avg_tier_costs(state.reference)
 
         # Prepare response data
         response_data = {
@@ -727,22 +1016,590 @@ def get_inflation_rate():
             'total_picks': total_picks,
             'avg_tier_costs': avg_tier_costs,
             'doe_values': doe_values,
-            'expected_values': inflation_rates['expected_values'],  # Include expected values in the response
+            # The expected values themselves are served by /reference, clients refetch them when this changes
+            'reference_version': reference_version,
+            'cursor': cursor,
         }
+        if since is not None:
+            # The draft went back below the client's cursor, it has to replace what it has
+            response_data['reset'] = True
 
-        # Sanitize the response data
-        response_data = sanitize_data(response_data)
-        logging.debug(f"Inflation data response (JSON): {response_data}")
-        return jsonify(response_data)
+        logging.debug("Inflation data response (JSON): %s", response_data)
+        store_analytics(key, response_data)
+        return json_response(response_data)
         
     except Exception as e:
-        logging.error(f"Error processing draft ID {draft_id}: {e}", exc_info=True)
+        logging.error("Error processing draft ID %s: %s", draft_id, e, exc_info=True)
+        return jsonify({"error": "An error occurred while processing the request"}), 500
+
+# Drafts fetched and computed at once by /inflation/batch, and the most one call may ask for
+BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', '8'))
+BATCH_MAX_DRAFTS = int(os.environ.get('BATCH_MAX_DRAFTS', '500'))
+
+@metrics.timed('calculate_draft_inflation')
+def calculate_draft_inflation(draft_id, reference):
+    """Resolve one draft's picks and return the frame with its inflation and DOE."""
+    draft_data = draft_cache.get(draft_id)
+    if not draft_data:
+        raise LookupError("No draft data found")
+
+    picks = build_picks_frame(draft_data, reference.player_index)
+    return picks, {
+        'pick_count': len(draft_data),
+        'inflation': calculate_inflation(picks, reference.tiers_by_position),
+        'doe_values': calculate_doe(picks),
+    }
+
+def stream_batch_inflation(draft_ids, reference):
+    """Yield one NDJSON line per draft as it completes, then the aggregate over all of them."""
+    frames = []
+    failed = 0
+    with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(draft_ids))) as executor:
+        futures = {executor.submit(calculate_draft_inflation, draft_id, reference): draft_id for draft_id in draft_ids}
+        try:
+            for future in as_completed(futures):
+                draft_id = futures[future]
+                try:
+                    picks, result = future.result()
+                except LookupError as e:
+                    failed += 1
+                    yield dumps({'draft_id': draft_id, 'error': str(e)}) + '\n'
+                    continue
+                except Exception as e:
+                    logging.error("Error processing draft ID %s in batch: %s", draft_id, e, exc_info=True)
+                    failed += 1
+                    yield dumps({'draft_id': draft_id, 'error': "An error occurred while processing the draft"}) + '\n'
+                    continue
+
+                frames.append(picks)
+                yield dumps({'draft_id': draft_id, **result}) + '\n'
+        finally:
+            # Stop queued work if the client went away before the batch finished
+            for future in futures:
+                future.cancel()
+
+    aggregate = None
+    if frames:
+        picks = pd.concat(frames, ignore_index=True)
+        aggregate = {
+            'pick_count': len(picks),
+            'inflation': calculate_inflation(picks, reference.tiers_by_position),
+            'doe_values': calculate_doe(picks),
+        }
+    yield dumps({'aggregate': aggregate, 'succeeded': len(frames), 'failed': failed}) + '\n'
+
+def parse_draft_ids(data):
+    """Unique draft IDs from a `{"draft_ids": [...]}` body, or an error message."""
+    draft_ids = (data or {}).get('draft_ids')
+    if not isinstance(draft_ids, list):
+        return None, "draft_ids must be a non-empty list"
+
+    # Same draft asked for twice is only processed once
+    draft_ids = list(dict.fromkeys(str(draft_id) for draft_id in draft_ids if draft_id not in (None, '')))
+    if not draft_ids:
+        return None, "draft_ids must be a non-empty list"
+    if len(draft_ids) > BATCH_MAX_DRAFTS:
+        return None, f"At most {BATCH_MAX_DRAFTS} drafts per batch"
+    return draft_ids, None
+
+@app.route('/inflation/batch', methods=['POST'])
+def get_batch_inflation():
+    draft_ids, error = parse_draft_ids(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+
+    return Response(stream_batch_inflation(draft_ids, current_reference()), mimetype='application/x-ndjson')
+
+# Sections /draft_snapshot can return, selectable with ?include=
+DRAFT_SNAPSHOT_SECTIONS = ['inflation', 'picks_per_tier', 'doe_values', 'avg_tier_costs',
+                           'scatterplot', 'r2_values', 'team_breakdown']
+
+@metrics.timed('build_draft_snapshot')
+def build_draft_snapshot(draft_data, sections=DRAFT_SNAPSHOT_SECTIONS, state=None):
+    """All requested dashboard sections for one draft.
+
+    With a draft state the aggregates come from its running totals; without one
+    every pick is resolved once into a picks frame and aggregated from that.
+    """
+    if state is not None:
+        reference = state.reference
+        with state.lock:
+            picks = state.picks_frame()
+            inflation = state.inflation() if 'inflation' in sections else None
+            picks_per_tier = state.picks_per_tier() if 'picks_per_tier' in sections else None
+            doe_values = state.doe_values() if 'doe_values' in sections else None
+            r2_values = r2_values_from_curves(state.price_curves) if 'r2_values' in sections else None
+            trend_lines = state.price_curves.trend_lines(R2_POSITIONS) if 'scatterplot' in sections else None
+    else:
+        reference = current_reference()
+        picks = build_picks_frame(draft_data, reference.player_index)
+        inflation = calculate_inflation(picks, reference.tiers_by_position) if 'inflation' in sections else None
+        picks_per_tier = count_picks_per_tier(picks) if 'picks_per_tier' in sections else None
+        doe_values = calculate_doe(picks) if 'doe_values' in sections else None
+        curves = frame_price_curves(picks)
+        r2_values = r2_values_from_curves(curves) if 'r2_values' in sections else None
+        trend_lines = curves.trend_lines(R2_POSITIONS) if 'scatterplot' in sections else None
+
+    result = {'pick_count': len(draft_data)}
+
+    if 'inflation' in sections:
+        result['inflation'] = inflation
+
+    if 'picks_per_tier' in sections:
+        result['picks_per_tier'] = picks_per_tier
+        result['total_picks'] = {pos: sum(tier_counts.values()) for pos, tier_counts in picks_per_tier.items()}
+
+    if 'doe_values' in sections:
+        result['doe_values'] = doe_values
+
+    if 'avg_tier_costs' in sections:
+        result['avg_tier_costs'] = calculate_avg_tier_costs(reference)
+
+    if 'scatterplot' in sections:
+        result['scatterplot'] = build_scatter_series(picks, POSITION_COLORS)
+        result['trend_lines'] = trend_lines
+
+    if 'r2_values' in sections:
+        result['r2_values'] = r2_values
+
+    if 'team_breakdown' in sections:
+        team_data = process_team_breakdown(draft_data)
+        strengths_and_needs = calculate_team_strengths_and_needs_by_tier(team_data, reference.expected_values)
+        for team, data in team_data.items():
+            data['strengths_and_needs'] = strengths_and_needs.get(team, {})
+        result['team_breakdown'] = team_data
+
+    return result
+
+@metrics.timed('build_draft_snapshot_changes')
+def build_draft_snapshot_changes(draft_data, sections, state, changes):
+    """The requested sections limited to what changed with the picks in `changes`, see DraftState.changes_since.
+
+    Average tier costs only depend on the reference data and are left out.
+    """
+    result = {'pick_count': len(draft_data), 'cursor': changes['cursor']}
+
+    if 'inflation' in sections:
+        result['inflation'] = changes['inflation']
+
+    if 'picks_per_tier' in sections:
+        result['picks_per_tier'] = changes['picks_per_tier']
+        result['total_picks'] = changes['total_picks']
+
+    if 'doe_values' in sections:
+        result['doe_values'] = changes['doe_values']
+
+    if 'scatterplot' in sections:
+        with state.lock:
+            picks = state.picks_frame()
+            trend_lines = state.price_curves.trend_lines(R2_POSITIONS)
+        # Points are numbered by their place in the draft, the new picks are the last rows
+        new_rows = np.flatnonzero(picks['pick_no'].isin([pick['pick_no'] for pick in changes['picks']]).to_numpy())
+        first = int(new_rows[0]) if len(new_rows) else len(picks)
+        result['scatterplot'] = build_scatter_series(picks.iloc[first:], POSITION_COLORS, first_pick_no=first + 1)
+        if changes['picks']:
+            result['trend_lines'] = trend_lines
+
+    if 'r2_values' in sections and changes['picks']:
+        with state.lock:
+            result['r2_values'] = r2_values_from_curves(state.price_curves)
+
+    if 'team_breakdown' in sections:
+        slots = set(changes['team_budgets'])
+        team_data = process_team_breakdown([pick for pick in draft_data if pick['draft_slot'] in slots])
+        strengths_and_needs = calculate_team_strengths_and_needs_by_tier(team_data, state.reference.expected_values)
+        for team, data in team_data.items():
+            data['strengths_and_needs'] = strengths_and_needs.get(team, {})
+        result['team_breakdown'] = team_data
+
+    return result
+
+@app.route('/draft_snapshot', methods=['GET'])
+def draft_snapshot():
+    draft_id = request.args.get('draft_id')
+    if not draft_id:
+        return jsonify({"error": "Draft ID is required"}), 400
+
+    include = request.args.get('include')
+    sections = [section.strip() for section in include.split(',') if section.strip()] if include else DRAFT_SNAPSHOT_SECTIONS
+    unknown = [section for section in sections if section not in DRAFT_SNAPSHOT_SECTIONS]
+    if unknown:
+        return jsonify({"error": f"Unknown sections: {', '.join(unknown)}", "sections": DRAFT_SNAPSHOT_SECTIONS}), 400
+
+    try:
+        since = parse_since(request.args.get('since'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        draft_data = get_draft_data(draft_id)
+        if not draft_data:
+            return jsonify({"error": "No draft data found"}), 404
+
+        # ?rebuild=true recomputes the draft from scratch, e.g. to verify the running totals
+        rebuild = request.args.get('rebuild', '').lower() in ('1', 'true')
+        key = None
+        if since is None and not rebuild:
+            key = analytics_key('draft_snapshot', draft_id, draft_data, current_reference(), *sections)
+            cached = load_analytics(key)
+            if cached is not None:
+                return json_response(cached)
+
+        if rebuild:
+            state = draft_states.rebuild(draft_id, draft_data, current_reference())
+        else:
+            state = get_draft_state(draft_id, draft_data)
+
+        if since is not None:
+            with state.lock:
+                changes = state.changes_since(since)
+            if changes is not None:
+                return json_response(build_draft_snapshot_changes(draft_data, sections, state, changes))
+
+        response_data = build_draft_snapshot(draft_data, sections, state)
+        if since is not None:
+            # The draft went back below the client's cursor, it has to replace what it has
+            response_data['cursor'] = state.last_pick_no
+            response_data['reset'] = True
+        store_analytics(key, response_data)
+        return json_response(response_data)
+
+    except Exception as e:
+        logging.error("Error building draft snapshot for draft ID %s: %s", draft_id, e, exc_info=True)
         return jsonify({"error": "An error occurred while processing the request"}), 500
 
+def format_sse(data, event=None, event_id=None):
+    message = ''
+    if event_id is not None:
+        message += f"id: {event_id}\n"
+    if event is not None:
+        message += f"event: {event}\n"
+    return message + f"data: {dumps(data)}\n\n"
+
+def stream_draft_events(draft_id, since, store):
+    subscription = draft_poller.subscribe(draft_id) if DRAFT_POLLER_ENABLED else None
+    try:
+        yield from _stream_draft_events(draft_id, since, subscription, store)
+    finally:
+        if subscription is not None:
+            subscription.close()
+
+def _stream_draft_events(draft_id, since, subscription, store):
+    cursor = since
+    last_sent = time.monotonic()
+    yield f"retry: {int(STREAM_POLL_INTERVAL * 1000)}\n\n"
+
+    while True:
+        draft_data = get_draft_data(draft_id)
+        if draft_data:
+            # The stream outlives its request, so the season's store is passed in rather than read from g
+            state = get_draft_state(draft_id, draft_data, store.current)
+            with state.lock:
+                if state.last_pick_no < cursor:
+                    # The draft was reset below the client's cursor, start it over
+                    events = None
+                else:
+                    events = state.events_since(cursor)
+
+            if events is None:
+                cursor = 0
+                yield format_sse({"draft_id": draft_id}, event='reset', event_id=0)
+                last_sent = time.monotonic()
+                continue
+
+            for event in events:
+                cursor = event['pick_no']
+                yield format_sse(event, event='pick', event_id=cursor)
+            if events:
+                last_sent = time.monotonic()
+
+        if time.monotonic() - last_sent >= STREAM_HEARTBEAT_INTERVAL:
+            # Comment lines keep proxies from closing an idle connection
+            yield ": heartbeat\n\n"
+            last_sent = time.monotonic()
+
+        # Wakes as soon as the poller publishes new picks for this draft
+        if subscription is not None:
+            subscription.wait(STREAM_POLL_INTERVAL)
+        else:
+            time.sleep(STREAM_POLL_INTERVAL)
+
+@app.route('/drafts/<draft_id>/stream', methods=['GET'])
+def draft_stream(draft_id):
+    # Browsers resume with Last-Event-ID after a reconnect, clients can also pass ?since=pick_no
+    since = request.args.get('since') or request.headers.get('Last-Event-ID') or '0'
+    if not since.isdigit():
+        return jsonify({"error": "since must be a pick number"}), 400
+
+    if not open_streams.acquire(blocking=False):
+        metrics.increment('draft_streams_rejected_total')
+        return jsonify({"error": "Too many open streams, retry later"}), 503, {'Retry-After': '5'}
+
+    response = Response(stream_draft_events(draft_id, int(since), current_store()), mimetype='text/event-stream',
+                        headers={'X-Accel-Buffering': 'no'})
+    response.call_on_close(open_streams.release)
+    return response
+
+@app.route('/rankings', methods=['POST'])
+def upload_rankings():
+    year = request.form.get('year', current_reference().year)
+    if not (len(year) == 4 and year.isdigit()):
+        return jsonify({"error": "Year must be a four digit season, e.g. 2025"}), 400
+
+    # Form field -> (kind of file, filename in the season folder)
+    targets = {position: ('rankings', filename) for position, filename in ranking_filenames(year).items()}
+    targets['auction_values'] = ('auction_values', AUCTION_VALUES_FILENAME)
+    targets['mappings'] = ('mappings', MAPPINGS_FILENAME)
+
+    uploads = {}
+    errors = {}
+    for field, (kind, filename) in targets.items():
+        upload = request.files.get(field)
+        if upload is None:
+            continue
+        content = upload.read()
+        try:
+            missing_columns = validate_upload(kind, pd.read_csv(io.BytesIO(content)))
+        except Exception as e:
+            errors[field] = f"Unreadable CSV: {e}"
+            continue
+        if missing_columns:
+            errors[field] = f"Missing columns: {', '.join(missing_columns)}"
+        uploads[filename] = content
+
+    if not uploads and not errors:
+        return jsonify({"error": f"Upload at least one of: {', '.join(targets)}"}), 400
+    if errors:
+        return jsonify({"error": "Invalid upload", "files": errors}), 400
+
+    # A season folder must end up with every file the snapshot loader reads
+    data_dir = os.path.join(BASE_DIR, year)
+    required = list(ranking_filenames(year).values()) + [AUCTION_VALUES_FILENAME]
+    missing_files = [filename for filename in required
+                     if filename not in uploads and not os.path.exists(os.path.join(data_dir, filename))]
+    if missing_files:
+        return jsonify({"error": "Season is incomplete", "missing_files": missing_files}), 400
+
+    os.makedirs(data_dir, exist_ok=True)
+    for filename, content in uploads.items():
+        write_atomically(os.path.join(data_dir, filename), content)
+
+    # Requests keep reading the current snapshot until the rebuilt one is swapped in; a season
+    # that is not loaded is simply read from the new files on its first request
+    reloading = season_registry.reload_in_background(year, data_dir) is not None
+    return jsonify({"status": "reloading" if reloading else "saved", "year": year, "files": sorted(uploads)}), 202
+
+@app.route('/reference', methods=['GET'])
+def get_reference():
+    """Expected values of the loaded season, revalidated with If-None-Match against the version ETag."""
+    version, body = get_reference_payload(current_reference())
+    response = Response(body, mimetype='application/json')
+    response.set_etag(version)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """Readiness probe, answered once the reference data of the season asked for is in memory."""
+    snapshot = current_reference()
+    return jsonify({
+        "status": "ready",
+        "pid": os.getpid(),
+        "season": snapshot.year,
+        "reference_version": get_reference_payload(snapshot)[0],
+        "loaded_seasons": season_registry.loaded(),
+    })
+
+@app.route('/rankings/status', methods=['GET'])
+def rankings_status():
+    store = current_store()
+    snapshot = store.current
+    return jsonify({
+        "year": snapshot.year,
+        "loaded_at": snapshot.loaded_at,
+        "players": len(snapshot.expected_values),
+        "reference_version": get_reference_payload(snapshot)[0],
+        "reloading": store.reloading,
+        "last_error": store.last_error,
+        "seasons": season_registry.seasons(),
+        "loaded_seasons": season_registry.loaded(),
+    })
+
+# Completed drafts resolved against the season's reference data, kept for cross-draft analysis
+DRAFT_ARCHIVE_DIR = os.environ.get('DRAFT_ARCHIVE_DIR', os.path.join(BASE_DIR, 'archive'))
+draft_archive = DraftArchive(DRAFT_ARCHIVE_DIR)
+
+def resolve_completed_draft(draft_id, reference=None):
+    """(season, resolved picks frame) of a completed draft, against its own season unless `reference` is given."""
+    info = fetch_draft_info(draft_id) or {}
+    if info.get('status') != 'complete':
+        raise LookupError(f"Draft is not complete (status: {info.get('status')})")
+    season = str(info.get('season'))
+    if reference is None:
+        try:
+            reference = season_registry.get(season)
+        except KeyError:
+            raise LookupError(f"No reference data for season {season}")
+    elif season != reference.year:
+        raise LookupError(f"Draft is from season {season}, not {reference.year}")
+
+    draft_data = draft_cache.get(draft_id)
+    if not draft_data:
+        raise LookupError("No draft data found")
+    return reference.year, build_picks_frame(draft_data, reference.player_index)
+
+@app.route('/archive/drafts', methods=['POST'])
+def archive_drafts():
+    draft_ids, error = parse_draft_ids(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+
+    # Archived drafts never change, so they are skipped without asking Sleeper
+    already_archived = [draft_id for draft_id in draft_ids if draft_id in draft_archive]
+    pending = [draft_id for draft_id in draft_ids if draft_id not in draft_archive]
+
+    # Each draft is resolved against its own season, or only against ?season= when one is given
+    reference = current_reference() if 'season' in request.args else None
+    resolved = []
+    errors = {}
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(pending))) as executor:
+            futures = {executor.submit(resolve_completed_draft, draft_id, reference): draft_id for draft_id in pending}
+            for future in as_completed(futures):
+                draft_id = futures[future]
+                try:
+                    resolved.append((draft_id, *future.result()))
+                except LookupError as e:
+                    errors[draft_id] = str(e)
+                except Exception as e:
+                    logging.error("Error archiving draft ID %s: %s", draft_id, e, exc_info=True)
+                    errors[draft_id] = "An error occurred while fetching the draft"
+
+    try:
+        archived = draft_archive.ingest(resolved)
+    except Exception as e:
+        logging.error("Error writing draft archive: %s", e, exc_info=True)
+        return jsonify({"error": "An error occurred while writing the archive"}), 500
+
+    return jsonify({
+        "archived": archived,
+        "already_archived": already_archived,
+        "errors": errors,
+        "archive": draft_archive.stats(),
+    })
+
+@app.route('/archive/status', methods=['GET'])
+def archive_status():
+    return jsonify(draft_archive.stats())
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    cache_stats = draft_cache.stats()
+    poller_stats = draft_poller.stats()
+    resolution_stats = player_resolution_cache.stats()
+    archive_stats = draft_archive.stats()
+    season_stats = season_registry.stats()
+    shared_stats = shared_cache.stats() if shared_cache is not None else None
+    counters = {
+        'sleeper_requests_total': sleeper_client.requests_sent,
+        'sleeper_retries_total': sleeper_client.retries_made,
+        'draft_poller_upstream_calls_total': poller_stats['upstream_calls'],
+        'draft_cache_requests_total': {
+            (('result', 'hit'),): cache_stats['hits'],
+            (('result', 'miss'),): cache_stats['misses'],
+            (('result', 'coalesced'),): cache_stats['coalesced'],
+        },
+        'player_resolution_cache_requests_total': {
+            (('result', 'hit'),): resolution_stats['hits'],
+            (('result', 'miss'),): resolution_stats['misses'],
+        },
+        'reference_season_loads_total': season_stats['loads'],
+        'reference_season_evictions_total': season_stats['evictions'],
+    }
+    gauges = {
+        'draft_cache_entries': cache_stats['entries'],
+        'draft_cache_hit_rate': cache_stats['hit_rate'],
+        'draft_poller_active_drafts': poller_stats['active_drafts'],
+        'draft_poller_subscribers': poller_stats['subscribers'],
+        'draft_states': len(draft_states),
+        'player_resolution_cache_entries': resolution_stats['entries'],
+        'draft_archive_drafts': archive_stats['drafts'],
+        'draft_archive_picks': archive_stats['picks'],
+        'reference_loaded_timestamp_seconds': reference_store.current.loaded_at,
+        'reference_reloading': reference_store.reloading,
+        'reference_seasons_loaded': len(season_stats['loaded']),
+    }
+    if shared_stats is not None:
+        counters['shared_cache_requests_total'] = {
+            (('result', 'hit'),): shared_stats['hits'],
+            (('result', 'miss'),): shared_stats['misses'],
+            (('result', 'error'),): shared_stats['errors'],
+        }
+        counters['shared_cache_evictions_total'] = shared_stats['evictions']
+        gauges['shared_cache_entries'] = shared_stats['entries']
+        gauges['shared_cache_bytes'] = shared_stats['bytes']
+    return Response(metrics.render(counters, gauges), mimetype='text/plain; version=0.0.4')
+
+@app.before_request
+def start_request_timer():
+    g.request_started = metrics.clock()
+
+@app.before_request
+def select_season():
+    """Bind the request to the season in ?season=, loading it on first use."""
+    season = request.args.get('season')
+    if not season:
+        return None
+    try:
+        g.reference_store = season_registry.store(season)
+    except KeyError:
+        return jsonify({"error": f"Unknown season: {season}", "seasons": season_registry.seasons()}), 404
+    except Exception as e:
+        logging.error("Failed to load reference data for season %s: %s", season, e, exc_info=True)
+        return jsonify({"error": f"Reference data for season {season} could not be loaded"}), 503
+    return None
+
+# Bodies smaller than this are sent as they are, compressing them saves less than the headers cost
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '500'))
+COMPRESS_LEVEL = int(os.environ.get('COMPRESS_LEVEL', '6'))
+
+def compress_response(response):
+    """Gzip or brotli encode a buffered response for clients that accept it."""
+    if response.is_streamed or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if response.status_code in (204, 304) or 'Content-Encoding' in response.headers:
+        return response
+
+    encoding = negotiate_encoding(request.accept_encodings)
+    data = response.get_data()
+    if encoding is None or len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(compress(data, encoding, COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = encoding
+    # The encoded bytes differ from the ones the strong ETag was computed for
+    etag, weak = response.get_etag()
+    if etag is not None and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
 @app.after_request
 def add_header(response):
-    response.cache_control.no_store = True
+    # Versioned responses may be cached as long as they are revalidated
+    if 'ETag' not in response.headers:
+        response.cache_control.no_store = True
+
+    compress_response(response)
+
+    # Streamed responses are timed until their first byte and have no known size
+    endpoint = request.endpoint or 'unknown'
+    if 'request_started' in g:
+        metrics.observe_stage(f'request:{endpoint}', metrics.clock() - g.request_started)
+    if not response.is_streamed:
+        metrics.observe_payload(endpoint, response.calculate_content_length() or 0)
     return response
 
 if __name__ == "__main__":
+    # Development server with the debugger; gunicorn with backend/gunicorn.conf.py serves production
     app.run(debug=True, threaded=True, host='0.0.0.0', port=5050)
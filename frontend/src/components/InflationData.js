@@ -1,5 +1,6 @@
 import React, { useState, useEffect, useCallback, useRef } from 'react';
 import axios from 'axios';
+import { fetchReferenceData } from './utils/referenceData';
 import { Table, Alert, Spinner } from 'react-bootstrap';
 import './inflation.css';
 
@@ -127,6 +128,7 @@ const InflationData = ({ draftId, isLive }) => {
             const playerList = fetchedPicks.map(pick => ({
                 first_name: pick.metadata.first_name,
                 last_name: pick.metadata.last_name,
+                player_id: pick.player_id,
                 position: pick.metadata.position
             }));
     
@@ -136,7 +138,8 @@ const InflationData = ({ draftId, isLive }) => {
             ]);
     
             const playerData = playerDataResponse.data;
-            const inflationData = inflationDataResponse.data;
+            const referenceData = await fetchReferenceData(inflationDataResponse.data.reference_version);
+            const inflationData = { ...inflationDataResponse.data, expected_values: referenceData.expected_values };
     
             const lookup = buildExpectedValuesLookup(inflationData, playerData);
     
@@ -3,9 +3,13 @@ import axios from 'axios';
 import Plot from 'react-plotly.js';
 import { Table } from 'react-bootstrap';
 
+// Same colors the backend gives each position's points
+const POSITION_COLORS = { QB: 'red', RB: 'green', WR: 'blue', TE: 'yellow' };
+
 function ScatterPlot({ draftId, isLive }) {
     const [scatterData, setScatterData] = useState(null);
     const [r2Data, setR2Data] = useState(null);
+    const [trendLines, setTrendLines] = useState(null);
 
     useEffect(() => {
         const fetchScatterData = async () => {
@@ -26,6 +30,7 @@ function ScatterPlot({ draftId, isLive }) {
                 if (response.data) {
                     setScatterData(response.data.scatterplot);
                     setR2Data(response.data.r2_values);
+                    setTrendLines(response.data.trend_lines);
 
                     // Cache the updated data even if it's live
                     localStorage.setItem(`scatterData_${draftId}`, JSON.stringify(response.data.scatterplot));
@@ -59,6 +64,14 @@ function ScatterPlot({ draftId, isLive }) {
                         marker: { color: scatterData.colors, size: 10 },
                         text: scatterData.player_names,
                     },
+                    // Price against pick number fitted per position
+                    ...Object.entries(trendLines || {}).map(([position, line]) => ({
+                        x: line.pick_no,
+                        y: line.price,
+                        mode: 'lines',
+                        name: `${position} trend`,
+                        line: { color: POSITION_COLORS[position] || 'gray', dash: 'dash' },
+                    })),
                 ]}
                 layout={{
                     xaxis: { title: 'Pick Number' },
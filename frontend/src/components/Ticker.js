@@ -1,5 +1,6 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import axios from 'axios';
+import { fetchReferenceData } from './utils/referenceData';
 import Select from 'react-select'; // Using react-select for multi-select dropdowns
 import './ticker.css';
 
@@ -22,6 +23,8 @@ const Ticker = ({ draftId, draftOrder = [], isLive }) => {
     const [filteredPicks, setFilteredPicks] = useState([]);
     const [expectedValuesLookup, setExpectedValuesLookup] = useState({});
     const [cachedResults, setCachedResults] = useState({});
+    // Picks and lookups received so far for the live draft, and the pick_no cursor to poll from
+    const liveRef = useRef({ draftId: null, cursor: 0, picks: [], playerData: [], referenceVersion: null });
     const [filters, setFilters] = useState({
         team: [],
         player: '',
@@ -86,27 +89,50 @@ const Ticker = ({ draftId, draftOrder = [], isLive }) => {
             setExpectedValuesLookup(lookup);
         } else {
             try {
-                const picksResponse = await axios.get(`http://localhost:5050/picks?draft_id=${draftId}`);
-                const fetchedPicks = picksResponse.data.sort((a, b) => b.pick_no - a.pick_no);
-                setPicks(fetchedPicks);
-
-                const playerList = fetchedPicks.map(pick => ({
+                if (liveRef.current.draftId !== draftId) {
+                    liveRef.current = { draftId, cursor: 0, picks: [], playerData: [], referenceVersion: null };
+                }
+                const live = liveRef.current;
+
+                // Only the picks made since the last poll are sent, newest first ahead of the ones already shown
+                const picksResponse = await axios.get(`http://localhost:5050/picks?draft_id=${draftId}&since=${live.cursor}`);
+                const { cursor, reset, picks: newPicks } = picksResponse.data;
+                if (reset) {
+                    live.picks = [];
+                    live.playerData = [];
+                }
+                newPicks.sort((a, b) => b.pick_no - a.pick_no);
+
+                const playerList = newPicks.map(pick => ({
                     first_name: pick.metadata.first_name,
                     last_name: pick.metadata.last_name,
+                    player_id: pick.player_id,
                     position: pick.metadata.position
                 }));
 
                 const [playerDataResponse, inflationDataResponse] = await Promise.all([
-                    axios.post('http://localhost:5050/player_lookup', { players: playerList }),
-                    axios.post('http://localhost:5050/inflation', { draft_id: draftId })
+                    playerList.length > 0
+                        ? axios.post('http://localhost:5050/player_lookup', { players: playerList })
+                        : Promise.resolve({ data: [] }),
+                    axios.post('http://localhost:5050/inflation', { draft_id: draftId, since: cursor })
                 ]);
 
-                const playerData = playerDataResponse.data;
-                const inflationData = inflationDataResponse.data;
+                const referenceVersion = inflationDataResponse.data.reference_version;
+                if (newPicks.length === 0 && !reset && referenceVersion === live.referenceVersion) {
+                    return;
+                }
+
+                const fetchedPicks = [...newPicks, ...live.picks];
+                const playerData = [...live.playerData, ...playerDataResponse.data];
+                setPicks(fetchedPicks);
+
+                const referenceData = await fetchReferenceData(referenceVersion);
+                const inflationData = { ...inflationDataResponse.data, expected_values: referenceData.expected_values };
 
                 const lookup = buildExpectedValuesLookup(inflationData, playerData);
                 setExpectedValuesLookup(lookup);
 
+                Object.assign(live, { cursor, picks: fetchedPicks, playerData, referenceVersion });
                 setCachedResults(prevCache => ({
                     ...prevCache,
                     [draftId]: { fetchedPicks, lookup }
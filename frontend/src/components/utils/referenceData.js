@@ -0,0 +1,14 @@
+import axios from 'axios';
+
+// Expected values only change when new rankings are uploaded, so they are kept
+// here and refetched only when /inflation reports a different reference_version
+let cached = null;
+
+export const fetchReferenceData = async (version) => {
+    if (cached && cached.version === version) {
+        return cached;
+    }
+    const response = await axios.get('http://localhost:5050/reference');
+    cached = response.data;
+    return cached;
+};
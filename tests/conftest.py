@@ -0,0 +1,16 @@
+import os
+import shutil
+import tempfile
+
+# Set before any test imports the backend, which reads them at import time.
+# Caches are written to a directory of this run, so no run sees what an earlier one left
+_run_dir = tempfile.mkdtemp(prefix='draft-backend-tests-')
+os.environ['PLAYER_CACHE_DIR'] = os.path.join(_run_dir, 'cache')
+os.environ['REFERENCE_ARTIFACT_DIR'] = os.path.join(_run_dir, 'cache')
+os.environ['DRAFT_ARCHIVE_DIR'] = os.path.join(_run_dir, 'archive')
+# Responses must come from the code under test; test_shared_cache.py brings its own cache
+os.environ['SHARED_CACHE_PATH'] = ''
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_run_dir, ignore_errors=True)
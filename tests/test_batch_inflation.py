@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.inflation_engine import build_picks_frame, calculate_inflation
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestBatchInflation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+        cls.drafts = {'a': cls.draft_data[:60], 'b': cls.draft_data[60:], 'empty': []}
+
+    def setUp(self):
+        self.client = trial_backend.app.test_client()
+
+    def fetch(self, draft_id):
+        if draft_id == 'broken':
+            raise ValueError(draft_id)
+        return self.drafts[draft_id]
+
+    def post_batch(self, draft_ids):
+        with patch.object(trial_backend.draft_cache, 'get', side_effect=self.fetch):
+            response = self.client.post('/inflation/batch', json={'draft_ids': draft_ids})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.mimetype, 'application/x-ndjson')
+            return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_per_draft_results_and_aggregate(self):
+        lines = self.post_batch(['a', 'b', 'a'])
+        results = {line['draft_id']: line for line in lines[:-1]}
+        self.assertEqual(sorted(results), ['a', 'b'])
+        self.assertEqual(results['a']['pick_count'], 60)
+
+        reference = trial_backend.reference_store.current
+        expected = calculate_inflation(build_picks_frame(self.draft_data, reference.player_index),
+                                       reference.tiers_by_position)
+        aggregate = lines[-1]
+        self.assertEqual((aggregate['succeeded'], aggregate['failed']), (2, 0))
+        self.assertEqual(aggregate['aggregate']['pick_count'], len(self.draft_data))
+        self.assertAlmostEqual(aggregate['aggregate']['inflation']['overall'], expected['overall'])
+
+    def test_failures_are_reported_per_draft(self):
+        lines = self.post_batch(['a', 'empty', 'broken'])
+        errors = {line['draft_id']: line['error'] for line in lines[:-1] if 'error' in line}
+        self.assertEqual(errors['empty'], 'No draft data found')
+        self.assertIn('broken', errors)
+        self.assertEqual((lines[-1]['succeeded'], lines[-1]['failed']), (1, 2))
+        self.assertEqual(lines[-1]['aggregate']['pick_count'], 60)
+
+    def test_requires_draft_ids(self):
+        response = self.client.post('/inflation/batch', json={'draft_ids': []})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/inflation/batch', json={'draft_ids': 'a'})
+        self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
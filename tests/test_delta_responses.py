@@ -0,0 +1,160 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import gzip
+import json
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.draft_state import DraftState
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def merge(target, changes):
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+class TestDeltaResponses(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def setUp(self):
+        self.client = trial_backend.app.test_client()
+        self.served = self.draft_data[:150]
+        patcher = patch('backend.trial_backend.get_draft_data', side_effect=lambda draft_id: self.served)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_json(self, url, **kwargs):
+        response = self.client.get(url, **kwargs)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.get_json()
+
+    def test_changes_since_match_full_aggregates(self):
+        state = DraftState('changes', trial_backend.reference_store.current)
+        state.apply(self.draft_data[:150])
+        self.assertEqual(state.changes_since(150)['picks'], [])
+        state.apply(self.draft_data)
+
+        changes = state.changes_since(150)
+        self.assertEqual(changes['cursor'], 192)
+        self.assertEqual([pick['pick_no'] for pick in changes['picks']], list(range(151, 193)))
+        self.assertEqual(changes['inflation']['overall'], state.inflation()['overall'])
+        picks_per_tier = state.picks_per_tier()
+        for position, tiers in changes['picks_per_tier'].items():
+            for tier, count in tiers.items():
+                self.assertEqual(picks_per_tier[position][tier], count)
+            self.assertEqual(changes['total_picks'][position], sum(picks_per_tier[position].values()))
+        self.assertEqual(changes['team_budgets'], {slot: state.team_budgets()[slot] for slot in changes['team_budgets']})
+        self.assertIsNone(state.changes_since(500))
+
+    def test_picks_since(self):
+        data = self.get_json('/picks?draft_id=delta-picks&since=148')
+        self.assertEqual((data['cursor'], data['reset']), (150, False))
+        self.assertEqual([pick['pick_no'] for pick in data['picks']], [149, 150])
+
+        data = self.get_json('/picks?draft_id=delta-picks&since=300')
+        self.assertTrue(data['reset'])
+        self.assertEqual(len(data['picks']), 150)
+
+        self.assertIsInstance(self.get_json('/picks?draft_id=delta-picks'), list)
+        self.assertEqual(self.client.get('/picks?draft_id=delta-picks&since=-1').status_code, 400)
+
+    def test_inflation_deltas_merge_into_full_response(self):
+        merged = self.get_json('/inflation?draft_id=delta-inflation')
+        self.assertEqual(merged['cursor'], 150)
+
+        self.served = self.draft_data[:191]
+        delta = self.client.post('/inflation', json={'draft_id': 'delta-inflation', 'since': 150}).get_json()
+        self.assertEqual(delta['cursor'], 191)
+        merge(merged, delta)
+
+        self.served = self.draft_data
+        response = self.client.get('/inflation?draft_id=delta-inflation&since=191')
+        merge(merged, response.get_json())
+        # Late in the draft a poll only carries the figures the last pick moved
+        self.assertLess(len(response.data), 600)
+
+        full = self.get_json('/inflation?draft_id=delta-inflation-full')
+        self.assertEqual(merged, full)
+
+        unchanged = self.get_json('/inflation?draft_id=delta-inflation&since=192')
+        self.assertNotIn('overall_inflation', unchanged)
+        self.assertEqual(unchanged['picks_per_tier'], {})
+
+    def test_draft_snapshot_since(self):
+        self.get_json('/draft_snapshot?draft_id=delta-snapshot')
+        self.served = self.draft_data
+        data = self.get_json('/draft_snapshot?draft_id=delta-snapshot&since=150')
+        full = self.get_json('/draft_snapshot?draft_id=delta-snapshot-full')
+
+        self.assertEqual(data['cursor'], 192)
+        self.assertNotIn('avg_tier_costs', data)
+        self.assertEqual(data['scatterplot']['pick_no'], full['scatterplot']['pick_no'][150:])
+        self.assertEqual(data['scatterplot']['metadata_amount'], full['scatterplot']['metadata_amount'][150:])
+        self.assertEqual(data['r2_values'], full['r2_values'])
+        slots = {str(pick['draft_slot']) for pick in self.draft_data[150:]}
+        self.assertEqual(set(data['team_breakdown']), slots)
+        for slot in slots:
+            self.assertEqual(data['team_breakdown'][slot]['totalSpend'], full['team_breakdown'][slot]['totalSpend'])
+
+        data = self.get_json('/draft_snapshot?draft_id=delta-snapshot&since=500')
+        self.assertTrue(data['reset'])
+        self.assertEqual(len(data['scatterplot']['pick_no']), 192)
+
+    def test_scatter_data_and_team_breakdown_since(self):
+        full = self.get_json('/scatter_data?draft_id=delta-scatter')
+        data = self.get_json('/scatter_data?draft_id=delta-scatter&since=140')
+        self.assertEqual(data['cursor'], 150)
+        self.assertEqual(data['scatterplot']['pick_no'], full['scatterplot']['pick_no'][140:])
+        self.assertEqual(data['scatterplot']['player_names'], full['scatterplot']['player_names'][140:])
+        self.assertNotIn('r2_values', self.get_json('/scatter_data?draft_id=delta-scatter&since=150'))
+
+        teams = self.get_json('/team_breakdown?draft_id=delta-teams')
+        data = self.get_json('/team_breakdown?draft_id=delta-teams&since=149')
+        self.assertEqual(data['cursor'], 150)
+        self.assertEqual(set(data['teams']), {str(pick['draft_slot']) for pick in self.served[149:]})
+        for slot, team in data['teams'].items():
+            self.assertEqual(team['totalSpend'], teams[slot]['totalSpend'])
+
+class TestResponseCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.client = trial_backend.app.test_client()
+
+    def test_gzip_when_accepted(self):
+        plain = self.client.get('/reference')
+        self.assertNotIn('Content-Encoding', plain.headers)
+
+        response = self.client.get('/reference', headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(gzip.decompress(response.data), plain.data)
+        self.assertLess(len(response.data), len(plain.data) / 4)
+
+        # The compressed body gets a weak ETag that still revalidates
+        etag = response.headers['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        revalidated = self.client.get('/reference', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_small_and_refused_bodies_are_not_compressed(self):
+        response = self.client.get('/picks', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('Content-Encoding', response.headers)
+
+        response = self.client.get('/reference', headers={'Accept-Encoding': 'gzip;q=0, identity'})
+        self.assertNotIn('Content-Encoding', response.headers)
+
+if __name__ == '__main__':
+    unittest.main()
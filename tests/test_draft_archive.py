@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+import threading
+
+import numpy as np
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.draft_archive import DraftArchive, MANIFEST_FILENAME
+from backend.inflation_engine import build_picks_frame
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestDraftArchive(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+        cls.reference = trial_backend.reference_store.current
+        cls.picks = build_picks_frame(cls.draft_data, cls.reference.player_index)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp_dir.name, 'archive')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_ingest_is_idempotent_per_draft(self):
+        archive = DraftArchive(self.root)
+        self.assertEqual(archive.ingest([('1', 2024, self.picks), ('2', 2024, self.picks[:50])]), ['1', '2'])
+        self.assertEqual(archive.ingest([('1', 2024, self.picks), ('3', 2023, self.picks[:10])]), ['3'])
+        self.assertEqual(archive.ingest([('1', 2024, self.picks)]), [])
+        self.assertEqual(archive.stats(), {'drafts': 3, 'segments': 2, 'picks': len(self.picks) + 60})
+
+        # A fresh process sees the same archive
+        reopened = DraftArchive(self.root)
+        self.assertIn('2', reopened)
+        self.assertEqual(reopened.ingest([('2', 2024, self.picks)]), [])
+        self.assertEqual(len(reopened.load()), len(self.picks) + 60)
+
+    def test_rows_keep_resolved_values(self):
+        archive = DraftArchive(self.root)
+        archive.ingest([('1', 2024, self.picks), ('3', 2023, self.picks[:10])])
+
+        rows = archive.load(season=2024)
+        self.assertEqual(len(rows), len(self.picks))
+        self.assertEqual(rows['player_name'].tolist(), self.picks['player_name'].tolist())
+        self.assertEqual(rows['amount'].sum(), self.picks['amount'].sum())
+        np.testing.assert_allclose(rows['value'], self.picks['value'].to_numpy())
+
+        amounts = archive.load(season=2023, fields=['draft_id', 'amount'])
+        self.assertEqual(amounts.dtype.names, ('draft_id', 'amount'))
+        self.assertEqual(set(amounts['draft_id']), {'3'})
+
+        for segment in archive.iter_segments():
+            self.assertIsInstance(segment, np.memmap)
+
+    def test_unlisted_segment_is_ignored(self):
+        archive = DraftArchive(self.root)
+        archive.ingest([('1', 2024, self.picks[:5])])
+        # A segment written by an ingest that died before updating the manifest
+        np.save(os.path.join(self.root, 'segment-000001.npy'), archive.load())
+        with open(os.path.join(self.root, MANIFEST_FILENAME), 'a') as f:
+            f.write('2\t2024')
+
+        reopened = DraftArchive(self.root)
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(len(reopened.load()), 5)
+
+    def test_processes_sharing_an_archive(self):
+        # Each instance stands in for a worker process with its own view of the manifest
+        workers = [DraftArchive(self.root) for _ in range(4)]
+        results = [None] * len(workers)
+
+        def ingest(i):
+            results[i] = workers[i].ingest([('shared', 2024, self.picks[:20]), (f'own-{i}', 2024, self.picks[:5])])
+
+        threads = [threading.Thread(target=ingest, args=(i,)) for i in range(len(workers))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The shared draft went in once, and no worker's segment replaced another's
+        self.assertEqual(sum(result.count('shared') for result in results), 1)
+        for archive in [workers[0], DraftArchive(self.root)]:
+            self.assertEqual(archive.stats(), {'drafts': 5, 'segments': 4, 'picks': 40})
+            self.assertEqual(len(archive.load()), 40)
+        self.assertIn('own-3', workers[0])
+
+    def test_archive_route(self):
+        infos = {
+            'done': {'status': 'complete', 'season': self.reference.year},
+            'live': {'status': 'drafting', 'season': self.reference.year},
+        }
+        archive = DraftArchive(self.root)
+        client = trial_backend.app.test_client()
+        with patch.object(trial_backend, 'draft_archive', archive), \
+                patch.object(trial_backend, 'fetch_draft_info', side_effect=infos.get), \
+                patch.object(trial_backend.draft_cache, 'get', return_value=self.draft_data):
+            body = client.post('/archive/drafts', json={'draft_ids': ['done', 'live']}).get_json()
+            self.assertEqual(body['archived'], ['done'])
+            self.assertIn('live', body['errors'])
+
+            body = client.post('/archive/drafts', json={'draft_ids': ['done']}).get_json()
+            self.assertEqual((body['archived'], body['already_archived']), ([], ['done']))
+            self.assertEqual(client.get('/archive/status').get_json()['picks'], len(self.draft_data))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.draft_cache import DraftPicksCache
+import backend.trial_backend as trial_backend
+
+STUB_PICKS = [{'pick_no': 1, 'draft_slot': 1, 'metadata': {'first_name': 'Josh', 'last_name': 'Allen',
+                                                           'position': 'QB', 'amount': '40'}}]
+
+class StubSleeperHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(self.path)
+        time.sleep(0.05)  # Long enough for concurrent callers to overlap
+        body = json.dumps(STUB_PICKS).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestDraftPicksCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubSleeperHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.original_base = trial_backend.SLEEPER_API_BASE
+        trial_backend.SLEEPER_API_BASE = f"http://127.0.0.1:{cls.server.server_port}/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        trial_backend.SLEEPER_API_BASE = cls.original_base
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubSleeperHandler.requests_seen.clear()
+
+    def test_concurrent_requests_share_one_fetch(self):
+        cache = DraftPicksCache(trial_backend.fetch_draft_data, ttl=60)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get('42'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(StubSleeperHandler.requests_seen, ['/v1/draft/42/picks'])
+        self.assertEqual(results, [STUB_PICKS] * 8)
+        stats = cache.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'] + stats['coalesced'], 7)
+
+    def test_entries_expire_after_ttl(self):
+        now = [0.0]
+        cache = DraftPicksCache(trial_backend.fetch_draft_data, ttl=5, clock=lambda: now[0])
+        cache.get('7')
+        now[0] = 4.9
+        cache.get('7')
+        self.assertEqual(len(StubSleeperHandler.requests_seen), 1)
+
+        now[0] = 5.0
+        cache.get('7')
+        self.assertEqual(len(StubSleeperHandler.requests_seen), 2)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_empty_results_are_not_cached(self):
+        calls = []
+        cache = DraftPicksCache(lambda draft_id: calls.append(draft_id) or [], ttl=60)
+        cache.get('9')
+        cache.get('9')
+        self.assertEqual(calls, ['9', '9'])
+
+    def test_fetch_error_reaches_waiting_callers(self):
+        def failing_fetch(draft_id):
+            time.sleep(0.05)
+            raise ConnectionError(draft_id)
+
+        cache = DraftPicksCache(failing_fetch, ttl=60)
+        errors = []
+
+        def call():
+            try:
+                cache.get('13')
+            except ConnectionError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 3)
+
+if __name__ == '__main__':
+    unittest.main()
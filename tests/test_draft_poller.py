@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import threading
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.draft_poller import DraftPoller
+
+def make_picks(count):
+    return [{'pick_no': pick_no, 'metadata': {}} for pick_no in range(1, count + 1)]
+
+class TestDraftPoller(unittest.TestCase):
+
+    def setUp(self):
+        self.now = [0.0]
+        self.fetched = []
+        self.upstream = {'1': make_picks(1), '2': make_picks(5)}
+        self.poller = DraftPoller(self.fetch, interval=2, max_interval=16, idle_after=10, finished_after=100,
+                                  finished_interval=60, watch_timeout=30, autostart=False, clock=lambda: self.now[0])
+
+    def fetch(self, draft_id):
+        self.fetched.append(draft_id)
+        return self.upstream[draft_id]
+
+    def advance(self, seconds):
+        self.now[0] += seconds
+        return self.poller.poll_due()
+
+    def test_one_upstream_call_per_draft_per_interval(self):
+        for _ in range(30):
+            self.poller.watch('1')
+        self.poller.watch('2')
+
+        self.assertEqual(self.advance(0), 0)
+        self.assertEqual(self.advance(2), 2)
+        self.assertEqual(sorted(self.fetched), ['1', '2'])
+        self.assertEqual(self.poller.latest('1'), make_picks(1))
+
+        self.assertEqual(self.advance(1), 0)
+        self.assertEqual(self.advance(1), 2)
+
+    def test_idle_drafts_back_off(self):
+        subscription = self.poller.subscribe('1')
+        self.advance(2)
+        intervals = []
+        for _ in range(8):
+            before = len(self.fetched)
+            waited = 0
+            while len(self.fetched) == before:
+                self.advance(1)
+                waited += 1
+            intervals.append(waited)
+        self.assertEqual(intervals[:2], [2, 2])
+        self.assertEqual(max(intervals), 16)
+
+        # A new pick resets the interval
+        self.upstream['1'] = make_picks(2)
+        self.advance(16)
+        self.assertTrue(subscription.wait(0))
+        self.assertEqual(self.poller._drafts['1'].interval, 2)
+
+    def test_finished_drafts_poll_rarely(self):
+        self.poller.subscribe('1')
+        self.advance(150)
+        self.advance(150)
+        self.assertEqual(self.poller._drafts['1'].interval, 60)
+
+    def test_unwatched_drafts_are_dropped(self):
+        self.poller.watch('1')
+        subscription = self.poller.subscribe('2')
+        self.advance(31)
+        self.assertIsNone(self.poller.latest('1'))
+        self.assertEqual(self.poller.stats()['active_drafts'], 1)
+
+        subscription.close()
+        self.advance(31)
+        self.assertEqual(self.poller.stats()['active_drafts'], 0)
+
+    def test_subscribers_wake_on_publish(self):
+        subscription = self.poller.subscribe('1')
+        woke = []
+        waiter = threading.Thread(target=lambda: woke.append(subscription.wait(5)))
+        waiter.start()
+        self.poller.publish('1', make_picks(3))
+        waiter.join()
+        self.assertEqual(woke, [True])
+
+        # Publishing the same picks again is not a change
+        self.assertFalse(self.poller.publish('1', make_picks(3)))
+        self.assertFalse(subscription.wait(0))
+
+if __name__ == '__main__':
+    unittest.main()
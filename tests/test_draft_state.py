@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+import json
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.draft_state import DraftState, DraftStateRegistry
+from backend.inflation_engine import build_picks_frame, calculate_doe, calculate_inflation, count_picks_per_tier
+from backend.reference_data import load_reference_snapshot
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestDraftState(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.reference = load_reference_snapshot(os.path.join(os.path.dirname(TESTS_DIR), 'backend', '2024'))
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def assertMatchesFullBuild(self, state, draft_data):
+        picks = build_picks_frame(draft_data, self.reference.player_index)
+        expected = calculate_inflation(picks, self.reference.tiers_by_position)
+        actual = state.inflation()
+
+        self.assertAlmostEqual(actual['overall'], expected['overall'])
+        for position, inflation in expected['positional'].items():
+            self.assertAlmostEqual(actual['positional'][position], inflation)
+        for position, tiers in expected['positional_tiered'].items():
+            self.assertEqual(list(actual['positional_tiered'][position]), list(tiers))
+            for tier, inflation in tiers.items():
+                self.assertAlmostEqual(actual['positional_tiered'][position][tier], inflation)
+
+        self.assertEqual(state.picks_per_tier(), count_picks_per_tier(picks))
+        expected_doe = calculate_doe(picks)
+        self.assertEqual(list(state.doe_values()), list(expected_doe))
+        for position, tiers in expected_doe.items():
+            for tier, doe in tiers.items():
+                self.assertAlmostEqual(state.doe_values()[position][tier], doe)
+
+    def test_incremental_polls_match_full_build(self):
+        state = DraftState('draft', self.reference)
+        for end in (0, 1, 37, 38, 120, len(self.draft_data)):
+            state.apply(self.draft_data[:end])
+            self.assertMatchesFullBuild(state, self.draft_data[:end])
+
+    def test_poll_only_applies_new_picks(self):
+        state = DraftState('draft', self.reference)
+        state.apply(self.draft_data[:100])
+        new_picks = state.apply(self.draft_data[:103])
+        self.assertEqual([pick['pick_no'] for pick in new_picks], [101, 102, 103])
+        self.assertEqual(state.apply(self.draft_data[:103]), [])
+
+        # Each pick records the aggregates it changed, ready to stream
+        events = state.events_since(101)
+        self.assertEqual([event['pick_no'] for event in events], [102, 103])
+        self.assertAlmostEqual(events[-1]['inflation']['overall'], state.inflation()['overall'])
+
+    def test_team_budgets(self):
+        state = DraftState('draft', self.reference)
+        state.apply(self.draft_data)
+        budgets = state.team_budgets()
+        slot = self.draft_data[0]['draft_slot']
+        spent = sum(int(pick['metadata']['amount']) for pick in self.draft_data if pick['draft_slot'] == slot)
+        self.assertEqual(budgets[slot], {'totalSpend': spent, 'remainingBudget': 200 - spent})
+
+    def test_registry_rebuilds_on_reset_or_new_reference(self):
+        registry = DraftStateRegistry()
+        state = registry.update('draft', self.draft_data, self.reference)
+        self.assertIs(registry.update('draft', self.draft_data, self.reference), state)
+
+        # The draft was reset and has fewer picks than were already applied
+        reset_state = registry.update('draft', self.draft_data[:10], self.reference)
+        self.assertIsNot(reset_state, state)
+        self.assertEqual(reset_state.pick_count, 10)
+
+        new_reference = load_reference_snapshot(self.reference.data_dir)
+        self.assertIsNot(registry.update('draft', self.draft_data[:10], new_reference), reset_state)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import threading
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class EndOfPolls(Exception):
+    pass
+
+def parse_events(chunks):
+    events = []
+    for chunk in chunks:
+        for message in chunk.decode().split('\n\n'):
+            fields = dict(line.split(': ', 1) for line in message.splitlines() if not line.startswith(':') and ': ' in line)
+            if 'data' in fields:
+                events.append((fields.get('event'), fields.get('id'), json.loads(fields['data'])))
+    return events
+
+class TestDraftStream(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def setUp(self):
+        self.poll_interval = trial_backend.STREAM_POLL_INTERVAL
+        self.heartbeat_interval = trial_backend.STREAM_HEARTBEAT_INTERVAL
+        self.poller_enabled = trial_backend.DRAFT_POLLER_ENABLED
+        trial_backend.STREAM_POLL_INTERVAL = 0
+        trial_backend.STREAM_HEARTBEAT_INTERVAL = 0
+        trial_backend.DRAFT_POLLER_ENABLED = False
+        trial_backend.draft_states.rebuild('stream-test', [], trial_backend.reference_store.current)
+        self.client = trial_backend.app.test_client()
+
+    def tearDown(self):
+        trial_backend.STREAM_POLL_INTERVAL = self.poll_interval
+        trial_backend.STREAM_HEARTBEAT_INTERVAL = self.heartbeat_interval
+        trial_backend.DRAFT_POLLER_ENABLED = self.poller_enabled
+
+    def read_stream(self, polls, url, headers=None):
+        with patch('backend.trial_backend.get_draft_data', side_effect=polls):
+            response = self.client.get(url, headers=headers or {}, buffered=False)
+            self.assertEqual(response.mimetype, 'text/event-stream')
+            chunks = []
+            stream = iter(response.response)
+            try:
+                for chunk in stream:
+                    chunks.append(chunk)
+            except EndOfPolls:
+                pass
+            finally:
+                response.close()
+            return chunks
+
+    def test_one_event_per_new_pick(self):
+        polls = [self.draft_data[:2], self.draft_data[:2], self.draft_data[:3], EndOfPolls()]
+        chunks = self.read_stream(polls, '/drafts/stream-test/stream')
+        events = parse_events(chunks)
+
+        self.assertEqual([(event, event_id) for event, event_id, _ in events], [('pick', '1'), ('pick', '2'), ('pick', '3')])
+        first = events[0][2]
+        self.assertEqual(first['pick']['player_name'], 'Brandon Aiyuk')
+        self.assertIn('overall', first['inflation'])
+        self.assertIn('WR', first['inflation']['positional'])
+        slot = str(first['pick']['draft_slot'])
+        self.assertEqual(first['team_budget'][slot]['totalSpend'], int(self.draft_data[0]['metadata']['amount']))
+        self.assertTrue(any(chunk.startswith(b': heartbeat') for chunk in chunks))
+
+    def test_resume_from_last_event_id(self):
+        polls = [self.draft_data[:5], EndOfPolls()]
+        events = parse_events(self.read_stream(polls, '/drafts/stream-test/stream', {'Last-Event-ID': '3'}))
+        self.assertEqual([event_id for _, event_id, _ in events], ['4', '5'])
+
+        polls = [self.draft_data[:5], EndOfPolls()]
+        events = parse_events(self.read_stream(polls, '/drafts/stream-test/stream?since=4'))
+        self.assertEqual([event_id for _, event_id, _ in events], ['5'])
+
+    def test_open_streams_are_capped(self):
+        with patch('backend.trial_backend.open_streams', threading.BoundedSemaphore(1)):
+            first = self.client.get('/drafts/stream-test/stream', buffered=False)
+            self.assertEqual(first.status_code, 200)
+            rejected = self.client.get('/drafts/stream-test/stream', buffered=False)
+            self.assertEqual(rejected.status_code, 503)
+            self.assertEqual(rejected.headers['Retry-After'], '5')
+
+            first.close()
+            second = self.client.get('/drafts/stream-test/stream', buffered=False)
+            self.assertEqual(second.status_code, 200)
+            second.close()
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/drafts/stream-test/stream?since=abc')
+        self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
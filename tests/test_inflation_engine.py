@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import pandas as pd
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.player_index import PlayerIndex
+from backend.inflation_engine import build_picks_frame, calculate_doe, calculate_inflation, count_picks_per_tier
+
+def make_pick(first_name, last_name, position, amount, pick_no=1, team=''):
+    return {
+        'pick_no': pick_no,
+        'draft_slot': 1,
+        'metadata': {'first_name': first_name, 'last_name': last_name, 'position': position,
+                     'amount': str(amount), 'team': team},
+    }
+
+class TestInflationEngine(unittest.TestCase):
+
+    def setUp(self):
+        expected_values = pd.DataFrame([
+            {'Player': 'Josh Allen', 'Position': 'QB', 'Team': 'BUF', 'Value': 40, 'Tier': 1},
+            {'Player': 'Jalen Hurts', 'Position': 'QB', 'Team': 'PHI', 'Value': 20, 'Tier': 1},
+            {'Player': 'Bijan Robinson', 'Position': 'RB', 'Team': 'ATL', 'Value': 50, 'Tier': 1},
+            {'Player': 'Rico Dowdle', 'Position': 'RB', 'Team': 'DAL', 'Value': 5, 'Tier': 12},
+        ])
+        self.player_index = PlayerIndex(expected_values)
+        self.tiers_by_position = {'QB': [1, 2], 'RB': [1, 12]}
+        self.draft_data = [
+            make_pick('Josh', 'Allen', 'QB', 50, 1),
+            make_pick('Jalen', 'Hurts', 'QB', 10, 2),
+            make_pick('Bijan', 'Robinson', 'RB', 60, 3),
+            make_pick('Rico', 'Dowdle', 'RB', 10, 4),
+            make_pick('Unknown', 'Player', 'RB', 5, 5),
+            make_pick('Harrison', 'Butker', 'K', 1, 6),
+        ]
+
+    def test_matches_loop_totals(self):
+        picks = build_picks_frame(self.draft_data, self.player_index)
+        inflation = calculate_inflation(picks, self.tiers_by_position)
+
+        # 135 spent on skill players against 115 expected
+        self.assertAlmostEqual(inflation['overall'], (135 - 115) / 115)
+        self.assertAlmostEqual(inflation['positional']['QB'], 0.0)
+        self.assertAlmostEqual(inflation['positional']['RB'], (75 - 55) / 55)
+        self.assertEqual(inflation['positional']['TE'], 0)
+
+    def test_covers_every_tier(self):
+        picks = build_picks_frame(self.draft_data, self.player_index)
+        tiered = calculate_inflation(picks, self.tiers_by_position)['positional_tiered']
+
+        self.assertEqual(list(tiered['RB']), [1, 12])
+        self.assertAlmostEqual(tiered['RB'][12], 1.0)
+        self.assertEqual(tiered['QB'][2], 0)
+        self.assertIsInstance(tiered['QB'][1], float)
+
+    def test_empty_draft(self):
+        picks = build_picks_frame([], self.player_index)
+        inflation = calculate_inflation(picks, self.tiers_by_position)
+        self.assertEqual(inflation['overall'], 0)
+        self.assertEqual(inflation['positional_tiered']['QB'], {1: 0, 2: 0})
+
+    def test_picks_per_tier_and_doe(self):
+        picks = build_picks_frame(self.draft_data, self.player_index)
+
+        self.assertEqual(count_picks_per_tier(picks), {'QB': {1: 2}, 'RB': {1: 1, 12: 1}, 'WR': {}, 'TE': {}})
+
+        doe_values = calculate_doe(picks)
+        self.assertAlmostEqual(doe_values['QB'][1], ((50 - 40) + (10 - 20)) / 2)
+        self.assertAlmostEqual(doe_values['RB'][12], 5)
+        # Kickers have no tier but still get an entry, as in calculate_doe_values
+        self.assertEqual(doe_values['K'], {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.json_codec import dumps
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestJSONCodec(unittest.TestCase):
+
+    def test_numpy_and_pandas_values(self):
+        data = {
+            'int': np.int64(3),
+            'float': np.float32(0.5),
+            'bool': np.bool_(True),
+            'array': np.array([1, 2]),
+            'series': pd.Series([1.5, 2.5]),
+            'timestamp': pd.Timestamp('2024-08-25T12:00:00'),
+            'missing': [pd.NA, pd.NaT],
+        }
+        self.assertEqual(json.loads(dumps(data)), {
+            'int': 3, 'float': 0.5, 'bool': True, 'array': [1, 2], 'series': [1.5, 2.5],
+            'timestamp': '2024-08-25T12:00:00', 'missing': [None, None],
+        })
+
+    def test_nan_and_infinity_become_null(self):
+        text = dumps({'a': [1.0, float('nan'), np.float64('inf')], 'b': {'c': np.float32('nan')}, 'd': 'NaN'})
+        self.assertEqual(json.loads(text), {'a': [1.0, None, None], 'b': {'c': None}, 'd': 'NaN'})
+
+    def test_unsupported_types_still_raise(self):
+        with self.assertRaises(TypeError):
+            dumps({'a': object()})
+
+class TestInflationSerialization(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def get(self, url):
+        client = trial_backend.app.test_client()
+        with patch('backend.trial_backend.get_draft_data', return_value=self.draft_data):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+        return response
+
+    def test_native_numbers(self):
+        data = self.get('/inflation?draft_id=codec-test').get_json()
+        self.assertIsInstance(data['overall_inflation'], float)
+        self.assertIsInstance(data['total_picks']['QB'], int)
+
+        records = self.get('/reference').get_json()['expected_values']
+        self.assertIsInstance(records[0]['Value'], (int, float))
+        self.assertTrue(all(value is None or not (isinstance(value, float) and math.isnan(value))
+                            for record in records for value in record.values()))
+
+    def test_string_numbers_compatibility(self):
+        native = self.get('/inflation?draft_id=codec-test')
+        legacy = self.get('/inflation?draft_id=codec-test&numbers=string')
+        native_data, legacy_data = native.get_json(), legacy.get_json()
+        self.assertEqual(legacy_data['overall_inflation'], str(native_data['overall_inflation']))
+        self.assertEqual(legacy_data['total_picks']['QB'], str(native_data['total_picks']['QB']))
+        self.assertLess(len(native.data), len(legacy.data))
+
+        with patch.object(trial_backend, 'STRING_NUMBERS', True):
+            data = self.get('/draft_snapshot?draft_id=codec-test&include=picks_per_tier').get_json()
+        self.assertEqual(data['total_picks']['QB'], str(native_data['total_picks']['QB']))
+        self.assertEqual(data['pick_count'], str(len(self.draft_data)))
+
+if __name__ == '__main__':
+    unittest.main()
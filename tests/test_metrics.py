@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.metrics import Metrics
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestMetrics(unittest.TestCase):
+
+    def test_stage_histogram(self):
+        now = [0.0]
+        metrics = Metrics(latency_buckets=(0.1, 1.0), clock=lambda: now[0])
+
+        @metrics.timed('fetch')
+        def fetch():
+            now[0] += 0.5
+
+        fetch()
+        with self.assertRaises(ValueError):
+            with metrics.stage('fetch'):
+                now[0] += 2.0
+                raise ValueError()
+
+        text = metrics.render()
+        self.assertIn('backend_stage_seconds_bucket{stage="fetch",le="0.1"} 0', text)
+        self.assertIn('backend_stage_seconds_bucket{stage="fetch",le="1.0"} 1', text)
+        self.assertIn('backend_stage_seconds_bucket{stage="fetch",le="+Inf"} 2', text)
+        self.assertIn('backend_stage_seconds_sum{stage="fetch"} 2.5', text)
+        self.assertEqual(metrics.stage_summary('fetch'), (2, 2.5))
+
+    def test_counters_and_labelled_gauges(self):
+        metrics = Metrics()
+        metrics.increment('uploads_total')
+        metrics.observe_payload('inflation', 2048)
+        text = metrics.render(counters={'cache_total': {(('result', 'hit'),): 3}}, gauges={'ready': True})
+        self.assertIn('# TYPE uploads_total counter\nuploads_total 1\n', text)
+        self.assertIn('cache_total{result="hit"} 3', text)
+        self.assertIn('# TYPE ready gauge\nready 1\n', text)
+        self.assertIn('backend_response_bytes_bucket{endpoint="inflation",le="4096"} 1', text)
+
+    def test_metrics_endpoint_reports_inflation_stages(self):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            draft_data = json.load(file)
+
+        client = trial_backend.app.test_client()
+        with patch('backend.trial_backend.get_draft_data', return_value=draft_data):
+            self.assertEqual(client.get('/inflation?draft_id=metrics-test').status_code, 200)
+
+        response = client.get('/metrics')
+        self.assertTrue(response.mimetype.startswith('text/plain'))
+        text = response.get_data(as_text=True)
+        for stage in ('draft_state_update', 'json_encode', 'request:get_inflation_rate'):
+            self.assertIn(f'backend_stage_seconds_count{{stage="{stage}"}}', text)
+        self.assertIn('backend_response_bytes_count{endpoint="get_inflation_rate"}', text)
+        self.assertIn('draft_cache_requests_total{result="hit"}', text)
+        self.assertIn('sleeper_requests_total', text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import time
+import json
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.name_resolver import NameResolver, blocking_keys
+from backend.reference_data import load_reference_snapshot
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestNameResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            {'Player': 'Patrick Mahomes II', 'Position': 'QB'},
+            {'Player': 'Bijan Robinson', 'Position': 'RB'},
+            {'Player': 'Brian Robinson Jr.', 'Position': 'RB'},
+            {'Player': "Ja'Marr Chase", 'Position': 'WR'},
+            {'Player': 'Amon-Ra St. Brown', 'Position': 'WR'},
+        ]
+        self.resolver = NameResolver(self.records)
+
+    def test_blocking_keys(self):
+        self.assertEqual(blocking_keys('amon-ra st brown'), [('first', 'a'), ('last', 'bro')])
+        self.assertEqual(blocking_keys(''), [])
+
+    def test_suffix_resolves_without_mappings(self):
+        self.assertEqual(self.resolver.resolve('Patrick Mahomes', 'QB')['Player'], 'Patrick Mahomes II')
+        self.assertEqual(self.resolver.candidates('Patrick Mahomes', 'QB')[0][1], 100)
+
+    def test_close_spelling_resolves(self):
+        self.assertEqual(self.resolver.resolve('Jamarr Chase', 'WR')['Player'], "Ja'Marr Chase")
+        self.assertEqual(self.resolver.resolve('Amon-Ra St Brown')['Player'], 'Amon-Ra St. Brown')
+
+    def test_ranked_candidates_stay_within_blocks(self):
+        ranked = self.resolver.candidates('Brian Robinson', 'RB')
+        self.assertEqual([record['Player'] for record, _ in ranked], ['Brian Robinson Jr.', 'Bijan Robinson'])
+        self.assertGreater(ranked[0][1], ranked[1][1])
+        # Other positions are never scored
+        self.assertEqual(self.resolver.candidates('Brian Robinson', 'QB'), [])
+
+    def test_similar_names_are_not_auto_resolved(self):
+        resolver = NameResolver(self.records[1:2])
+        self.assertIsNone(resolver.resolve('Brian Robinson', 'RB'))
+        self.assertEqual(len(resolver.candidates('Brian Robinson', 'RB')), 1)
+
+    def test_full_draft_resolves_in_milliseconds(self):
+        reference = load_reference_snapshot(os.path.join(os.path.dirname(TESTS_DIR), 'backend', '2024'))
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            draft_data = json.load(file)
+
+        start = time.perf_counter()
+        resolved = [reference.player_index.lookup_pick(pick) for pick in draft_data]
+        self.assertLess(time.perf_counter() - start, 0.25)
+
+        names = {f"{pick['metadata']['first_name']} {pick['metadata']['last_name']}": record
+                 for pick, record in zip(draft_data, resolved)}
+        # Ranked as "Patrick Mahomes II" and "Kenneth Walker III", priced without the suffix
+        self.assertGreater(names['Patrick Mahomes']['Value'], 0)
+        self.assertGreater(names['Kenneth Walker']['Value'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+import pandas as pd
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.player_index import PlayerIndex, normalize_name
+
+class TestPlayerIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.expected_values = pd.DataFrame([
+            {'Player': 'Mike Williams', 'Position': 'WR', 'Team': 'NYJ', 'Value': 12, 'Tier': 5},
+            {'Player': 'Mike Williams', 'Position': 'WR', 'Team': 'LAC', 'Value': 3, 'Tier': 9},
+            {'Player': 'Marvin Harrison Jr.', 'Position': 'WR', 'Team': 'ARI', 'Value': 36, 'Tier': 3},
+            {'Player': 'Josh Allen', 'Position': 'QB', 'Team': 'BUF', 'Value': 38, 'Tier': 1},
+            {'Player': None, 'Position': None, 'Team': None, 'Value': 0, 'Tier': 7},
+        ])
+        self.index = PlayerIndex(self.expected_values)
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name('Marvin Harrison Jr.'), 'marvin harrison')
+        self.assertEqual(normalize_name('Patrick Mahomes II'), 'patrick mahomes')
+        self.assertEqual(normalize_name('D.J. Moore'), 'dj moore')
+        self.assertEqual(normalize_name(None), '')
+
+    def test_shared_name_resolved_by_team(self):
+        self.assertEqual(self.index.lookup('Mike Williams', 'WR', 'NYJ')['Value'], 12)
+        self.assertEqual(self.index.lookup('Mike Williams', 'WR', 'LAC')['Tier'], 9)
+
+    def test_ambiguous_name_without_team_is_unresolved(self):
+        self.assertIsNone(self.index.lookup('Mike Williams', 'WR'))
+
+    def test_suffix_and_team_fallback(self):
+        pick = {'metadata': {'first_name': 'Marvin', 'last_name': 'Harrison', 'position': 'WR', 'team': 'ARI'}}
+        self.assertEqual(self.index.lookup_pick(pick)['Player'], 'Marvin Harrison Jr.')
+        # A traded player still resolves while the name is unique at the position
+        self.assertEqual(self.index.lookup('Josh Allen', 'QB', 'MIA')['Tier'], 1)
+        self.assertIsNone(self.index.lookup('Josh Allen', 'RB'))
+
+    def test_lookups_are_memoized_including_misses(self):
+        with patch.object(self.index.resolver, 'resolve', return_value=None) as resolve:
+            for _ in range(3):
+                self.assertIsNone(self.index.lookup('Joshua Allenn', 'QB', 'BUF'))
+                self.assertEqual(self.index.lookup('Josh Allen', 'QB', 'BUF')['Value'], 38)
+        resolve.assert_called_once_with('Joshua Allenn', 'QB')
+
+if __name__ == '__main__':
+    unittest.main()
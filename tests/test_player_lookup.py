@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.resolution_cache import PlayerResolutionCache
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestPlayerLookup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+        cls.snapshot = trial_backend.reference_store.current
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = PlayerResolutionCache(self.tmp_dir.name, trial_backend.resolve_player)
+        self.client = trial_backend.app.test_client()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_batch_matches_per_player_resolution(self):
+        players = [(f"{pick['metadata']['first_name']} {pick['metadata']['last_name']}", pick['metadata']['position'])
+                   for pick in self.draft_data]
+        # Mapping anomalies, a name nobody ranks and a position with no rankings
+        players += [(name, position) for name, position in zip(self.snapshot.mappings_df['Sleeper Name'],
+                                                                self.snapshot.mappings_df['Position'])]
+        players += [('Nobody Here', 'QB'), ('Justin Tucker', 'K')]
+
+        expected = [trial_backend.resolve_player(self.snapshot, name, position) for name, position in players]
+        self.assertEqual(trial_backend.resolve_players(self.snapshot, players), expected)
+        self.assertEqual(trial_backend.resolve_players(self.snapshot, []), [])
+
+    def test_route_keeps_response_shape(self):
+        players = [{'first_name': pick['metadata']['first_name'], 'last_name': pick['metadata']['last_name'],
+                    'position': pick['metadata']['position'], 'player_id': pick['player_id']}
+                   for pick in self.draft_data]
+        with patch.object(trial_backend, 'player_resolution_cache', self.cache):
+            results = self.client.post('/player_lookup', json={'players': players}).get_json()
+            self.assertEqual(self.cache.stats()['misses'], len(players))
+            self.assertEqual(self.client.post('/player_lookup', json={'players': players}).get_json(), results)
+            self.assertEqual(self.cache.stats()['hits'], len(players))
+
+        self.assertEqual(len(results), len(players))
+        self.assertEqual(set(results[0]), {'player_name', 'auction_value', 'tier'})
+        by_name = {result['player_name']: result for result in results}
+        self.assertEqual(by_name['Patrick Mahomes']['auction_value'], '$27')
+        self.assertEqual(by_name['Patrick Mahomes']['tier'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.reference_data import load_reference_snapshot
+from backend.reference_artifact import (artifact_path, compile_reference, load_compiled_reference, read_artifact,
+                                        write_artifact)
+
+SEASON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend', '2024')
+
+class TestReferenceArtifact(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parsed = load_reference_snapshot(SEASON_DIR)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.artifact_dir = os.path.join(self.tmp_dir, 'cache')
+
+    def test_snapshot_matches_parsed_csvs(self):
+        compile_reference(SEASON_DIR, self.artifact_dir)
+        snapshot = load_compiled_reference(SEASON_DIR, self.artifact_dir)
+
+        pd.testing.assert_frame_equal(snapshot.expected_values, self.parsed.expected_values)
+        pd.testing.assert_frame_equal(snapshot.auction_values_df, self.parsed.auction_values_df)
+        pd.testing.assert_frame_equal(snapshot.mappings_df, self.parsed.mappings_df)
+        for position, frame in self.parsed.positional_rankings.items():
+            pd.testing.assert_frame_equal(snapshot.positional_rankings[position], frame)
+        self.assertEqual(snapshot.expected_values_records, self.parsed.expected_values_records)
+        self.assertEqual(snapshot.avg_tier_costs, self.parsed.avg_tier_costs)
+        self.assertEqual(snapshot.tiers_by_position, self.parsed.tiers_by_position)
+        self.assertEqual(snapshot.fingerprint, self.parsed.fingerprint)
+
+    def test_typed_columns(self):
+        compile_reference(SEASON_DIR, self.artifact_dir)
+        metadata, tables = read_artifact(artifact_path(self.artifact_dir, '2024'))
+        self.assertEqual(metadata['year'], '2024')
+        self.assertEqual(tables['expected_values']['Tier'].dtype, np.int64)
+        self.assertEqual(tables['expected_values']['Value'].dtype, np.float64)
+        self.assertEqual(tables['expected_values']['Position'].dtype, object)
+
+    def test_changed_csvs_recompile(self):
+        season_dir = os.path.join(self.tmp_dir, '2024')
+        shutil.copytree(SEASON_DIR, season_dir)
+        first = load_compiled_reference(season_dir, self.artifact_dir)
+
+        path = os.path.join(season_dir, 'Standard_Auction_Values.csv')
+        frame = pd.read_csv(path)
+        frame.loc[0, 'Value'] = '$99'
+        frame.to_csv(path, index=False)
+
+        second = load_compiled_reference(season_dir, self.artifact_dir)
+        self.assertNotEqual(second.fingerprint, first.fingerprint)
+        player = frame.loc[0, 'Player']
+        self.assertEqual(second.expected_values.loc[second.expected_values['Player'] == player, 'Value'].iloc[0], 99)
+        self.assertEqual(read_artifact(artifact_path(self.artifact_dir, '2024'))[0]['fingerprint'], second.fingerprint)
+
+    def test_unreadable_artifact_is_rebuilt(self):
+        os.makedirs(self.artifact_dir)
+        path = artifact_path(self.artifact_dir, '2024')
+        with open(path, 'wb') as f:
+            f.write(b'not an artifact')
+
+        snapshot = load_compiled_reference(SEASON_DIR, self.artifact_dir)
+        self.assertEqual(snapshot.fingerprint, self.parsed.fingerprint)
+        self.assertEqual(read_artifact(path)[0]['fingerprint'], self.parsed.fingerprint)
+
+    def test_mixed_and_missing_cells_round_trip(self):
+        frame = pd.DataFrame({
+            'Tier': [1, 'N/A', 2],
+            'Team': ['KC', np.nan, 'KC'],
+            'Value': [10.5, np.nan, 0.0],
+            'RK': np.array([1, 2, 3], dtype=np.int16),
+        })
+        path = os.path.join(self.tmp_dir, 'mixed.bin')
+        write_artifact(path, {'mixed': frame, 'empty': frame.iloc[:0]}, {})
+
+        tables = read_artifact(path)[1]
+        pd.testing.assert_frame_equal(tables['mixed'], frame)
+        self.assertEqual(len(tables['empty']), 0)
+        self.assertEqual(list(tables['empty'].columns), list(frame.columns))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import sys
+import os
+import io
+import shutil
+import tempfile
+import threading
+import time
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.reference_data import ReferenceStore, load_reference_snapshot, ranking_filenames, write_atomically
+import backend.trial_backend as trial_backend
+
+SEASON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend', '2024')
+
+class TestReferenceSnapshot(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.snapshot = load_reference_snapshot(SEASON_DIR)
+
+    def test_values_are_typed_once(self):
+        self.assertEqual(self.snapshot.year, '2024')
+        self.assertEqual(self.snapshot.expected_values['Value'].dtype.kind, 'f')
+        self.assertFalse(self.snapshot.expected_values['Value'].isna().any())
+        # The published auction values keep their "$" strings for the lookup endpoints
+        self.assertTrue(str(self.snapshot.auction_values_df['Value'].iloc[0]).startswith('$'))
+
+    def test_tiers_come_from_rankings(self):
+        self.assertEqual(max(self.snapshot.tiers_by_position['WR']), 14)
+
+    def test_snapshot_is_immutable(self):
+        with self.assertRaises(Exception):
+            self.snapshot.year = '2023'
+
+class TestReferenceStore(unittest.TestCase):
+
+    def test_failed_reload_keeps_current_snapshot(self):
+        def broken_loader(data_dir):
+            raise FileNotFoundError(data_dir)
+
+        store = ReferenceStore('current', loader=broken_loader)
+        store.reload_in_background('/missing').join()
+        self.assertEqual(store.current, 'current')
+        self.assertFalse(store.reloading)
+        self.assertIn('/missing', store.last_error)
+
+class TestWriteAtomically(unittest.TestCase):
+
+    def test_concurrent_writers_of_one_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rankings.csv')
+            contents = [str(i).encode() * 100000 for i in range(8)]
+            errors = []
+
+            def write(content):
+                try:
+                    write_atomically(path, content)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=write, args=(content,)) for content in contents]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            with open(path, 'rb') as f:
+                self.assertIn(f.read(), contents)
+            # Every temp file was either moved into place or removed
+            self.assertEqual(os.listdir(tmp_dir), ['rankings.csv'])
+
+class TestRankingsUpload(unittest.TestCase):
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.original_base_dir = trial_backend.BASE_DIR
+        self.original_snapshot = trial_backend.reference_store.current
+        self.original_artifact_dir = trial_backend.REFERENCE_ARTIFACT_DIR
+        trial_backend.BASE_DIR = self.base_dir
+        trial_backend.REFERENCE_ARTIFACT_DIR = os.path.join(self.base_dir, 'cache')
+        self.client = trial_backend.app.test_client()
+
+    def tearDown(self):
+        trial_backend.BASE_DIR = self.original_base_dir
+        trial_backend.REFERENCE_ARTIFACT_DIR = self.original_artifact_dir
+        trial_backend.reference_store.current = self.original_snapshot
+        shutil.rmtree(self.base_dir)
+
+    def season_files(self):
+        files = {position: (open(os.path.join(SEASON_DIR, filename), 'rb'), filename)
+                 for position, filename in ranking_filenames('2024').items()}
+        files['auction_values'] = (open(os.path.join(SEASON_DIR, 'Standard_Auction_Values.csv'), 'rb'),
+                                   'Standard_Auction_Values.csv')
+        return files
+
+    def test_upload_new_season_swaps_snapshot(self):
+        data = {'year': '2024', **self.season_files()}
+        response = self.client.post('/rankings', data=data, content_type='multipart/form-data')
+        for handle, _ in list(data.values())[1:]:
+            handle.close()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(os.path.exists(os.path.join(self.base_dir, '2024', 'Standard_Auction_Values.csv')))
+
+        deadline = time.time() + 10
+        while trial_backend.reference_store.reloading and time.time() < deadline:
+            time.sleep(0.01)
+        snapshot = trial_backend.reference_store.current
+        self.assertIsNot(snapshot, self.original_snapshot)
+        self.assertEqual(snapshot.data_dir, os.path.join(self.base_dir, '2024'))
+        self.assertTrue(os.path.exists(os.path.join(self.base_dir, 'cache', 'reference_2024.bin')))
+
+    def test_incomplete_season_is_rejected(self):
+        data = {'year': '2031', 'QB': (io.BytesIO(b'RK,TIERS,PLAYER NAME\n1,1,Josh Allen\n'), 'qb.csv')}
+        response = self.client.post('/rankings', data=data, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('missing_files', response.get_json())
+        self.assertIs(trial_backend.reference_store.current, self.original_snapshot)
+
+    def test_missing_columns_are_rejected(self):
+        data = {'QB': (io.BytesIO(b'Name,Rank\nJosh Allen,1\n'), 'qb.csv')}
+        response = self.client.post('/rankings', data=data, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('QB', response.get_json()['files'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import dataclasses
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestReferenceEndpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def setUp(self):
+        self.client = trial_backend.app.test_client()
+
+    def test_serves_expected_values_with_version_etag(self):
+        snapshot = trial_backend.reference_store.current
+        response = self.client.get('/reference')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['year'], snapshot.year)
+        self.assertEqual(len(data['expected_values']), len(snapshot.expected_values))
+        self.assertEqual(response.headers['ETag'], f'"{data["version"]}"')
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+        self.assertNotIn('no-store', response.headers['Cache-Control'])
+
+    def test_revalidation_returns_304(self):
+        etag = self.client.get('/reference').headers['ETag']
+        response = self.client.get('/reference', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        response = self.client.get('/reference', headers={'If-None-Match': '"stale"'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_inflation_returns_version_only(self):
+        with patch('backend.trial_backend.get_draft_data', return_value=self.draft_data):
+            response = self.client.post('/inflation', json={'draft_id': 'reference-test'})
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertNotIn('expected_values', data)
+        self.assertEqual(data['reference_version'], self.client.get('/reference').get_json()['version'])
+        self.assertLess(len(response.data), 20000)
+
+    def test_version_follows_content(self):
+        snapshot = trial_backend.reference_store.current
+        version = trial_backend.get_reference_payload(snapshot)[0]
+
+        # A reload of the same files gets the same version, changed values a new one
+        reloaded = dataclasses.replace(snapshot, expected_values_records=list(snapshot.expected_values_records))
+        self.assertEqual(trial_backend.get_reference_payload(reloaded)[0], version)
+        changed = dataclasses.replace(snapshot, expected_values_records=[
+            dict(snapshot.expected_values_records[0], Value=999)] + snapshot.expected_values_records[1:])
+        self.assertNotEqual(trial_backend.get_reference_payload(changed)[0], version)
+
+if __name__ == '__main__':
+    unittest.main()
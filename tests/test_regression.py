@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+
+import numpy as np
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.draft_state import DraftState
+from backend.regression import RunningRegression, price_curves
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def least_squares(x, y):
+    slope, intercept = np.polyfit(x, y, 1)
+    predicted = slope * np.asarray(x) + intercept
+    r2 = 1 - ((np.asarray(y) - predicted) ** 2).sum() / ((np.asarray(y) - np.mean(y)) ** 2).sum()
+    return slope, intercept, r2
+
+class TestRunningRegression(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def test_matches_least_squares(self):
+        rng = np.random.default_rng(0)
+        x = np.arange(1, 201)
+        y = np.maximum(1, 80 - 0.35 * x + rng.normal(0, 6, len(x))).round().astype(int)
+        regression = RunningRegression()
+        for xi, yi in zip(x.tolist(), y.tolist()):
+            regression.add(xi, yi)
+
+        fit = regression.fit()
+        slope, intercept, r2 = least_squares(x, y)
+        self.assertAlmostEqual(fit['slope'], slope)
+        self.assertAlmostEqual(fit['intercept'], intercept)
+        self.assertAlmostEqual(fit['r2'], r2)
+        self.assertEqual(fit['n'], 200)
+
+    def test_degenerate_inputs(self):
+        regression = RunningRegression()
+        self.assertIsNone(regression.fit())
+        regression.add(5, 10)
+        regression.add(5, 20)
+        # Two points at the same pick number have no slope
+        self.assertIsNone(regression.fit())
+        regression.add(6, 10)
+        self.assertIsNotNone(regression.fit())
+
+        flat = RunningRegression()
+        for x in range(1, 5):
+            flat.add(x, 1)
+        self.assertEqual(flat.fit(), {'slope': 0.0, 'intercept': 1.0, 'r2': 1.0, 'n': 4})
+
+    def test_r2_by_position_matches_least_squares(self):
+        r2_values = trial_backend.calculate_r2_by_position(self.draft_data)
+        for position in trial_backend.R2_POSITIONS:
+            picks = [pick for pick in self.draft_data if pick['metadata']['position'] == position]
+            x = [pick['pick_no'] for pick in picks]
+            y = [int(pick['metadata']['amount']) for pick in picks]
+            r2 = least_squares(x, y)[2]
+            self.assertAlmostEqual(r2_values[position]['r2'], r2)
+            self.assertAlmostEqual(r2_values[position]['cost_of_waiting']['5_picks'], r2 * 0.025)
+
+        self.assertEqual(trial_backend.calculate_r2_by_position(self.draft_data[:1])['QB']['r2'], 'N/A')
+
+    def test_draft_state_updates_curves_per_pick(self):
+        reference = trial_backend.reference_store.current
+        state = DraftState('curves', reference)
+        state.apply(self.draft_data[:100])
+        state.apply(self.draft_data)
+
+        rebuilt = price_curves((pick['metadata']['position'], None, pick['pick_no'], int(pick['metadata']['amount']))
+                               for pick in self.draft_data)
+        for position in trial_backend.R2_POSITIONS:
+            self.assertAlmostEqual(state.price_curves.fit(position)['r2'], rebuilt.fit(position)['r2'])
+
+        lines = state.price_curves.trend_lines(trial_backend.R2_POSITIONS)
+        rb = lines['RB']
+        self.assertEqual(rb['pick_no'], [min(p['pick_no'] for p in self.draft_data if p['metadata']['position'] == 'RB'),
+                                         max(p['pick_no'] for p in self.draft_data if p['metadata']['position'] == 'RB')])
+        self.assertAlmostEqual(rb['price'][0], rb['intercept'] + rb['slope'] * rb['pick_no'][0])
+        self.assertTrue(rb['tiers'])
+        self.assertLessEqual(sum(tier['n'] for tier in rb['tiers'].values()), rb['n'])
+
+    def test_scatter_data_has_trend_lines(self):
+        client = trial_backend.app.test_client()
+        with patch('backend.trial_backend.get_draft_data', return_value=self.draft_data):
+            data = client.get('/scatter_data?draft_id=regression-test').get_json()
+        self.assertEqual(set(data['trend_lines']), set(trial_backend.R2_POSITIONS))
+        self.assertAlmostEqual(data['trend_lines']['WR']['r2'], data['r2_values']['WR']['r2'])
+
+if __name__ == '__main__':
+    unittest.main()
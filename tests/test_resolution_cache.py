@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+from dataclasses import replace
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.resolution_cache import PlayerResolutionCache
+
+class TestPlayerResolutionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.snapshot = trial_backend.reference_store.current
+        self.calls = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def resolve(self, snapshot, player_name, position):
+        self.calls.append(player_name)
+        return trial_backend.resolve_player(snapshot, player_name, position)
+
+    def test_repeat_lookups_hit_the_cache(self):
+        cache = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        first = cache.get(self.snapshot, '4046', 'Patrick Mahomes', 'QB')
+        self.assertIs(cache.get(self.snapshot, 4046, 'Patrick Mahomes', 'QB'), first)
+        self.assertEqual(self.calls, ['Patrick Mahomes'])
+        self.assertEqual(cache.stats(), {'entries': 1, 'hits': 1, 'misses': 1})
+
+        # Ranked as "Patrick Mahomes II", so the tier comes through the player index
+        self.assertEqual(first['auction_name'], 'Patrick Mahomes')
+        self.assertEqual(first['tier_name'], 'Patrick Mahomes II')
+        self.assertEqual(first['tier'], 1)
+
+    def test_saved_resolutions_survive_restart(self):
+        cache = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        cache.get(self.snapshot, '4046', 'Patrick Mahomes', 'QB')
+        self.assertTrue(cache.save())
+        self.assertFalse(cache.save())
+
+        restarted = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        self.assertEqual(restarted.warm(self.snapshot), 1)
+        restarted.get(self.snapshot, '4046', 'Patrick Mahomes', 'QB')
+        self.assertEqual(self.calls, ['Patrick Mahomes'])
+
+    def test_workers_saving_one_file_keep_each_others_entries(self):
+        # Two caches on one folder stand in for two worker processes
+        first = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        second = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        first.get(self.snapshot, '4046', 'Patrick Mahomes', 'QB')
+        second.get(self.snapshot, '4984', 'Josh Allen', 'QB')
+        self.assertTrue(first.save())
+        self.assertTrue(second.save())
+
+        restarted = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        self.assertEqual(restarted.warm(self.snapshot), 2)
+
+    def test_new_reference_data_invalidates(self):
+        cache = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        cache.get(self.snapshot, '4046', 'Patrick Mahomes', 'QB')
+        cache.save()
+
+        updated = replace(self.snapshot, fingerprint='updated')
+        self.assertEqual(cache.warm(updated), 0)
+        cache.get(updated, '4046', 'Patrick Mahomes', 'QB')
+        self.assertEqual(len(self.calls), 2)
+        cache.save()
+
+        restarted = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        self.assertEqual(restarted.warm(self.snapshot), 0)
+
+    def test_player_lookup_uses_player_id(self):
+        cache = PlayerResolutionCache(self.tmp_dir.name, self.resolve)
+        players = [{'first_name': 'Patrick', 'last_name': 'Mahomes', 'position': 'QB', 'player_id': '4046'}]
+        client = trial_backend.app.test_client()
+        with patch.object(trial_backend, 'player_resolution_cache', cache):
+            for _ in range(3):
+                response = client.post('/player_lookup', json={'players': players})
+                self.assertEqual(response.get_json(), [{'player_name': 'Patrick Mahomes', 'auction_value': '$27', 'tier': 1}])
+        self.assertEqual(cache.stats(), {'entries': 1, 'hits': 2, 'misses': 1})
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir.name, f"player_resolution_{self.snapshot.year}.json")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.reference_data import SeasonRegistry, discover_seasons
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestSeasonRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp_dir.name
+        for name in ['2021', '2022', '2023', 'cache', '1999']:
+            os.makedirs(os.path.join(self.base_dir, name))
+        self.loaded = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def loader(self, data_dir):
+        self.loaded.append(os.path.basename(data_dir))
+        time.sleep(0.01)
+        return SimpleNamespace(year=os.path.basename(data_dir))
+
+    def test_default_is_newest_folder_not_most_recently_touched(self):
+        os.utime(os.path.join(self.base_dir, '2021'), (time.time() + 60, time.time() + 60))
+        registry = SeasonRegistry(self.base_dir, loader=self.loader)
+        self.assertEqual(discover_seasons(self.base_dir), ['2021', '2022', '2023'])
+        self.assertEqual(registry.default, '2023')
+        self.assertEqual(registry.get().year, '2023')
+        # Only the default season is loaded up front
+        self.assertEqual(self.loaded, ['2023'])
+
+        self.assertEqual(SeasonRegistry(self.base_dir, loader=self.loader, default='2022').get().year, '2022')
+
+    def test_seasons_load_lazily_and_least_recently_used_is_evicted(self):
+        registry = SeasonRegistry(self.base_dir, loader=self.loader, max_loaded=2)
+        self.assertEqual(registry.get('2021').year, '2021')
+        self.assertIs(registry.store('2021'), registry.store('2021'))
+        self.assertEqual(self.loaded, ['2023', '2021'])
+
+        registry.get('2022')
+        # The default season is never evicted
+        self.assertEqual(registry.loaded(), ['2023', '2022'])
+        self.assertEqual(registry.stats()['evictions'], 1)
+        registry.get('2021')
+        self.assertEqual(self.loaded, ['2023', '2021', '2022', '2021'])
+
+        for season in ['1999', 'cache', '2030', '../2021']:
+            with self.assertRaises(KeyError):
+                registry.store(season)
+
+    def test_concurrent_first_use_loads_once(self):
+        registry = SeasonRegistry(self.base_dir, loader=self.loader)
+        threads = [threading.Thread(target=registry.get, args=('2021',)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.loaded.count('2021'), 1)
+
+class TestSeasonParameter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def setUp(self):
+        self.client = trial_backend.app.test_client()
+        patcher = patch('backend.trial_backend.get_draft_data', return_value=self.draft_data)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_endpoints_use_requested_season(self):
+        default = self.client.get('/reference').get_json()
+        past = self.client.get('/reference?season=2023').get_json()
+        self.assertEqual((default['year'], past['year']), ('2024', '2023'))
+        self.assertNotEqual(default['version'], past['version'])
+
+        status = self.client.get('/rankings/status?season=2023').get_json()
+        self.assertEqual((status['year'], status['reference_version']), ('2023', past['version']))
+        self.assertIn('2023', status['loaded_seasons'])
+
+        current = self.client.get('/inflation?draft_id=season-test').get_json()
+        previous = self.client.get('/inflation?draft_id=season-test&season=2023').get_json()
+        self.assertEqual(current['reference_version'], default['version'])
+        self.assertEqual(previous['reference_version'], past['version'])
+        self.assertNotEqual(current['overall_inflation'], previous['overall_inflation'])
+        # Switching back reuses the draft's running state for the default season
+        self.assertEqual(self.client.get('/inflation?draft_id=season-test').get_json(), current)
+
+    def test_unknown_season(self):
+        response = self.client.get('/inflation?draft_id=season-test&season=1999')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('2024', response.get_json()['seasons'])
+
+if __name__ == '__main__':
+    unittest.main()
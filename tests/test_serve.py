@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import importlib.util
+import re
+import urllib.request
+
+import pandas as pd
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.reference_data import SeasonRegistry
+from backend.serve import reload_changed_seasons
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+
+class TestReloadChangedSeasons(unittest.TestCase):
+
+    def test_only_changed_seasons_reload(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            shutil.copytree(os.path.join(BACKEND_DIR, '2024'), os.path.join(base_dir, '2024'))
+            registry = SeasonRegistry(base_dir)
+            snapshot = registry.get()
+            self.assertEqual(reload_changed_seasons(registry), [])
+            self.assertIs(registry.get(), snapshot)
+
+            path = os.path.join(base_dir, '2024', 'Standard_Auction_Values.csv')
+            frame = pd.read_csv(path)
+            frame.loc[0, 'Value'] = '$99'
+            frame.to_csv(path, index=False)
+            self.assertEqual(reload_changed_seasons(registry), ['2024'])
+            self.assertNotEqual(registry.get().fingerprint, snapshot.fingerprint)
+
+@unittest.skipUnless(importlib.util.find_spec('gunicorn'), "production serving needs gunicorn")
+class TestGunicornServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        env = dict(os.environ, DRAFT_POLLER_ENABLED='0', LOG_LEVEL='WARNING',
+                   REFERENCE_ARTIFACT_DIR=self.tmp_dir.name, PLAYER_CACHE_DIR=self.tmp_dir.name,
+                   SHARED_CACHE_PATH=os.path.join(self.tmp_dir.name, 'shared.sqlite3'),
+                   DRAFT_ARCHIVE_DIR=os.path.join(self.tmp_dir.name, 'archive'))
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', os.path.join(BACKEND_DIR, 'gunicorn.conf.py'),
+             '--bind', '127.0.0.1:0', '--workers', '2', '--max-requests', '3', '--max-requests-jitter', '0',
+             '--graceful-timeout', '5', 'backend.trial_backend:app'],
+            cwd=os.path.dirname(BACKEND_DIR), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, text=True)
+        self.addCleanup(self.stop)
+        for line in self.process.stderr:
+            match = re.search(r'Listening at: (http://\S+)', line)
+            if match:
+                self.base_url = match.group(1)
+                break
+        # Keep reading the log so the server never blocks on a full pipe
+        self.drain = threading.Thread(target=self.process.stderr.read, daemon=True)
+        self.drain.start()
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.drain.join(10)
+        self.process.stderr.close()
+
+    def get_json(self, path):
+        # Connections made while the master preloads wait in the backlog until a worker accepts them
+        with urllib.request.urlopen(self.base_url + path, timeout=60) as response:
+            return response.status, json.loads(response.read())
+
+    def test_workers_serve_recycle_and_stop_gracefully(self):
+        pids = set()
+        for _ in range(12):
+            status, body = self.get_json('/ready')
+            self.assertEqual(status, 200)
+            self.assertEqual(body['season'], '2024')
+            pids.add(body['pid'])
+        self.assertNotIn(self.process.pid, pids)
+        # Two workers recycled every three requests
+        self.assertGreater(len(pids), 2)
+
+        self.assertEqual(self.get_json('/ready?season=2023')[1]['season'], '2023')
+
+        self.process.send_signal(signal.SIGTERM)
+        self.assertEqual(self.process.wait(timeout=30), 0)
+
+if __name__ == '__main__':
+    unittest.main()
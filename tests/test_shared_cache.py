@@ -0,0 +1,136 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import multiprocessing
+import tempfile
+import threading
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.shared_cache import SharedCache
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def store_in_child(path, key, value):
+    SharedCache(path).put(key, value, ttl=60)
+
+class TestSharedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'shared.sqlite3')
+        self.now = [1000.0]
+
+    def cache(self, **kwargs):
+        return SharedCache(self.path, clock=lambda: self.now[0], **kwargs)
+
+    def test_entries_expire_after_ttl(self):
+        cache = self.cache()
+        self.assertTrue(cache.put('picks:1', [{'pick_no': 1}], ttl=5))
+        self.now[0] += 4.9
+        self.assertEqual(cache.get('picks:1'), [{'pick_no': 1}])
+        self.now[0] += 0.1
+        self.assertIsNone(cache.get('picks:1'))
+        self.assertEqual({key: cache.stats()[key] for key in ['hits', 'misses']}, {'hits': 1, 'misses': 1})
+
+    def test_least_recently_used_are_evicted_over_size_bound(self):
+        values = {f'draft:{i}': os.urandom(500).hex() for i in range(3)}
+        cache = self.cache()
+        cache.put('draft:0', values['draft:0'], ttl=60)
+        # Room for two of the entries but not three
+        cache.max_bytes = int(cache.stats()['bytes'] * 2.5)
+        self.now[0] += 2
+        cache.put('draft:1', values['draft:1'], ttl=60)
+        self.now[0] += 2
+        self.assertIsNotNone(cache.get('draft:0'))
+        self.now[0] += 2
+        cache.put('draft:2', values['draft:2'], ttl=60)
+
+        self.assertIsNone(cache.get('draft:1'))
+        self.assertEqual(cache.get('draft:0'), values['draft:0'])
+        self.assertEqual(cache.get('draft:2'), values['draft:2'])
+        stats = cache.stats()
+        self.assertEqual((stats['evictions'], stats['entries']), (1, 2))
+        self.assertLessEqual(stats['bytes'], cache.max_bytes)
+
+    def test_visible_across_processes(self):
+        process = multiprocessing.Process(target=store_in_child, args=(self.path, 'picks:7', {'picks': [1, 2]}))
+        process.start()
+        process.join(30)
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(SharedCache(self.path).get('picks:7'), {'picks': [1, 2]})
+
+    def test_request_threads_reuse_the_process_connections(self):
+        cache = self.cache()
+        cache.put('picks:1', [1], ttl=60)
+        with patch.object(cache, '_open', wraps=cache._open) as opened:
+            for _ in range(5):
+                thread = threading.Thread(target=cache.get, args=('picks:1',))
+                thread.start()
+                thread.join()
+        opened.assert_not_called()
+        self.assertEqual(cache.stats()['hits'], 5)
+        cache.close()
+        self.assertEqual(cache._pool, [])
+
+    def test_unusable_file_only_misses(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a database' * 100)
+        cache = self.cache()
+        self.assertFalse(cache.put('picks:1', [1], ttl=5))
+        self.assertIsNone(cache.get('picks:1'))
+        self.assertEqual(cache.stats()['errors'], 2)
+
+class TestSharedDraftCaching(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.draft_data = json.load(file)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'shared.sqlite3')
+        self.client = trial_backend.app.test_client()
+
+    def use_worker_cache(self):
+        """A fresh SharedCache on the same file, standing in for another worker process."""
+        patcher = patch('backend.trial_backend.shared_cache', SharedCache(self.path))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_picks_are_fetched_once_per_host(self):
+        with patch('backend.trial_backend.fetch_draft_data', return_value=self.draft_data) as fetch:
+            for _ in range(2):
+                with patch('backend.trial_backend.shared_cache', SharedCache(self.path)):
+                    self.assertEqual(trial_backend.fetch_shared_draft_data('shared-picks'), self.draft_data)
+        fetch.assert_called_once_with('shared-picks')
+
+    def test_analytics_computed_by_one_worker_are_reused(self):
+        with patch('backend.trial_backend.get_draft_data', return_value=self.draft_data):
+            with patch('backend.trial_backend.shared_cache', SharedCache(self.path)):
+                inflation = self.client.get('/inflation?draft_id=shared-analytics').get_json()
+                snapshot = self.client.get('/draft_snapshot?draft_id=shared-analytics&include=inflation').get_json()
+
+            self.use_worker_cache()
+            with patch('backend.trial_backend.get_draft_state', side_effect=AssertionError("recomputed")):
+                self.assertEqual(self.client.get('/inflation?draft_id=shared-analytics').get_json(), inflation)
+                self.assertEqual(
+                    self.client.get('/draft_snapshot?draft_id=shared-analytics&include=inflation').get_json(),
+                    snapshot)
+            self.assertEqual(trial_backend.shared_cache.stats()['hits'], 2)
+
+            # Another set of sections, or another pick count, is computed again
+            self.client.get('/draft_snapshot?draft_id=shared-analytics&include=doe_values')
+        with patch('backend.trial_backend.get_draft_data', return_value=self.draft_data[:-1]):
+            self.client.get('/inflation?draft_id=shared-analytics')
+        self.assertEqual(trial_backend.shared_cache.stats()['misses'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
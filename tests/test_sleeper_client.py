@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.sleeper_client import SleeperClient
+
+STUB_PICKS = [{'pick_no': 1, 'draft_slot': 1, 'metadata': {'position': 'QB', 'amount': '40'}}]
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    # Status codes to answer with, in order; 200 once the script runs out
+    script = []
+    requests_seen = 0
+    client_ports = set()
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        ScriptedHandler.requests_seen += 1
+        ScriptedHandler.client_ports.add(self.client_address[1])
+        if self.path.startswith('/slow'):
+            time.sleep(0.5)
+        status = ScriptedHandler.script.pop(0) if ScriptedHandler.script else 200
+        body = json.dumps(STUB_PICKS if status == 200 else {'error': status}).encode()
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestSleeperClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ScriptedHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ScriptedHandler.script = []
+        ScriptedHandler.requests_seen = 0
+        ScriptedHandler.client_ports = set()
+        self.delays = []
+        self.client = SleeperClient(read_timeout=0.2, retries=2, sleep=self.delays.append)
+
+    def test_retries_server_errors(self):
+        ScriptedHandler.script = [503, 502]
+        self.assertEqual(self.client.get_json(f"{self.base}/picks"), STUB_PICKS)
+        self.assertEqual(ScriptedHandler.requests_seen, 3)
+        self.assertEqual(len(self.delays), 2)
+        # Jittered delays stay within the exponential backoff ceiling
+        self.assertLessEqual(self.delays[0], 0.25)
+        self.assertLessEqual(self.delays[1], 0.5)
+
+    def test_rate_limit_honours_retry_after(self):
+        ScriptedHandler.script = [429]
+        self.assertEqual(self.client.get_json(f"{self.base}/picks"), STUB_PICKS)
+        self.assertEqual(self.delays, [1.0])
+
+    def test_gives_up_after_retry_budget(self):
+        ScriptedHandler.script = [500, 500, 500, 500]
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_json(f"{self.base}/picks")
+        self.assertEqual(ScriptedHandler.requests_seen, 3)
+
+    def test_client_errors_are_not_retried(self):
+        ScriptedHandler.script = [404]
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_json(f"{self.base}/picks")
+        self.assertEqual(ScriptedHandler.requests_seen, 1)
+
+    def test_read_timeout_bounds_slow_upstream(self):
+        client = SleeperClient(read_timeout=0.1, retries=0)
+        start = time.monotonic()
+        with self.assertRaises(requests.Timeout):
+            client.get_json(f"{self.base}/slow")
+        self.assertLess(time.monotonic() - start, 0.45)
+
+    def test_connections_are_reused(self):
+        for _ in range(3):
+            self.client.get_json(f"{self.base}/picks")
+        # Keep-alive: every request went over the same socket
+        self.assertEqual(len(ScriptedHandler.client_ports), 1)
+
+if __name__ == '__main__':
+    unittest.main()
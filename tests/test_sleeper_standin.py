@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import threading
+
+from werkzeug.serving import make_server as make_app_server
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.trial_backend as trial_backend
+from backend.load_test import LoadRecorder, run_load_test
+from backend.sleeper_standin import SleeperStandIn, make_server
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestSleeperStandIn(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.reference = trial_backend.reference_store.current
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.recorded = json.load(file)
+
+    def test_reveals_picks_over_time(self):
+        clock = FakeClock()
+        standin = SleeperStandIn(self.reference, pick_interval=5.0, initial_picks=2, num_picks=24, clock=clock)
+        self.assertEqual(len(standin.picks('live')), 2)
+        self.assertEqual(standin.draft('live')['status'], 'drafting')
+
+        clock.now = 26.0
+        picks = standin.picks('live')
+        self.assertEqual([pick['pick_no'] for pick in picks], list(range(1, 8)))
+        self.assertEqual(standin.draft('live')['last_picked'], 7)
+
+        clock.now = 1000.0
+        self.assertEqual(len(standin.picks('live')), 24)
+        draft = standin.draft('live')
+        self.assertEqual((draft['status'], draft['season']), ('complete', self.reference.year))
+
+    def test_drafts_are_stable_per_id(self):
+        standin = SleeperStandIn(self.reference, pick_interval=0, num_picks=24)
+        self.assertEqual(standin.picks('a'), standin.picks('a'))
+        self.assertNotEqual(standin.picks('a'), standin.picks('b'))
+        self.assertTrue(all(pick['draft_id'] == 'b' for pick in standin.picks('b')))
+
+    def test_serves_recorded_picks(self):
+        standin = SleeperStandIn(self.reference, pick_interval=0, recorded={'*': self.recorded})
+        picks = standin.picks('replay')
+        self.assertEqual(len(picks), len(self.recorded))
+        self.assertEqual(picks[0]['player_id'], self.recorded[0]['player_id'])
+        self.assertEqual(picks[0]['draft_id'], 'replay')
+
+    def test_recorder_percentiles(self):
+        recorder = LoadRecorder()
+        for ms in range(1, 101):
+            recorder.record('/picks', ms / 1000, ok=ms != 100)
+        stats = recorder.report(elapsed=10.0)['/picks']
+        self.assertEqual((stats['requests'], stats['errors']), (100, 1))
+        self.assertAlmostEqual(stats['p50_ms'], 50.5)
+        self.assertAlmostEqual(stats['throughput_rps'], 10.0)
+        self.assertLessEqual(stats['p95_ms'], stats['p99_ms'])
+
+    def test_load_test_against_standin(self):
+        standin = SleeperStandIn(self.reference, pick_interval=0.05, initial_picks=1, num_picks=48)
+        sleeper = make_server(standin, port=0)
+        app = make_app_server('127.0.0.1', 0, trial_backend.app, threaded=True)
+        servers = [sleeper, app]
+        for server in servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        base = f"http://127.0.0.1:{sleeper.server_port}/v1"
+        try:
+            with patch.object(trial_backend, 'SLEEPER_API_BASE', base), \
+                    patch.object(trial_backend, 'DRAFT_POLLER_ENABLED', False):
+                result = run_load_test(f"http://127.0.0.1:{app.server_port}", dashboards=3, drafts=2,
+                                       duration=1.0, interval=0.2, draft_prefix='standin')
+        finally:
+            for server in servers:
+                server.shutdown()
+                server.server_close()
+
+        endpoints = result['endpoints']
+        self.assertEqual(set(endpoints), {'/scatter_data', '/team_breakdown', '/picks', '/player_lookup', '/inflation',
+                                          '/reference'})
+        self.assertEqual(endpoints['/reference']['requests'], 3)
+        self.assertEqual(endpoints['/picks']['requests'], endpoints['/inflation']['requests'])
+        # The scatter plot and team breakdown poll on every tick, like the ticker and the inflation panel
+        self.assertGreater(endpoints['/scatter_data']['requests'], 3)
+        self.assertEqual(endpoints['/scatter_data']['requests'], endpoints['/team_breakdown']['requests'])
+        self.assertEqual(endpoints['/picks']['requests'], 2 * endpoints['/scatter_data']['requests'])
+        for stats in endpoints.values():
+            self.assertEqual(stats['errors'], 0)
+            self.assertGreater(stats['throughput_rps'], 0)
+            self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertGreater(standin.requests_served, 0)
+
+if __name__ == '__main__':
+    unittest.main()
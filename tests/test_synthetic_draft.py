@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+import json
+
+# Add the parent directory to sys.path so the backend module can be found
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.benchmark import compare, run_benchmarks
+from backend.reference_data import load_reference_snapshot
+from backend.synthetic_draft import generate_draft, sleeper_name
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TestSyntheticDraft(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.reference = load_reference_snapshot(os.path.join(os.path.dirname(TESTS_DIR), 'backend', '2024'))
+        with open(os.path.join(TESTS_DIR, 'picks_output.json'), 'r') as file:
+            cls.sample_pick = json.load(file)[0]
+
+    def test_matches_sleeper_schema(self):
+        picks = generate_draft(self.reference, 24)
+        self.assertEqual(set(picks[0]), set(self.sample_pick))
+        self.assertEqual(set(picks[0]['metadata']), set(self.sample_pick['metadata']))
+        self.assertEqual([pick['pick_no'] for pick in picks], list(range(1, 25)))
+        self.assertEqual(picks[12]['round'], 2)
+
+    def test_rosters_and_budgets(self):
+        picks = generate_draft(self.reference, 1000, teams=12, budget=200, seed=3)
+        self.assertEqual(len(picks), 1000)
+        for slot in range(1, 13):
+            team_picks = [pick for pick in picks if pick['draft_slot'] == slot]
+            self.assertLessEqual(len(team_picks), 84)
+            self.assertLessEqual(sum(int(pick['metadata']['amount']) for pick in team_picks), 200)
+            self.assertTrue(all(int(pick['metadata']['amount']) >= 1 for pick in team_picks))
+
+        with self.assertRaises(ValueError):
+            generate_draft(self.reference, 300, teams=1, budget=200)
+
+    def test_seeded_and_anomalous_names(self):
+        self.assertEqual(generate_draft(self.reference, 50, seed=1), generate_draft(self.reference, 50, seed=1))
+        self.assertEqual(sleeper_name('Patrick Mahomes II'), 'Patrick Mahomes')
+        self.assertEqual(sleeper_name('Marvin Harrison Jr.'), 'Marvin Harrison')
+
+        clean = generate_draft(self.reference, 200, anomaly_rate=0, seed=2)
+        respelled = generate_draft(self.reference, 200, anomaly_rate=1, seed=2)
+        changed = sum(a['metadata']['first_name'] + a['metadata']['last_name'] !=
+                      b['metadata']['first_name'] + b['metadata']['last_name'] for a, b in zip(clean, respelled))
+        self.assertGreater(changed, 100)
+
+    def test_benchmark_results_compare(self):
+        results = run_benchmarks(sizes=[20], repeat=1, names=['process_team_breakdown'])
+        self.assertEqual(list(results['results']), ['process_team_breakdown'])
+        timing = results['results']['process_team_breakdown']['20']
+        self.assertLessEqual(timing['min'], timing['median'])
+
+        slower = {'results': {'process_team_breakdown': {'20': dict(timing, median=timing['median'] * 2)}}}
+        rows, regressions = compare(slower, results, threshold=1.25)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual([(name, size) for name, size, _ in regressions], [('process_team_breakdown', '20')])
+
+if __name__ == '__main__':
+    unittest.main()